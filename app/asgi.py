@@ -0,0 +1,380 @@
+import asyncio
+import contextvars
+import functools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from quart import Quart, Response, g, jsonify, render_template, request
+
+from app.controllers.issue_record import TIMELINE_FIELDS, IssueRecord
+from app.controllers.overlay_controller import (
+    delete_overlay,
+    get_overlay,
+    put_overlay,
+)
+from app.controllers.timeline_controller import JIRA_CACHE_TTL, records_cache_key
+from app.controllers.timeline_delta import item_hashes, make_timeline_response
+from app.controllers.timeline_rollup import collapse_view, expand_group
+from app.controllers.timeline_service import (
+    TIMELINE_RETRY_AFTER,
+    VIEW_CACHE_TTL,
+    ViewUnavailable,
+    collapse_level,
+    degraded_view,
+    filter_view_by_date,
+    overlay_and_build,
+    request_deadline,
+    shared_cache,
+    status_segments,
+    store_view,
+    undated,
+    view_cache_key,
+    view_params,
+    wait_seconds,
+    workload_cache_key,
+    workload_from_records,
+    workload_params,
+)
+from app.services import jira_async, metrics
+from app.services.overlay_store import OverlayStore
+from app.services.reference_store import (
+    SAMPLE_PROJECTS,
+    get_cached_project_members,
+    get_cached_projects,
+)
+from app.services.shared_cache import SharedCache
+
+# ASGI 서빙 모드 (python -m app.serve 에서 WEB_MODE=asgi)
+#
+# - JIRA 조회는 httpx로 await -> 느린 JIRA 응답을 기다리는 동안 스레드를 점유하지 않음
+# - build_timeline_view / 날짜 필터 / 직렬화 같은 CPU 작업은 CPU_WORKERS 스레드 풀에서
+# - 짧은 SQLite 호출(캐시, 오버레이)은 asyncio.to_thread
+# - 같은 view를 동시에 만드는 요청은 하나의 빌드를 공유 (JIRA 중복 호출 방지)
+# - 지연 예산(TIMELINE_LATENCY_BUDGET_MS)을 넘기면 빌드는 계속 두고 stale / partial view로 응답
+#
+# view 조립 규칙은 app.controllers.timeline_service를 공유하므로 응답 형식은 app.web(WSGI)과 같다.
+
+CPU_WORKERS = int(os.getenv("ASGI_CPU_WORKERS", str(os.cpu_count() or 2)))
+
+T = TypeVar("T")
+
+app = Quart(__name__)
+
+_cpu_pool = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="asgi-cpu")
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+# 진행 중인 빌드가 지금까지 받은 레코드 (예산 초과 시 partial view용)
+_progress: Dict[str, List[IssueRecord]] = {}
+
+
+async def _run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # contextvars를 복사해 넘김 -> metrics.stage가 요청 단위 통계에 집계됨
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_cpu_pool, call)
+
+
+async def _single_flight(
+    key: str, factory: Callable[[], Awaitable[T]], timeout: Optional[float] = None
+) -> Optional[T]:
+    # timeout이 지나면 None (빌드는 취소하지 않고 계속 진행)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    # 한 클라이언트가 끊겨도 공유 중인 빌드는 취소되지 않도록
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        return None
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    return Response(
+        json.dumps(payload, ensure_ascii=False),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+def _error(message: str, status: int) -> Response:
+    return _json_response({"error": message}, status)
+
+
+def _unavailable(e: ViewUnavailable) -> Response:
+    resp = _json_response({"error": str(e), "retry_after": TIMELINE_RETRY_AFTER}, 503)
+    resp.headers["Retry-After"] = str(TIMELINE_RETRY_AFTER)
+    return resp
+
+
+@app.before_request
+async def _log_request_start() -> None:
+    g._t0 = time.time()
+    g._metrics_token = metrics.begin_request()
+    app.logger.info(
+        "REQ %s %s args=%s", request.method, request.path, dict(request.args)
+    )
+
+
+@app.after_request
+async def _log_request_end(response: Response) -> Response:
+    dur_ms = (time.time() - getattr(g, "_t0", time.time())) * 1000.0
+    stats = metrics.end_request(getattr(g, "_metrics_token", None))
+    rule = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.observe(
+        "http_request_duration_seconds",
+        dur_ms / 1000.0,
+        method=request.method,
+        path=rule,
+        status=response.status_code,
+    )
+    app.logger.info(
+        "RES %s %s status=%s dur=%.1fms %s",
+        request.method,
+        request.path,
+        response.status_code,
+        dur_ms,
+        metrics.format_request_stats(stats),
+    )
+    return response
+
+
+@app.after_serving
+async def _close_clients() -> None:
+    await jira_async.aclose()
+    _cpu_pool.shutdown(wait=False)
+
+
+async def _fetch_records(
+    jql: str,
+    cache: Optional[SharedCache],
+    progress: Optional[List[IssueRecord]] = None,
+    max_results: Optional[int] = 1000,
+) -> List[IssueRecord]:
+    # fetch_timeline_records와 같은 캐시 키 -> WSGI/ASGI 워커가 JIRA 캐시를 공유
+    key = records_cache_key(jql, 0, max_results)
+    if cache is not None:
+        rows = await asyncio.to_thread(cache.get, key)
+        if rows is not None:
+            return [IssueRecord.from_row(r) for r in rows]
+    records = [] if progress is None else progress
+    with metrics.stage("jira_search"):
+        async for issue in jira_async.iter_search_issues(
+            jql, fields=TIMELINE_FIELDS, max_results=max_results
+        ):
+            records.append(IssueRecord.from_issue(issue))
+    if cache is not None:
+        await asyncio.to_thread(
+            cache.set, key, [r.to_row() for r in records], JIRA_CACHE_TTL
+        )
+    return records
+
+
+async def _build_view(args, deadline: Optional[float] = None) -> Dict[str, Any]:
+    params = view_params(args)
+    if params is None:
+        return {"groups": [], "items": []}
+    cache = shared_cache()
+
+    if cache is not None:
+        generation = await asyncio.to_thread(lambda: OverlayStore().generation())
+        key = view_cache_key(params, generation)
+        view = await asyncio.to_thread(cache.get, key)
+    else:
+        key = view_cache_key(params, 0)
+        view = None
+        # 마지막 정상 view가 없으므로 예산은 캐시를 쓸 때만
+        deadline = None
+
+    if view is None:
+
+        async def _build() -> Dict[str, Any]:
+            progress = _progress[key] = []
+            try:
+                records = await _fetch_records(params["jql"], cache, progress)
+            finally:
+                _progress.pop(key, None)
+            built = await _run_cpu(overlay_and_build, records, params)
+            if cache is not None:
+                await asyncio.to_thread(store_view, cache, key, params, built)
+            return built
+
+        timeout = None if deadline is None else wait_seconds(deadline)
+        try:
+            view = await _single_flight(key, _build, timeout)
+        except Exception as e:
+            if cache is None:
+                raise
+            view = await _run_cpu(degraded_view, params, cache, [], e, deadline)
+        if view is None:
+            records = list(_progress.get(key, ()))
+            view = await _run_cpu(degraded_view, params, cache, records, None, deadline)
+
+    # 공유된 빌드 결과는 복사해서 사용 (요청마다 items / item_hashes를 바꿈)
+    return await _run_cpu(filter_view_by_date, dict(view), params)
+
+
+@app.get("/api/timeline")
+async def api_timeline():
+    try:
+        level = collapse_level(request.args)
+    except ValueError as e:
+        return _error(str(e), 400)
+    since = request.args.get("since")
+    try:
+        view = await _build_view(request.args, request_deadline(g._t0))
+        hashes = view.pop("item_hashes", {})
+        if level is not None:
+            with metrics.stage("rollup"):
+                view = await _run_cpu(collapse_view, view, level)
+        with metrics.stage("delta"):
+            payload = await _run_cpu(
+                make_timeline_response,
+                view,
+                hashes,
+                since=since,
+                store=shared_cache(),
+            )
+        if not since and payload["version"] in request.if_none_match:
+            resp = Response("", status=304)
+            resp.set_etag(payload["version"])
+            return resp
+        with metrics.stage("serialize"):
+            body = await _run_cpu(json.dumps, payload, ensure_ascii=False)
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return _error(str(e), 500)
+    resp = Response(body, mimetype="application/json")
+    if not since:
+        resp.set_etag(payload["version"])
+    return resp
+
+
+@app.get("/api/timeline/status")
+async def api_timeline_status():
+    # view는 비동기 JIRA 경로로 조립하고 changelog 구간만 CPU 풀에서 입힘
+    since = request.args.get("since")
+    try:
+        view = await _build_view(undated(request.args), request_deadline(g._t0))
+        view = await _run_cpu(status_segments, view, request.args)
+        with metrics.stage("delta"):
+            payload = await _run_cpu(
+                make_timeline_response,
+                view,
+                item_hashes(view["items"]),
+                since=since,
+                store=shared_cache(),
+            )
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return _error(str(e), 500)
+    resp = _json_response(payload)
+    if not since:
+        resp.set_etag(payload["version"])
+    return resp
+
+
+@app.get("/api/timeline/groups/<group_id>")
+async def api_timeline_group(group_id: str):
+    try:
+        view = await _build_view(request.args, request_deadline(g._t0))
+        view.pop("item_hashes", None)
+        with metrics.stage("rollup"):
+            payload = await _run_cpu(expand_group, view, group_id)
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return _error(str(e), 500)
+    if payload is None:
+        return _error(f"unknown group: {group_id}", 404)
+    return _json_response(payload)
+
+
+@app.get("/api/analytics/workload")
+async def api_workload():
+    # 일자별 활성 이슈 수 히트맵 (app.web과 같은 캐시 키 / 응답)
+    try:
+        params = workload_params(request.args)
+    except ValueError as e:
+        return _error(str(e), 400)
+    try:
+        cache = shared_cache()
+        key = None
+        if cache is not None:
+            generation = await asyncio.to_thread(lambda: OverlayStore().generation())
+            key = workload_cache_key(params, generation)
+            payload = await asyncio.to_thread(cache.get, key)
+            if payload is not None:
+                return _json_response(payload)
+        records = await _fetch_records(params["jql"], cache, max_results=None)
+        payload = await _run_cpu(workload_from_records, records, params)
+        if cache is not None:
+            await asyncio.to_thread(cache.set, key, payload, VIEW_CACHE_TTL)
+    except Exception as e:
+        return _error(str(e), 500)
+    return _json_response(payload)
+
+
+@app.get("/api/projects")
+async def api_projects():
+    try:
+        projects = await asyncio.to_thread(get_cached_projects)
+    except Exception as e:
+        return _error(str(e), 500)
+    return jsonify({"projects": projects or SAMPLE_PROJECTS})
+
+
+@app.get("/api/projects/<project_key>/members")
+async def api_project_members(project_key: str):
+    try:
+        members = await asyncio.to_thread(get_cached_project_members, project_key)
+    except Exception as e:
+        return _error(str(e), 500)
+    if members is None:
+        return _error(f"unknown project: {project_key}", 404)
+    return jsonify({"members": members})
+
+
+@app.get("/api/overlays/<issue_key>")
+async def api_get_overlay(issue_key: str):
+    try:
+        return jsonify(await asyncio.to_thread(get_overlay, issue_key, request.args))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+
+@app.put("/api/overlays/<issue_key>")
+async def api_put_overlay(issue_key: str):
+    body = await request.get_json(silent=True) or {}
+    try:
+        return jsonify(await asyncio.to_thread(put_overlay, issue_key, body))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+
+@app.delete("/api/overlays/<issue_key>")
+async def api_delete_overlay(issue_key: str):
+    try:
+        return jsonify(await asyncio.to_thread(delete_overlay, issue_key, request.args))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@app.get("/")
+async def index():
+    return await render_template("index.html")
+
+
+@app.get("/api/docs")
+async def api_docs():
+    return await render_template("api_docs.html")
@@ -0,0 +1,272 @@
+import os
+import threading
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.controllers.issue_record import IssueRecord
+from app.services import metrics
+
+# 이슈 링크(blocks / is blocked by) 기반 선후행 그래프와 크리티컬 패스
+#
+# - 이슈는 조회 순서대로 번호를 매기고 간선은 출발 번호 기준 counting sort로 CSR 배열을 만듦
+#   (비교 정렬 없이 O(V + E), 같은 데이터면 워커와 관계없이 같은 순서)
+# - 프로젝트별로 링크가 있는 이슈만 노드로, 위상 순서대로 0..n-1 정수 인덱스를 매기고
+#   간선은 CSR 배열(offsets / targets)로 보관 -> 전진/후진 패스가 인덱스 순회 한 번씩
+# - Kahn 위상 정렬과 CPM(ES/EF, LS/LF, 여유) 모두 O(V + E)
+# - 위상 순서는 프로젝트별로 프로세스 안에 캐시하고 간선 집합과 비교해 바뀐 간선만 반영
+#   (같으면 그대로, 새 간선이 기존 순서를 깨지 않으면 그대로 쓰고 아니면 다시 정렬)
+#   링크는 JIRA 이슈 데이터에만 달려 있으므로 간선 집합 자체가 버전. 오버레이 날짜는 일정에만 쓰임
+# - 일정은 오버레이 날짜에 따라 달라지므로 구조와 별개로 매번 계산
+#
+# 프로젝트를 넘는 링크는 edges에만 표시하고 일정 계산에는 넣지 않는다.
+
+DEPENDENCY_GRAPH_CACHE_SIZE = int(os.getenv("DEPENDENCY_GRAPH_CACHE_SIZE", "256"))
+
+# 날짜가 없는 노드(숨김 등)는 기간 0으로 선후행만 이어 줌
+_NO_DATE = 0
+
+# 프로젝트 -> (간선 집합, 위상 순서). 순환이 없는 그래프만 보관, 오래 안 쓴 프로젝트부터 제거
+_orders_lock = threading.Lock()
+_orders: Dict[str, Tuple[FrozenSet[Tuple[str, str]], List[str]]] = {}
+
+
+class ProjectGraph:
+    """위상 순서로 번호를 매긴 CSR 그래프. keys[:acyclic]이 위상 순서, 나머지는 순환에 걸린 노드."""
+
+    __slots__ = ("keys", "index", "offsets", "targets", "acyclic")
+
+    def __init__(self, out: Dict[str, List[str]], order: List[str]) -> None:
+        placed = set(order)
+        self.keys = order + [k for k in out if k not in placed]
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        self.acyclic = len(order)
+        self.offsets = [0] * (len(self.keys) + 1)
+        self.targets: List[int] = []
+        for i, k in enumerate(self.keys):
+            self.targets.extend(self.index[v] for v in out[k])
+            self.offsets[i + 1] = len(self.targets)
+
+    def successors(self, i: int) -> List[int]:
+        return self.targets[self.offsets[i] : self.offsets[i + 1]]
+
+
+def _edge_csr(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    # 출발 번호 기준 counting sort -> offsets[u]:offsets[u + 1]에 u의 후행
+    # (안정 배치라 같은 출발 안에서는 받은 순서 그대로)
+    edges = list(edges)
+    offsets = [0] * (n + 1)
+    for u, _ in edges:
+        offsets[u + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    fill = offsets[:-1]
+    targets = [0] * len(edges)
+    for u, v in edges:
+        targets[fill[u]] = v
+        fill[u] += 1
+    return offsets, targets
+
+
+def _topological_order(out: Dict[str, List[str]]) -> List[str]:
+    # Kahn: 순환에 걸린 노드(와 그 후행)는 결과에 빠짐
+    indegree = dict.fromkeys(out, 0)
+    for succ in out.values():
+        for v in succ:
+            indegree[v] += 1
+    order = [k for k, d in indegree.items() if d == 0]
+    for u in order:
+        for v in out[u]:
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                order.append(v)
+    return order
+
+
+def _patched_order(
+    order: List[str], out: Dict[str, List[str]], added: Iterable[Tuple[str, str]]
+) -> Optional[List[str]]:
+    # 간선 삭제는 위상 순서를 깨지 않음 -> 빠진 노드를 지우고 새 노드는 뒤에 붙인 뒤
+    # 새로 생긴 간선만 확인. 하나라도 거꾸로면 None (다시 정렬)
+    patched = [k for k in order if k in out]
+    placed = set(patched)
+    patched.extend(k for k in out if k not in placed)
+    pos = {k: i for i, k in enumerate(patched)}
+    for u, v in added:
+        if pos[u] > pos[v]:
+            return None
+    return patched
+
+
+def _project_order(project_key: str, out: Dict[str, List[str]]) -> List[str]:
+    edges = frozenset((u, v) for u, succ in out.items() for v in succ)
+    with _orders_lock:
+        cached = _orders.pop(project_key, None)
+    order: Optional[List[str]] = None
+    result = "rebuilt"
+    if cached is not None:
+        old_edges, old_order = cached
+        if old_edges == edges:
+            order, result = old_order, "hit"
+        else:
+            order = _patched_order(old_order, out, edges - old_edges)
+            if order is not None:
+                result = "patched"
+    if order is None:
+        order = _topological_order(out)
+    metrics.inc("dependency_graph_builds_total", result=result)
+    if len(order) == len(out):
+        with _orders_lock:
+            _orders[project_key] = (edges, order)
+            while len(_orders) > DEPENDENCY_GRAPH_CACHE_SIZE:
+                del _orders[next(iter(_orders))]
+    return order
+
+
+@lru_cache(maxsize=4096)
+def _ordinal(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def schedule(
+    graph: ProjectGraph, spans: List[Optional[Tuple[int, int]]]
+) -> Tuple[List[int], List[int], List[int]]:
+    # spans[i] = (시작, 종료) 서수일 -> (ES, EF, 여유), 순환 노드는 계산하지 않음
+    n = graph.acyclic
+    offsets, targets = graph.offsets, graph.targets
+    dur = [0] * n
+    es = [_NO_DATE] * n
+    for i in range(n):
+        if spans[i] is not None:
+            es[i] = spans[i][0]
+            dur[i] = spans[i][1] - spans[i][0] + 1
+
+    # 전진 패스: 선행이 끝난 다음 날부터 시작할 수 있음
+    ef = [0] * n
+    for u in range(n):
+        ef[u] = es[u] + dur[u] - 1
+        for j in range(offsets[u], offsets[u + 1]):
+            v = targets[j]
+            if v < n and es[v] <= ef[u]:
+                es[v] = ef[u] + 1
+
+    finish = max((ef[i] for i in range(n) if spans[i] is not None), default=_NO_DATE)
+    # 후진 패스: 후행의 가장 늦은 시작 전날까지 끝나면 됨
+    lf = [finish] * n
+    for u in range(n - 1, -1, -1):
+        for j in range(offsets[u], offsets[u + 1]):
+            v = targets[j]
+            if v < n:
+                # LS(v) - 1 = LF(v) - dur(v)
+                latest = lf[v] - dur[v]
+                if latest < lf[u]:
+                    lf[u] = latest
+    slack = [lf[i] - ef[i] for i in range(n)]
+    return es, ef, slack
+
+
+def annotate_dependencies(
+    records: Iterable[IssueRecord],
+    items: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    # items에 blocks / blocked_by / slack / critical / delay를 채우고
+    # view에 붙일 {"edges", "critical_path"}를 반환
+    # 이슈 번호는 조회 순서, 링크도 조회 순서대로 모음
+    keys: List[str] = []
+    projects: List[str] = []
+    number: Dict[str, int] = {}
+    pairs: List[Tuple[str, str]] = []
+    for rec in records:
+        if number.setdefault(rec.key, len(keys)) == len(keys):
+            keys.append(rec.key)
+            projects.append(rec.project_key)
+        for v in rec.blocks:
+            pairs.append((rec.key, v))
+        for u in rec.blocked_by:
+            pairs.append((u, rec.key))
+
+    # 양쪽 이슈에 같은 링크가 실리므로 처음 나온 순서를 지키며 중복 제거
+    # (조회 범위 밖 이슈와의 링크는 제외)
+    offsets, targets = _edge_csr(
+        len(keys),
+        dict.fromkeys(
+            (number[u], number[v]) for u, v in pairs if u in number and v in number
+        ),
+    )
+    per_project: Dict[str, Dict[str, List[str]]] = {}
+    for u, k in enumerate(keys):
+        lo, hi = offsets[u], offsets[u + 1]
+        if lo == hi:
+            continue
+        project_key = projects[u]
+        for t in targets[lo:hi]:
+            if projects[t] != project_key:
+                continue
+            v = keys[t]
+            out = per_project.setdefault(project_key, {})
+            out.setdefault(k, []).append(v)
+            out.setdefault(v, [])
+
+    by_id = {it["id"]: it for it in items}
+    critical_path: Dict[str, List[str]] = {}
+    tight: Set[Tuple[str, str]] = set()
+    for project_key in sorted(per_project):
+        out = per_project[project_key]
+        graph = ProjectGraph(out, _project_order(project_key, out))
+        spans: List[Optional[Tuple[int, int]]] = []
+        for k in graph.keys:
+            it = by_id.get(k)
+            s = _ordinal(it.get("start")) if it else None
+            e = _ordinal(it.get("end")) if it else None
+            s = s or e
+            e = e or s
+            spans.append((min(s, e), max(s, e)) if s else None)
+        es, ef, slack = schedule(graph, spans)
+
+        path: List[str] = []
+        for i, k in enumerate(graph.keys):
+            it = by_id.get(k)
+            if it is None or spans[i] is None:
+                continue
+            if i >= graph.acyclic:
+                # 순환 링크 -> 일정 계산 불가
+                it["slack"] = None
+                it["critical"] = False
+                continue
+            it["slack"] = slack[i]
+            it["critical"] = slack[i] == 0
+            it["delay"] = es[i] - spans[i][0]
+            if slack[i] == 0:
+                path.append(k)
+                for v in graph.successors(i):
+                    if v < graph.acyclic and slack[v] == 0 and es[v] == ef[i] + 1:
+                        tight.add((k, graph.keys[v]))
+        if path:
+            # 캐시된 위상 순서는 워커마다 다를 수 있으므로 (시작일, 조회 순서)로 고정
+            path.sort(key=lambda k: (es[graph.index[k]], number[k]))
+            critical_path[project_key] = path
+
+    edges: List[Dict[str, Any]] = []
+    blocks: Dict[str, List[str]] = {}
+    blocked_by: Dict[str, List[str]] = {}
+    for i, u in enumerate(keys):
+        lo, hi = offsets[i], offsets[i + 1]
+        if lo == hi or u not in by_id:
+            continue
+        for t in targets[lo:hi]:
+            v = keys[t]
+            if v not in by_id:
+                continue
+            blocks.setdefault(u, []).append(v)
+            blocked_by.setdefault(v, []).append(u)
+            edges.append({"from": u, "to": v, "critical": (u, v) in tight})
+    for k, succ in blocks.items():
+        by_id[k]["blocks"] = succ
+    for k, pred in blocked_by.items():
+        by_id[k]["blocked_by"] = pred
+    return {"edges": edges, "critical_path": critical_path}
@@ -0,0 +1,157 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+# 에픽 링크 필드
+EPIC_LINK_FIELD = "customfield_10014"
+# 선후행 관계로 취급할 이슈 링크 타입 이름 (outward = "blocks" 방향)
+DEPENDENCY_LINK_TYPES = {
+    t.strip().casefold()
+    for t in os.getenv("DEPENDENCY_LINK_TYPES", "Blocks").split(",")
+    if t.strip()
+}
+
+# 타임라인에 필요한 필드만 JIRA에 요청
+TIMELINE_FIELDS: List[str] = [
+    "summary",
+    "project",
+    "issuetype",
+    "status",
+    "priority",
+    "created",
+    "updated",
+    "duedate",
+    "assignee",
+    EPIC_LINK_FIELD,
+    "issuelinks",
+]
+
+
+def _dependency_links(links: Any, key: str) -> Tuple[List[str], List[str]]:
+    # issuelinks -> (이 이슈가 막는 키, 이 이슈를 막는 키)
+    blocks: List[str] = []
+    blocked_by: List[str] = []
+    for link in links or []:
+        t = link.get("type") or {}
+        if (t.get("name") or "").casefold() not in DEPENDENCY_LINK_TYPES:
+            continue
+        outward = (link.get("outwardIssue") or {}).get("key")
+        inward = (link.get("inwardIssue") or {}).get("key")
+        if outward and outward != key:
+            blocks.append(outward)
+        if inward and inward != key:
+            blocked_by.append(inward)
+    return blocks, blocked_by
+
+
+class IssueRecord:
+    """타임라인용 최소 이슈 레코드. 수집 시점에 한 번 추출하고 원본 JSON은 버린다."""
+
+    __slots__ = (
+        "key",
+        "url",
+        "project_key",
+        "issue_type",
+        "summary",
+        "status",
+        "priority",
+        "created",
+        "updated",
+        "duedate",
+        "assignee",
+        "epic_key",
+        "epic_summary",
+        "blocks",
+        "blocked_by",
+        "overlay",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        url: Optional[str] = None,
+        project_key: str = "UNKNOWN",
+        issue_type: str = "Task",
+        summary: str = "",
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+        duedate: Optional[str] = None,
+        assignee: Optional[str] = None,
+        epic_key: Optional[str] = None,
+        epic_summary: Optional[str] = None,
+        blocks: Optional[List[str]] = None,
+        blocked_by: Optional[List[str]] = None,
+        overlay: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.key = key
+        self.url = url
+        self.project_key = project_key
+        self.issue_type = issue_type
+        self.summary = summary
+        self.status = status
+        self.priority = priority
+        self.created = created
+        self.updated = updated
+        self.duedate = duedate
+        self.assignee = assignee
+        self.epic_key = epic_key
+        self.epic_summary = epic_summary
+        self.blocks = blocks or []
+        self.blocked_by = blocked_by or []
+        self.overlay = overlay if overlay is not None else {}
+
+    @classmethod
+    def from_issue(cls, issue: Dict[str, Any]) -> "IssueRecord":
+        f = issue.get("fields") or {}
+        epic_key = None
+        epic_summary = None
+        epic_link = f.get(EPIC_LINK_FIELD)
+        if epic_link and isinstance(epic_link, dict):
+            epic_key = epic_link.get("key")
+            epic_summary = epic_link.get("summary")
+        assignee = f.get("assignee") or {}
+        key = issue.get("key", "")
+        blocks, blocked_by = _dependency_links(f.get("issuelinks"), key)
+        return cls(
+            key,
+            url=issue.get("self"),
+            project_key=(f.get("project") or {}).get("key", "UNKNOWN"),
+            issue_type=(f.get("issuetype") or {}).get("name", "Task"),
+            summary=f.get("summary", ""),
+            status=(f.get("status") or {}).get("name"),
+            priority=(f.get("priority") or {}).get("name"),
+            created=f.get("created"),
+            updated=f.get("updated"),
+            duedate=f.get("duedate"),
+            assignee=assignee.get("displayName") or assignee.get("accountId"),
+            epic_key=epic_key,
+            epic_summary=epic_summary,
+            blocks=blocks,
+            blocked_by=blocked_by,
+            overlay=issue.get("overlay"),
+        )
+
+    def with_overlay(self, overlay: Dict[str, Any]) -> "IssueRecord":
+        # 레코드는 여러 view에서 공유될 수 있으므로 복사본에 오버레이 적용
+        rec = IssueRecord.__new__(IssueRecord)
+        for name in self.__slots__:
+            setattr(rec, name, getattr(self, name))
+        rec.overlay = overlay
+        return rec
+
+    def to_row(self) -> Tuple[Any, ...]:
+        # 캐시 저장용 (오버레이 제외)
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> "IssueRecord":
+        rec = cls.__new__(cls)
+        for name, value in zip(cls.__slots__[:-1], row):
+            setattr(rec, name, value)
+        rec.overlay = {}
+        return rec
+
+    def __repr__(self) -> str:
+        return f"IssueRecord({self.key!r}, type={self.issue_type!r})"
@@ -0,0 +1,44 @@
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.overlay_store import OverlayStore, set_overlay
+
+# /api/overlays/<issue_key> 조회 / 병합 저장 / 삭제 (WSGI / ASGI 공용)
+# 잘못된 요청은 ValueError -> 라우트에서 400
+
+
+def overlay_target(params) -> Tuple[str, Optional[str]]:
+    scope = params.get("scope") or "team"
+    if scope not in ("team", "user"):
+        raise ValueError("scope must be 'team' or 'user'")
+    owner = params.get("owner") or None
+    if scope == "user" and not owner:
+        raise ValueError("owner is required for user scope")
+    return scope, owner
+
+
+def get_overlay(issue_key: str, params) -> Dict[str, Any]:
+    scope, owner = overlay_target(params)
+    overlay = OverlayStore().get_overlay(issue_key=issue_key, scope=scope, owner=owner)
+    return {"issue_key": issue_key, "scope": scope, "owner": owner, "overlay": overlay}
+
+
+def put_overlay(issue_key: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    # body: {"overlay": {...}, "scope", "owner", "project_key"} - 기존 값에 병합
+    scope, owner = overlay_target(body)
+    payload = body.get("overlay")
+    if not isinstance(payload, dict) or not payload:
+        raise ValueError("overlay must be a non-empty object")
+    set_overlay(
+        issue_key=issue_key,
+        payload=payload,
+        project_key=body.get("project_key") or issue_key.split("-", 1)[0],
+        scope=scope,
+        owner=owner,
+    )
+    return get_overlay(issue_key, {"scope": scope, "owner": owner})
+
+
+def delete_overlay(issue_key: str, params) -> Dict[str, Any]:
+    scope, owner = overlay_target(params)
+    OverlayStore().delete_overlay(issue_key=issue_key, scope=scope, owner=owner)
+    return {"issue_key": issue_key, "scope": scope, "owner": owner, "deleted": True}
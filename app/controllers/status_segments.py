@@ -0,0 +1,113 @@
+import hashlib
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from app.services.changelog_store import parse_timestamp
+
+# 로컬 changelog로 계산한 상태별 체류 구간 -> 타임라인 아이템
+#
+# 이슈 하나가 상태 수만큼의 막대가 된다 (id: "<issue_key>#<순번>").
+# 아직 changelog가 동기화되지 않은 이슈는 기존 일정 막대를 그대로 둔다.
+
+# 자주 쓰는 상태 색상, 나머지는 이름 해시로 팔레트에서 고정 배정
+STATUS_COLORS: Dict[str, str] = {
+    "to do": "#94a3b8",
+    "open": "#94a3b8",
+    "backlog": "#cbd5e1",
+    "in progress": "#3b82f6",
+    "in review": "#f59e0b",
+    "qa": "#8b5cf6",
+    "done": "#10b981",
+    "closed": "#10b981",
+}
+_PALETTE = ["#06b6d4", "#ec4899", "#84cc16", "#f97316", "#6366f1", "#14b8a6"]
+
+SEGMENT_ID_SEP = "#"
+
+
+def status_color(status: Optional[str]) -> str:
+    name = (status or "").casefold()
+    if name in STATUS_COLORS:
+        return STATUS_COLORS[name]
+    digest = hashlib.sha1(name.encode("utf-8")).digest()
+    return _PALETTE[digest[0] % len(_PALETTE)]
+
+
+def compute_segments(
+    history: Dict[str, Any], now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    # created -> 첫 전환 -> ... -> 현재. 마지막 구간은 진행 중(current=True)
+    now = time.time() if now is None else now
+    # 진행 중 구간은 오늘 0시까지로 계산 -> 아이템 해시(버전)가 하루 안에서는 바뀌지 않음
+    today = datetime.combine(date.fromtimestamp(now), datetime.min.time())
+    transitions = history.get("transitions") or []
+    created = history.get("created")
+    created_ts = parse_timestamp(created)
+    if transitions:
+        status = transitions[0][2] or history.get("status")
+    else:
+        status = history.get("status")
+
+    # (시작 시각 문자열, 시작 epoch, 상태)
+    marks = []
+    if created_ts is not None:
+        marks.append((created, created_ts, status))
+    for changed_at, ts, _from, to in transitions:
+        # 같은 상태로의 전환(워크플로 자기 전환)은 구간을 나누지 않음
+        if marks and marks[-1][2] == to:
+            continue
+        marks.append((changed_at, ts, to))
+
+    segments: List[Dict[str, Any]] = []
+    for i, (at, ts, st) in enumerate(marks):
+        last = i + 1 == len(marks)
+        if last:
+            end_at, end_ts = today.date().isoformat(), today.timestamp()
+        else:
+            end_at, end_ts = marks[i + 1][:2]
+        segments.append(
+            {
+                "status": st,
+                "start": at[:10],
+                "end": end_at[:10],
+                "days": round(max(end_ts - ts, 0) / 86400.0, 1),
+                "current": last,
+            }
+        )
+    return segments
+
+
+def status_segment_view(
+    view: Dict[str, Any],
+    histories: Dict[str, Dict[str, Any]],
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    items: List[Dict[str, Any]] = []
+    for it in view.get("items", []):
+        history = histories.get(it["id"])
+        segments = compute_segments(history, now) if history else []
+        if not segments:
+            items.append(it)
+            continue
+        for i, seg in enumerate(segments):
+            items.append(
+                {
+                    "id": f"{it['id']}{SEGMENT_ID_SEP}{i}",
+                    "issue_key": it["id"],
+                    "group": it["group"],
+                    "content": seg["status"] or "",
+                    "title": f"{it.get('title') or it['id']} | {seg['status']} {seg['days']}일",
+                    "start": seg["start"],
+                    "end": seg["end"],
+                    "color": status_color(seg["status"]),
+                    "status": seg["status"],
+                    "days": seg["days"],
+                    "current": seg["current"],
+                    "issue_type": it.get("issue_type"),
+                    "url": it.get("url"),
+                }
+            )
+    out = {k: v for k, v in view.items() if k not in ("edges", "critical_path")}
+    out["items"] = items
+    return out
@@ -1,8 +1,32 @@
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
-from app.services.jira_client import search_issues
+from app.controllers.dependency_graph import annotate_dependencies
+from app.controllers.issue_record import TIMELINE_FIELDS, IssueRecord
+from app.services import metrics
+from app.services.jira_client import iter_search_issues, search_issues
 from app.services.overlay_store import OverlayStore
+from app.services.shared_cache import SharedCache
+
+JIRA_CACHE_TTL = int(os.getenv("JIRA_CACHE_TTL", "120"))
+# 스트리밍 경로에서 오버레이를 한 번에 조회할 이슈 수
+OVERLAY_BATCH_SIZE = int(os.getenv("OVERLAY_BATCH_SIZE", "500"))
+
+# 한국어 이슈 타입을 영어로 매핑
+ISSUE_TYPE_MAPPING: Dict[str, str] = {
+    "서버": "Server",
+    "버그": "Bug",
+    "디자인": "Design",
+    "기획": "Planning",
+    "하위업무": "Task",
+    "스토리": "Story",
+    "에픽": "Epic",
+    "QA": "QA",
+    "클라": "Client",
+}
 
 
 def _parse_iso_date(s: Optional[str]) -> Optional[datetime]:
@@ -36,22 +60,51 @@ def _parse_iso_date(s: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def _derive_dates(issue: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
-    f = issue.get("fields", {})
-    ov = issue.get("overlay", {})
+def _derive_record_dates(rec: IssueRecord) -> Tuple[Optional[str], Optional[str]]:
+    ov = rec.overlay
     start = ov.get("startDate")
     end = ov.get("dueDate") or ov.get("endDate")
     if not start:
-        created = f.get("created")
-        dt = _parse_iso_date(created)
+        dt = _parse_iso_date(rec.created)
         if dt:
             start = dt.date().isoformat()
     if not end:
-        due = f.get("duedate")
-        end = due or start
+        end = rec.duedate or start
     return start, end
 
 
+def _derive_dates(issue: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    return _derive_record_dates(IssueRecord.from_issue(issue))
+
+
+def _iter_records(issues: Iterable[Any]) -> Iterator[IssueRecord]:
+    for issue in issues:
+        if isinstance(issue, IssueRecord):
+            yield issue
+        else:
+            yield IssueRecord.from_issue(issue)
+
+
+def _search_cache_key(
+    jql: str,
+    fields: Optional[List[str]],
+    start_at: int,
+    max_results: int,
+    prefix: str = "jira_search",
+) -> str:
+    raw = json.dumps([jql, fields, start_at, max_results], ensure_ascii=False)
+    return f"{prefix}:" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def records_cache_key(
+    jql: str, start_at: int = 0, max_results: Optional[int] = 50
+) -> str:
+    # 타임라인 레코드 캐시 키 (WSGI / ASGI 워커가 같은 JIRA 조회 결과를 공유)
+    return _search_cache_key(
+        jql, TIMELINE_FIELDS, start_at, max_results, prefix="jira_records"
+    )
+
+
 def search_issues_with_overlays(
     jql: str,
     *,
@@ -59,17 +112,175 @@ def search_issues_with_overlays(
     fields: Optional[List[str]] = None,
     start_at: int = 0,
     max_results: int = 50,
+    cache: Optional[SharedCache] = None,
+) -> Dict[str, Any]:
+    with metrics.stage("jira_search"):
+        if cache is not None:
+            # JIRA 원본 결과만 캐시하고 오버레이는 항상 최신으로 병합
+            result = cache.get_or_set(
+                _search_cache_key(jql, fields, start_at, max_results),
+                lambda: search_issues(
+                    jql, fields=fields, start_at=start_at, max_results=max_results
+                ),
+                ttl=JIRA_CACHE_TTL,
+            )
+        else:
+            result = search_issues(
+                jql, fields=fields, start_at=start_at, max_results=max_results
+            )
+    return apply_overlays(result, user_owner=user_owner)
+
+
+def iter_timeline_records(
+    jql: str,
+    *,
+    start_at: int = 0,
+    max_results: Optional[int] = 50,
+) -> Iterator[IssueRecord]:
+    # 응답 스트림에서 이슈를 하나씩 디코딩해 바로 IssueRecord로 변환 (페이지 단위 r.json() 없음)
+    for issue in iter_search_issues(
+        jql, fields=TIMELINE_FIELDS, start_at=start_at, max_results=max_results
+    ):
+        yield IssueRecord.from_issue(issue)
+
+
+def fetch_timeline_records(
+    jql: str,
+    *,
+    start_at: int = 0,
+    max_results: Optional[int] = 50,
+    cache: Optional[SharedCache] = None,
+    progress: Optional[List[IssueRecord]] = None,
+) -> List[IssueRecord]:
+    # 타임라인 필드만 조회하고 수집 즉시 IssueRecord로 변환 (원본 JSON은 유지하지 않음)
+    # progress: 받는 대로 레코드를 쌓을 리스트 (다른 스레드가 중간 결과를 읽는 용도)
+    def _fetch() -> List[IssueRecord]:
+        records = iter_timeline_records(jql, start_at=start_at, max_results=max_results)
+        if progress is None:
+            return list(records)
+        for rec in records:
+            progress.append(rec)
+        return progress
+
+    with metrics.stage("jira_search"):
+        if cache is None:
+            return _fetch()
+        key = records_cache_key(jql, start_at, max_results)
+        rows = cache.get(key)
+        if rows is None:
+            records = _fetch()
+            cache.set(key, [r.to_row() for r in records], ttl=JIRA_CACHE_TTL)
+            return records
+        return [IssueRecord.from_row(r) for r in rows]
+
+
+def search_timeline_records(
+    jql: str,
+    *,
+    user_owner: Optional[str] = None,
+    start_at: int = 0,
+    max_results: Optional[int] = 50,
+    cache: Optional[SharedCache] = None,
+    progress: Optional[List[IssueRecord]] = None,
 ) -> Dict[str, Any]:
-    result = search_issues(
-        jql, fields=fields, start_at=start_at, max_results=max_results
+    records = fetch_timeline_records(
+        jql,
+        start_at=start_at,
+        max_results=max_results,
+        cache=cache,
+        progress=progress,
     )
-    issue_keys = [i.get("key") for i in result.get("issues", []) if i.get("key")]
-    store = OverlayStore()
-    overlays = store.get_overlays_merged(issue_keys=issue_keys, user_owner=user_owner)
-    issues = []
+    return apply_overlays({"issues": records}, user_owner=user_owner, drop_hidden=True)
+
+
+def iter_records_with_overlays(
+    records: Iterable[IssueRecord],
+    *,
+    user_owner: Optional[str] = None,
+    store: Optional[OverlayStore] = None,
+    batch_size: int = OVERLAY_BATCH_SIZE,
+) -> Iterator[IssueRecord]:
+    # 전체 키 목록을 모으지 않고 batch_size 단위로 오버레이를 조회해 병합
+    store = store or OverlayStore()
+    batch: List[IssueRecord] = []
+
+    def _flush() -> Iterator[IssueRecord]:
+        with metrics.stage("overlay_fetch"):
+            keys = [r.key for r in batch if r.key]
+            hidden = store.hidden_issue_keys(issue_keys=keys, user_owner=user_owner)
+            overlays = store.get_overlays_merged(
+                issue_keys=[k for k in keys if k not in hidden], user_owner=user_owner
+            )
+        for rec in batch:
+            if rec.key in hidden:
+                continue
+            ov = overlays.get(rec.key)
+            yield rec.with_overlay(ov) if ov is not None else rec
+        batch.clear()
+
+    for rec in records:
+        batch.append(rec)
+        if len(batch) >= batch_size:
+            yield from _flush()
+    if batch:
+        yield from _flush()
+
+
+def stream_timeline_records(
+    jql: str,
+    *,
+    user_owner: Optional[str] = None,
+    start_at: int = 0,
+    max_results: Optional[int] = 50,
+) -> Dict[str, Any]:
+    # search_timeline_records의 스트리밍 버전: issues가 제너레이터이므로 한 번만 순회 가능
+    # (build_timeline_view에 바로 넘기는 용도)
+    records = iter_timeline_records(jql, start_at=start_at, max_results=max_results)
+    return {
+        "issues": iter_records_with_overlays(records, user_owner=user_owner),
+    }
+
+
+def apply_overlays(
+    result: Dict[str, Any],
+    *,
+    user_owner: Optional[str] = None,
+    store: Optional[OverlayStore] = None,
+    drop_hidden: bool = False,
+) -> Dict[str, Any]:
+    # drop_hidden: 숨김 이슈를 결과에서 뺌 (view 조립용)
+    # 숨김 여부는 인덱스만으로 판별하고 그 이슈들의 payload는 읽지 않음
+    issue_keys = [
+        k
+        for k in (
+            i.key if isinstance(i, IssueRecord) else i.get("key")
+            for i in result.get("issues", [])
+        )
+        if k
+    ]
+    with metrics.stage("overlay_fetch"):
+        store = store or OverlayStore()
+        hidden: Set[str] = set()
+        if drop_hidden and issue_keys:
+            hidden = store.hidden_issue_keys(
+                issue_keys=issue_keys, user_owner=user_owner
+            )
+            issue_keys = [k for k in issue_keys if k not in hidden]
+        overlays = store.get_overlays_merged(
+            issue_keys=issue_keys, user_owner=user_owner
+        )
+    issues: List[Any] = []
     for issue in result.get("issues", []):
+        if isinstance(issue, IssueRecord):
+            if issue.key in hidden:
+                continue
+            ov = overlays.get(issue.key)
+            issues.append(issue.with_overlay(ov) if ov is not None else issue)
+            continue
         i = dict(issue)
         key = i.get("key")
+        if key in hidden:
+            continue
         if key and key in overlays:
             i["overlay"] = overlays[key]
         issues.append(i)
@@ -78,8 +289,43 @@ def search_issues_with_overlays(
     return out
 
 
+def iter_items_by_date(
+    items: Iterable[Dict[str, Any]],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    # 기간이 [from_date, to_date]와 겹치는 아이템만 남김
+    fd = _parse_iso_date(from_date) if from_date else None
+    td = _parse_iso_date(to_date) if to_date else None
+    if not fd and not td:
+        yield from items
+        return
+    for it in items:
+        s = _parse_iso_date(it.get("start"))
+        e = _parse_iso_date(it.get("end")) or s
+        if not s and not e:
+            continue
+        if fd and e and e.date() < fd.date():
+            continue
+        if td and s and s.date() > td.date():
+            continue
+        yield it
+
+
+def filter_items_by_date(
+    items: List[Dict[str, Any]],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    if not from_date and not to_date:
+        return items
+    return list(iter_items_by_date(items, from_date, to_date))
+
+
 def build_timeline_view(
-    issues_result: Dict[str, Any], *, group_by: str = "project"
+    issues_result: Dict[str, Any],
+    *,
+    group_by: str = "project",
 ) -> Dict[str, Any]:
     issues = issues_result.get("issues", []) if issues_result else []
     groups: Dict[str, Dict[str, Any]] = {}
@@ -88,54 +334,32 @@ def build_timeline_view(
     # 프로젝트별로 이슈들을 분류
     project_issues: Dict[str, List[Dict[str, Any]]] = {}
 
-    for issue in issues:
-        f = issue.get("fields", {})
-        ov = issue.get("overlay", {})
-        if ov.get("hidden"):
+    for rec in _iter_records(issues):
+        if rec.overlay.get("hidden"):
             continue
 
         # 프로젝트 정보
-        proj = f.get("project") or {}
-        project_key = proj.get("key", "UNKNOWN")
-
-        # 이슈 타입별로 분류
-        issue_type = (f.get("issuetype") or {}).get("name", "Task")
-
-        # 한국어 이슈 타입을 영어로 매핑
-        issue_type_mapping = {
-            "서버": "Server",
-            "버그": "Bug",
-            "디자인": "Design",
-            "기획": "Planning",
-            "하위업무": "Task",
-            "스토리": "Story",
-            "에픽": "Epic",
-            "QA": "QA",
-            "클라": "Client",
-        }
+        project_key = rec.project_key
 
         # 매핑된 타입 사용
-        mapped_issue_type = issue_type_mapping.get(issue_type, issue_type)
+        mapped_issue_type = ISSUE_TYPE_MAPPING.get(rec.issue_type, rec.issue_type)
 
-        # 에픽 정보 가져오기 (일단 None으로 설정, 나중에 실제 필드 확인 후 수정)
+        # 에픽 정보 (에픽 링크 필드는 레코드 추출 시 반영됨)
         epic_key = None
         epic_summary = None
         if mapped_issue_type != "Epic":
-            # 에픽 링크 필드에서 에픽 정보 가져오기 (실제 필드명 확인 필요)
-            epic_link = f.get("customfield_10014")  # 에픽 링크 필드
-            if epic_link and isinstance(epic_link, dict):
-                epic_key = epic_link.get("key")
-                epic_summary = epic_link.get("summary")
+            epic_key = rec.epic_key
+            epic_summary = rec.epic_summary
 
         # 프로젝트별로 이슈 분류
         if project_key not in project_issues:
             project_issues[project_key] = []
         project_issues[project_key].append(
             {
-                "issue": issue,
+                "rec": rec,
                 "issue_type": mapped_issue_type,
-                "summary": f.get("summary", ""),
-                "key": issue.get("key", ""),
+                "summary": rec.summary,
+                "key": rec.key,
                 "epic_key": epic_key,
                 "epic_summary": epic_summary,
             }
@@ -312,20 +536,19 @@ def build_timeline_view(
         all_items.extend(non_epic_issues)
 
         for item in all_items:
-            issue = item["issue"]
-            f = issue.get("fields", {})
-            ov = issue.get("overlay", {})
+            rec = item["rec"]
+            ov = rec.overlay
 
-            start, end = _derive_dates(issue)
+            start, end = _derive_record_dates(rec)
             if not start and not end:
                 continue
 
-            status = (f.get("status") or {}).get("name")
-            priority = (f.get("priority") or {}).get("name")
+            status = rec.status
+            priority = rec.priority
 
             # 제목만 표시 (이슈키 제거)
-            summary = f.get("summary", "")
-            content = summary if summary else issue.get("key", "")
+            summary = rec.summary
+            content = summary if summary else rec.key
 
             # 그룹 ID 결정
             group_id = None
@@ -386,7 +609,7 @@ def build_timeline_view(
 
             items.append(
                 {
-                    "id": issue.get("key"),
+                    "id": rec.key,
                     "group": group_id,
                     "content": content,
                     "title": summary,  # 툴팁으로 전체 제목 표시
@@ -396,7 +619,7 @@ def build_timeline_view(
                     "status": status,
                     "priority": priority,
                     "issue_type": item["issue_type"],
-                    "url": issue.get("self"),
+                    "url": rec.url,
                     "overlay": ov,
                 }
             )
@@ -406,4 +629,11 @@ def build_timeline_view(
         groups.values(), key=lambda x: (x["project"], x.get("order", 999))
     )
 
-    return {"groups": sorted_groups, "items": items}
+    # 선후행 링크 -> 아이템 여유 / 크리티컬 여부와 edges
+    with metrics.stage("dependencies"):
+        dependencies = annotate_dependencies(
+            (item["rec"] for lst in project_issues.values() for item in lst),
+            items,
+        )
+
+    return {"groups": sorted_groups, "items": items, **dependencies}
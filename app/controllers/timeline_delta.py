@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from app.services.shared_cache import SharedCache
+
+# /api/timeline 버전 토큰과 "since" 델타 계산
+#
+# - 아이템마다 내용 해시를 만들고, (그룹 해시 + 아이템 id/해시 목록)으로 view 버전을 만든다
+# - 응답한 버전의 아이템 해시 스냅샷을 공유 캐시에 남겨 두었다가
+#   클라이언트가 ?since=<버전>으로 물으면 바뀐/삭제된 아이템만 돌려준다
+# - 스냅샷이 만료됐으면 전체 view를 돌려준다 (delta=false)
+
+SNAPSHOT_TTL = int(os.getenv("TIMELINE_SNAPSHOT_TTL", "86400"))
+
+# 지연 예산을 넘겨 대신 돌려준 view 표시 (델타 응답에도 그대로 실음)
+FRESHNESS_KEYS = ("stale", "age_seconds", "refresh_error", "partial", "fetched")
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def item_hashes(items: List[Dict[str, Any]]) -> Dict[str, str]:
+    return {str(it["id"]): _digest(it) for it in items}
+
+
+def view_version(groups: List[Dict[str, Any]], hashes: Dict[str, str]) -> str:
+    h = hashlib.sha1(_digest(groups).encode("ascii"))
+    for item_id in sorted(hashes):
+        h.update(f"\0{item_id}:{hashes[item_id]}".encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def _snapshot_key(version: str) -> str:
+    return f"timeline_snapshot:{version}"
+
+
+def make_timeline_response(
+    view: Dict[str, Any],
+    all_hashes: Dict[str, str],
+    *,
+    since: Optional[str] = None,
+    store: Optional[SharedCache] = None,
+) -> Dict[str, Any]:
+    # all_hashes: 날짜 필터 전 전체 아이템 해시 (view 캐시와 함께 계산해 둔 것)
+    groups = view.get("groups", [])
+    items = view.get("items", [])
+    hashes = {
+        str(it["id"]): all_hashes.get(str(it["id"])) or _digest(it) for it in items
+    }
+    version = view_version(groups, hashes)
+    groups_hash = _digest(groups)
+
+    if store is not None and not store.exists(_snapshot_key(version)):
+        store.set(
+            _snapshot_key(version),
+            {"groups": groups_hash, "items": hashes},
+            ttl=SNAPSHOT_TTL,
+        )
+
+    freshness = {k: view[k] for k in FRESHNESS_KEYS if k in view}
+    if since:
+        if since == version or view.get("partial"):
+            # 부분 view는 델타를 만들지 않음 (받지 못한 아이템이 삭제로 나가지 않도록)
+            # -> 클라이언트는 가진 view를 유지하고 버전도 그대로
+            return {
+                "version": since,
+                "since": since,
+                "delta": True,
+                "changed": [],
+                "removed": [],
+                **freshness,
+            }
+        old = store.get(_snapshot_key(since)) if store is not None else None
+        if old:
+            old_items: Dict[str, str] = old.get("items") or {}
+            out: Dict[str, Any] = {
+                "version": version,
+                "since": since,
+                "delta": True,
+                "changed": [
+                    it
+                    for it in items
+                    if old_items.get(str(it["id"])) != hashes[str(it["id"])]
+                ],
+                "removed": [k for k in old_items if k not in hashes],
+                **freshness,
+            }
+            # 그룹 목록은 작으므로 바뀌었을 때만 통째로 보냄
+            if old.get("groups") != groups_hash:
+                out["groups"] = groups
+            return out
+
+    out = dict(view)
+    if "edges" in out:
+        # 날짜 필터 / 접기로 빠진 아이템에 걸린 선후행 간선은 제외
+        ids = set(hashes)
+        out["edges"] = [e for e in out["edges"] if e["from"] in ids and e["to"] in ids]
+    out["version"] = version
+    out["delta"] = False
+    return out
@@ -0,0 +1,156 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+# 그룹 계층(프로젝트 1 -> 에픽 2 -> 이슈 타입 3 -> 하위업무 4) 요약
+#
+# - 그룹마다 하위 전체 아이템의 rollup(최소 시작일, 최대 종료일, 상태/타입별 개수)을 계산
+# - collapse_view: level 이하 그룹만 남기고, level 그룹은 요약 막대 하나로 대체 (리프 아이템 제외)
+# - expand_group: 접힌 그룹을 펼칠 때 바로 아래 자식 그룹(요약 포함)과 직속 아이템만 반환
+
+ROLLUP_COLOR = "#94a3b8"
+ROLLUP_ITEM_PREFIX = "rollup:"
+MAX_LEVEL = 4
+
+
+def group_parent(group: Dict[str, Any]) -> Optional[str]:
+    # build_timeline_view의 그룹 ID 규칙에서 부모 그룹 ID를 복원
+    level = group.get("level")
+    project = group.get("project")
+    if level == 1:
+        return None
+    if level == 4:
+        return group["id"][: -len("_TASK")]
+    if level == 3 and group.get("epic_key"):
+        return f"{project}_EPIC_{group['epic_key']}"
+    return f"{project}_PROJECT"
+
+
+def _owner_group(
+    item: Dict[str, Any], groups: Dict[str, Dict[str, Any]]
+) -> Optional[str]:
+    gid = item.get("group")
+    if gid in groups:
+        return gid
+    # 그룹이 만들어지지 않은 아이템은 가장 가까운 상위 그룹
+    # (하위업무 그룹 -> 이슈 타입 그룹 -> 프로젝트)
+    if gid and gid.endswith("_TASK") and gid[: -len("_TASK")] in groups:
+        return gid[: -len("_TASK")]
+    project_gid = f"{str(item.get('id', '')).split('-', 1)[0]}_PROJECT"
+    return project_gid if project_gid in groups else None
+
+
+def _chain(gid: Optional[str], groups: Dict[str, Dict[str, Any]]) -> Iterator[str]:
+    while gid is not None and gid in groups:
+        yield gid
+        gid = group_parent(groups[gid])
+
+
+def compute_rollups(
+    groups: List[Dict[str, Any]], items: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    by_id = {g["id"]: g for g in groups}
+    rollups: Dict[str, Dict[str, Any]] = {}
+    for it in items:
+        start = it.get("start") or it.get("end")
+        end = it.get("end") or start
+        status = it.get("status") or "Unknown"
+        issue_type = it.get("issue_type") or "Unknown"
+        for gid in _chain(_owner_group(it, by_id), by_id):
+            r = rollups.get(gid)
+            if r is None:
+                r = rollups[gid] = {
+                    "start": start,
+                    "end": end,
+                    "count": 0,
+                    "by_status": {},
+                    "by_type": {},
+                }
+            # ISO 날짜 문자열이므로 문자열 비교로 충분
+            if start and (r["start"] is None or start < r["start"]):
+                r["start"] = start
+            if end and (r["end"] is None or end > r["end"]):
+                r["end"] = end
+            r["count"] += 1
+            r["by_status"][status] = r["by_status"].get(status, 0) + 1
+            r["by_type"][issue_type] = r["by_type"].get(issue_type, 0) + 1
+    return rollups
+
+
+def _rollup_item(gid: str, rollup: Dict[str, Any]) -> Dict[str, Any]:
+    statuses = " · ".join(f"{k} {v}" for k, v in sorted(rollup["by_status"].items()))
+    return {
+        "id": f"{ROLLUP_ITEM_PREFIX}{gid}",
+        "group": gid,
+        "content": f"{rollup['count']}건",
+        "title": statuses,
+        "start": rollup["start"],
+        "end": rollup["end"],
+        "color": ROLLUP_COLOR,
+        "rollup": True,
+    }
+
+
+def _placed(item: Dict[str, Any], owner: str) -> Dict[str, Any]:
+    # 없는 그룹을 가리키던 아이템은 귀속된 그룹에 표시
+    return item if item.get("group") == owner else {**item, "group": owner}
+
+
+def _with_rollup(
+    group: Dict[str, Any], rollup: Optional[Dict[str, Any]], collapsed: bool
+) -> Dict[str, Any]:
+    g = dict(group)
+    g["rollup"] = rollup
+    g["collapsed"] = collapsed
+    return g
+
+
+def collapse_view(view: Dict[str, Any], level: int) -> Dict[str, Any]:
+    groups = view.get("groups", [])
+    items = view.get("items", [])
+    by_id = {g["id"]: g for g in groups}
+    rollups = compute_rollups(groups, items)
+
+    out_groups: List[Dict[str, Any]] = []
+    out_items: List[Dict[str, Any]] = []
+    for g in groups:
+        if g.get("level", MAX_LEVEL) > level or g["id"] not in rollups:
+            continue
+        # level 그룹은 접힌 상태로 요약 막대만
+        collapsed = g.get("level") == level
+        out_groups.append(_with_rollup(g, rollups[g["id"]], collapsed))
+        if collapsed:
+            out_items.append(_rollup_item(g["id"], rollups[g["id"]]))
+    # 펼쳐진 상위 그룹(level 미만)에 직속으로 달린 아이템은 그대로
+    for it in items:
+        owner = _owner_group(it, by_id)
+        if owner is not None and by_id[owner].get("level", MAX_LEVEL) < level:
+            out_items.append(_placed(it, owner))
+
+    out = dict(view)
+    out["groups"] = out_groups
+    out["items"] = out_items
+    out["collapsed_level"] = level
+    return out
+
+
+def expand_group(view: Dict[str, Any], group_id: str) -> Optional[Dict[str, Any]]:
+    groups = view.get("groups", [])
+    items = view.get("items", [])
+    by_id = {g["id"]: g for g in groups}
+    if group_id not in by_id:
+        return None
+    rollups = compute_rollups(groups, items)
+
+    children = [
+        _with_rollup(g, rollups[g["id"]], True)
+        for g in groups
+        if group_parent(g) == group_id and g["id"] in rollups
+    ]
+    out_items = [_rollup_item(g["id"], g["rollup"]) for g in children]
+    out_items.extend(
+        _placed(it, group_id) for it in items if _owner_group(it, by_id) == group_id
+    )
+    return {
+        "group": _with_rollup(by_id[group_id], rollups.get(group_id), False),
+        "groups": children,
+        "items": out_items,
+    }
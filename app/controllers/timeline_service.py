@@ -0,0 +1,329 @@
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from app.controllers.timeline_controller import (
+    apply_overlays,
+    build_timeline_view,
+    fetch_timeline_records,
+    filter_items_by_date,
+    search_timeline_records,
+    stream_timeline_records,
+)
+from app.controllers.status_segments import status_segment_view
+from app.controllers.timeline_delta import item_hashes
+from app.controllers.timeline_rollup import MAX_LEVEL
+from app.controllers.workload import compute_workload, workload_window
+from app.services import background_refresh, metrics
+from app.services.changelog_store import ChangelogStore, sync_in_background
+from app.services.overlay_store import OverlayStore
+from app.services.shared_cache import SharedCache, get_shared_cache
+
+# /api/timeline 계열 view 조립 (WSGI app.web / ASGI app.asgi 공용, 웹 프레임워크와 무관)
+# args는 .get(name)만 쓰므로 dict / 요청 args 모두 받음
+
+# 공유 캐시 (멀티 프로세스 배포 시 워커 간 공유)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") == "1"
+VIEW_CACHE_TTL = int(os.getenv("VIEW_CACHE_TTL", "120"))
+# 타임라인 응답 지연 예산(ms, 0이면 끝까지 기다림)과 마지막 정상 view 보관 기간(초)
+# 예산 안에 새 view를 못 만들면 마지막 정상 view(stale) 또는 지금까지 받은 페이지(partial)로 응답하고
+# 빌드는 백그라운드에서 마저 진행 -> 다음 요청은 캐시에서 받음
+TIMELINE_LATENCY_BUDGET_MS = int(os.getenv("TIMELINE_LATENCY_BUDGET_MS", "3000"))
+LAST_GOOD_VIEW_TTL = int(os.getenv("LAST_GOOD_VIEW_TTL", "86400"))
+# 예산 중 대체 응답(stale 조회 / partial 조립)에 남겨 두는 시간(ms)
+TIMELINE_FALLBACK_RESERVE_MS = int(os.getenv("TIMELINE_FALLBACK_RESERVE_MS", "300"))
+# 대신 보여 줄 view가 없을 때 503 응답의 Retry-After(초)
+TIMELINE_RETRY_AFTER = int(os.getenv("TIMELINE_RETRY_AFTER", "5"))
+
+
+class ViewUnavailable(Exception):
+    # 새 view를 만들지 못했고 대신 보여 줄 view도 없음 -> 라우트에서 503
+    pass
+
+
+# 레코드 1건당 오버레이 + view 조립 시간(초)의 이동 평균
+# -> partial view는 남은 시간 안에 조립할 수 있는 만큼의 레코드로만 만든다
+_build_cost = {"per_record": 0.0}
+
+
+def shared_cache() -> Optional[SharedCache]:
+    return get_shared_cache() if CACHE_ENABLED else None
+
+
+def project_keys(args) -> List[str]:
+    projects_param = args.get("projects") or args.get("project")
+    if projects_param:
+        return [p.strip() for p in projects_param.split(",") if p.strip()]
+    return [p.strip() for p in os.getenv("JIRA_PROJECTS", "SR").split(",") if p.strip()]
+
+
+def view_params(args) -> Optional[Dict[str, Any]]:
+    # /api/timeline 계열 공통 조회 파라미터
+    keys = project_keys(args)
+    if not keys:
+        return None
+    pj = ",".join(keys)
+    return {
+        "pj": pj,
+        "jql": f"project in ({pj})",
+        "group_by": args.get("group_by", "project"),
+        "user_owner": args.get("user_owner"),
+        "from_date": args.get("from_date"),
+        "to_date": args.get("to_date"),
+    }
+
+
+def undated(args) -> Dict[str, Any]:
+    # 일정 필터를 뺀 조회 파라미터 (상태 구간처럼 view 조립 뒤 다른 날짜로 거르는 경우)
+    return {k: v for k, v in args.items() if k not in ("from_date", "to_date")}
+
+
+def collapse_level(args) -> Optional[int]:
+    # collapse=<1..4>: 해당 레벨까지의 그룹만, 그 레벨 그룹은 요약 막대로
+    raw = args.get("collapse")
+    if not raw:
+        return None
+    level = int(raw)
+    if not 1 <= level <= MAX_LEVEL:
+        raise ValueError(f"collapse must be between 1 and {MAX_LEVEL}")
+    return level
+
+
+def view_cache_key(params: Dict[str, Any], generation: int) -> str:
+    # 오버레이 세대 번호를 키에 포함 -> 어느 워커에서 쓰기가 일어나도 무효화됨
+    return (
+        f"view:{params['pj']}:{params['group_by']}:"
+        f"{params['user_owner'] or ''}:{generation}"
+    )
+
+
+def finish_view(result: Dict[str, Any], group_by: str) -> Dict[str, Any]:
+    with metrics.stage("build_view"):
+        built = build_timeline_view(result, group_by=group_by)
+    # 아이템 해시는 view 캐시와 함께 한 번만 계산 (since 델타 / 버전 토큰용)
+    with metrics.stage("item_hash"):
+        built["item_hashes"] = item_hashes(built["items"])
+    return built
+
+
+def overlay_and_build(records: List[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    result = apply_overlays(
+        {"issues": records}, user_owner=params["user_owner"], drop_hidden=True
+    )
+    view = finish_view(result, params["group_by"])
+    if records:
+        cost = (time.perf_counter() - t0) / len(records)
+        prev = _build_cost["per_record"]
+        _build_cost["per_record"] = cost if prev == 0 else 0.8 * prev + 0.2 * cost
+    return view
+
+
+def last_good_key(params: Dict[str, Any]) -> str:
+    # 오버레이 세대와 무관하게 유지 -> 오버레이가 바뀐 직후에도 stale 응답에 쓸 수 있음
+    return f"view_last:{params['pj']}:{params['group_by']}:{params['user_owner'] or ''}"
+
+
+def request_deadline(t0: Optional[float]) -> Optional[float]:
+    # 요청 시작 시각 기준 응답 마감 시각 (예산이 꺼져 있으면 None)
+    if TIMELINE_LATENCY_BUDGET_MS <= 0 or t0 is None:
+        return None
+    return t0 + TIMELINE_LATENCY_BUDGET_MS / 1000.0
+
+
+def wait_seconds(deadline: float) -> float:
+    # 빌드를 기다릴 수 있는 시간 (대체 응답을 만들 시간은 남겨 둠)
+    return max(deadline - TIMELINE_FALLBACK_RESERVE_MS / 1000.0 - time.time(), 0)
+
+
+def store_view(
+    cache: SharedCache, key: str, params: Dict[str, Any], view: Dict[str, Any]
+) -> None:
+    cache.set(key, view, ttl=VIEW_CACHE_TTL)
+    cache.set(
+        last_good_key(params),
+        {"built_at": time.time(), "view": view},
+        ttl=LAST_GOOD_VIEW_TTL,
+    )
+
+
+def degraded_view(
+    params: Dict[str, Any],
+    cache: SharedCache,
+    records: List[Any],
+    error: Optional[BaseException] = None,
+    deadline: Optional[float] = None,
+) -> Dict[str, Any]:
+    # 예산 안에 새 view를 못 만든 경우: 마지막 정상 view > 지금까지 받은 레코드 순
+    last = cache.get(last_good_key(params))
+    if last is not None:
+        metrics.inc("timeline_budget_exceeded_total", outcome="stale")
+        view = last["view"]
+        view["stale"] = True
+        view["age_seconds"] = int(time.time() - last["built_at"])
+        if error is not None:
+            view["refresh_error"] = str(error)
+        return view
+    if error is not None:
+        metrics.inc("timeline_budget_exceeded_total", outcome="unavailable")
+        raise ViewUnavailable(f"timeline refresh failed: {error}")
+
+    # 지금까지 받은 레코드만으로 view를 만듦 (캐시에는 넣지 않음)
+    # 조립도 마감 안에 끝나도록 남은 시간만큼의 레코드만 사용
+    per_record = _build_cost["per_record"]
+    if deadline is not None and per_record > 0:
+        fits = int(max(deadline - time.time(), 0) / per_record)
+        records = records[:fits]
+    metrics.inc("timeline_budget_exceeded_total", outcome="partial")
+    view = overlay_and_build(records, params)
+    view["partial"] = True
+    view["fetched"] = len(records)
+    return view
+
+
+def _view_within_budget(
+    params: Dict[str, Any], key: str, cache: SharedCache, deadline: float
+) -> Dict[str, Any]:
+    def _build(progress: List[Any]) -> Dict[str, Any]:
+        records = fetch_timeline_records(
+            params["jql"], max_results=1000, cache=cache, progress=progress
+        )
+        built = overlay_and_build(records, params)
+        store_view(cache, key, params, built)
+        return built
+
+    job = background_refresh.start(key, _build)
+    if job.wait(wait_seconds(deadline)) and job.error is None:
+        # 여러 요청이 같은 빌드 결과를 공유하므로 복사해서 사용
+        return dict(job.result)
+    return degraded_view(params, cache, list(job.progress), job.error, deadline)
+
+
+def build_view(args, deadline: Optional[float] = None) -> Dict[str, Any]:
+    # deadline: 응답 마감 시각(epoch). 캐시를 쓸 때만 적용 (stale 응답에 마지막 정상 view가 필요)
+    # None이면 요청 스레드에서 끝까지 빌드 (cProfile 프로파일 요청 등)
+    params = view_params(args)
+    if params is None:
+        return {"groups": [], "items": []}
+    jql = params["jql"]
+    user_owner = params["user_owner"]
+    cache = shared_cache()
+
+    def _build() -> Dict[str, Any]:
+        if cache is None:
+            # 캐시를 쓰지 않으면 JIRA 응답 스트림 -> 오버레이 -> view 빌드를 한 번에 흘려보냄
+            # (jira_search 시간이 build_view 단계에 포함됨)
+            result = stream_timeline_records(
+                jql, user_owner=user_owner, max_results=1000
+            )
+        else:
+            result = search_timeline_records(
+                jql, user_owner=user_owner, max_results=1000, cache=cache
+            )
+        return finish_view(result, params["group_by"])
+
+    if cache is not None:
+        key = view_cache_key(params, OverlayStore().generation())
+        view = cache.get(key)
+        if view is None and deadline is not None:
+            view = _view_within_budget(params, key, cache, deadline)
+        elif view is None:
+            view = _build()
+            store_view(cache, key, params, view)
+    else:
+        view = _build()
+
+    return filter_view_by_date(view, params)
+
+
+def filter_view_by_date(view: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    with metrics.stage("date_filter"):
+        view["items"] = filter_items_by_date(
+            view["items"], params["from_date"], params["to_date"]
+        )
+    return view
+
+
+def status_segments(view: Dict[str, Any], args) -> Dict[str, Any]:
+    # 일정 필터 전 view에 로컬 changelog 구간을 입힌 뒤 구간 날짜로 필터
+    view.pop("item_hashes", None)
+    store = ChangelogStore()
+    # 오래된 프로젝트는 워터마크 이후 변경분만 백그라운드 동기화 (응답은 기다리지 않음)
+    for project_key in project_keys(args):
+        sync_in_background(project_key, store)
+    with metrics.stage("status_segments"):
+        histories = store.history(it["id"] for it in view["items"])
+        view = status_segment_view(view, histories)
+    with metrics.stage("date_filter"):
+        view["items"] = filter_items_by_date(
+            view["items"], args.get("from_date"), args.get("to_date")
+        )
+    return view
+
+
+def status_view(args, deadline: Optional[float] = None) -> Dict[str, Any]:
+    # 상태별 체류 막대
+    return status_segments(build_view(undated(args), deadline=deadline), args)
+
+
+def workload_params(args) -> Dict[str, Any]:
+    # /api/analytics/workload 조회 파라미터 (잘못되면 ValueError -> 400)
+    keys = project_keys(args)
+    if not keys:
+        raise ValueError("no projects given")
+    dimension = args.get("dimension", "project")
+    from_date, to_date = args.get("from_date"), args.get("to_date")
+    workload_window(dimension, from_date, to_date)
+    pj = ",".join(keys)
+    return {
+        "pj": pj,
+        "jql": f"project in ({pj})",
+        "dimension": dimension,
+        "user_owner": args.get("user_owner"),
+        "from_date": from_date,
+        "to_date": to_date,
+    }
+
+
+def workload_cache_key(params: Dict[str, Any], generation: int) -> str:
+    return (
+        f"workload:{params['pj']}:{params['dimension']}:"
+        f"{params['from_date'] or ''}:{params['to_date'] or ''}:"
+        f"{params['user_owner'] or ''}:{generation}"
+    )
+
+
+def workload_from_records(records: List[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    result = apply_overlays(
+        {"issues": records}, user_owner=params["user_owner"], drop_hidden=True
+    )
+    with metrics.stage("workload"):
+        return compute_workload(
+            result["issues"],
+            dimension=params["dimension"],
+            from_date=params["from_date"],
+            to_date=params["to_date"],
+        )
+
+
+def workload_view(params: Dict[str, Any]) -> Dict[str, Any]:
+    # 일자별 활성 이슈 수 히트맵 (캐시를 쓰면 오버레이 세대별로 보관)
+    cache = shared_cache()
+    if cache is None:
+        result = stream_timeline_records(
+            params["jql"], user_owner=params["user_owner"], max_results=None
+        )
+        with metrics.stage("workload"):
+            return compute_workload(
+                result["issues"],
+                dimension=params["dimension"],
+                from_date=params["from_date"],
+                to_date=params["to_date"],
+            )
+
+    def _compute() -> Dict[str, Any]:
+        records = fetch_timeline_records(params["jql"], max_results=None, cache=cache)
+        return workload_from_records(records, params)
+
+    key = workload_cache_key(params, OverlayStore().generation())
+    return cache.get_or_set(key, _compute, ttl=VIEW_CACHE_TTL)
@@ -0,0 +1,165 @@
+from datetime import date
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.controllers.issue_record import IssueRecord
+from app.controllers.timeline_controller import (
+    ISSUE_TYPE_MAPPING,
+    _derive_record_dates,
+    _iter_records,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 같은 알고리즘의 순수 파이썬 경로
+    np = None
+
+# 일자별 활성 이슈 수 (워크로드 히트맵)
+#
+# 이슈마다 [start, end] 구간을 그룹별 차분 배열에 +1 / -1로 찍고 누적합으로 일자별 개수를 얻는다.
+# 이슈 수 N, 그룹 G, 일수 D에 대해 O(N + G*D) (이슈 x 일자 루프 없음)
+
+WORKLOAD_DIMENSIONS = ("project", "type", "assignee", "status")
+# 응답 행렬 크기 상한 (약 10년)
+MAX_WORKLOAD_DAYS = 3660
+UNASSIGNED = "(미지정)"
+
+
+def _dimension_value(rec: IssueRecord, dimension: str) -> str:
+    if dimension == "project":
+        return rec.project_key
+    if dimension == "type":
+        return ISSUE_TYPE_MAPPING.get(rec.issue_type, rec.issue_type)
+    if dimension == "assignee":
+        return rec.assignee or UNASSIGNED
+    return rec.status or "Unknown"
+
+
+@lru_cache(maxsize=4096)
+def _iso_day(value: Optional[str]) -> Optional[str]:
+    # 오버레이 날짜는 사용자가 넣은 값이므로 실제 날짜인 YYYY-MM-DD만 사용 ("2024-13-40" 등은 무시)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def _collect(
+    issues: Iterable[Any], dimension: str
+) -> Tuple[List[str], List[int], List[str], List[str]]:
+    # (행 라벨, 이슈별 행 코드, 시작일, 종료일) - 레코드 순회는 여기서 한 번만
+    labels: Dict[str, int] = {}
+    codes: List[int] = []
+    starts: List[str] = []
+    ends: List[str] = []
+    for rec in _iter_records(issues):
+        if rec.overlay.get("hidden"):
+            continue
+        start, end = _derive_record_dates(rec)
+        start, end = _iso_day(start), _iso_day(end)
+        start = start or end
+        end = end or start
+        if not start:
+            continue
+        if end < start:
+            start, end = end, start
+        label = _dimension_value(rec, dimension)
+        code = labels.get(label)
+        if code is None:
+            code = labels[label] = len(labels)
+        codes.append(code)
+        starts.append(start)
+        ends.append(end)
+    return list(labels), codes, starts, ends
+
+
+def _counts_numpy(
+    rows: int, codes: List[int], starts: List[str], ends: List[str], d0: date, days: int
+) -> List[List[int]]:
+    w0 = np.datetime64(d0.isoformat(), "D")
+    s = (np.array(starts, dtype="datetime64[D]") - w0).astype(np.int64)
+    e = (np.array(ends, dtype="datetime64[D]") - w0).astype(np.int64)
+    c = np.array(codes, dtype=np.int64)
+    # 창과 겹치는 구간만, 창 경계로 자름 (e는 배타적 끝)
+    mask = (e >= 0) & (s < days)
+    s = np.clip(s[mask], 0, days)
+    e = np.clip(e[mask] + 1, 0, days)
+    c = c[mask]
+    width = days + 1
+    size = rows * width
+    diff = np.bincount(c * width + s, minlength=size) - np.bincount(
+        c * width + e, minlength=size
+    )
+    counts = np.cumsum(diff.reshape(rows, width)[:, :days], axis=1)
+    return counts.tolist()
+
+
+def _counts_python(
+    rows: int, codes: List[int], starts: List[str], ends: List[str], d0: date, days: int
+) -> List[List[int]]:
+    base = d0.toordinal()
+    diff = [[0] * (days + 1) for _ in range(rows)]
+    for code, start, end in zip(codes, starts, ends):
+        s = date.fromisoformat(start).toordinal() - base
+        e = date.fromisoformat(end).toordinal() - base + 1
+        if e <= 0 or s >= days:
+            continue
+        row = diff[code]
+        row[max(s, 0)] += 1
+        row[min(e, days)] -= 1
+    return [list(accumulate(row[:days])) for row in diff]
+
+
+def workload_window(
+    dimension: str, from_date: Optional[str], to_date: Optional[str]
+) -> Tuple[date, date, int]:
+    # 요청 파라미터 검증 (잘못되면 ValueError) -> (시작일, 종료일, 일수)
+    if dimension not in WORKLOAD_DIMENSIONS:
+        raise ValueError(f"dimension must be one of {', '.join(WORKLOAD_DIMENSIONS)}")
+    # 기본 창은 올해 1년
+    today = date.today()
+    d0 = date.fromisoformat(from_date) if from_date else date(today.year, 1, 1)
+    d1 = date.fromisoformat(to_date) if to_date else date(d0.year, 12, 31)
+    days = (d1 - d0).days + 1
+    if days <= 0:
+        raise ValueError("to_date must not be before from_date")
+    if days > MAX_WORKLOAD_DAYS:
+        raise ValueError(f"date window is limited to {MAX_WORKLOAD_DAYS} days")
+    return d0, d1, days
+
+
+def compute_workload(
+    issues: Iterable[Any],
+    *,
+    dimension: str = "project",
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    d0, d1, days = workload_window(dimension, from_date, to_date)
+    labels, codes, starts, ends = _collect(issues, dimension)
+    if labels:
+        counts = (_counts_numpy if np is not None else _counts_python)(
+            len(labels), codes, starts, ends, d0, days
+        )
+    else:
+        counts = []
+
+    # 행은 라벨 순 (응답이 실행마다 같도록)
+    order = sorted(range(len(labels)), key=lambda i: labels[i])
+    matrix = [counts[i] for i in order]
+    return {
+        "dimension": dimension,
+        "from_date": d0.isoformat(),
+        "to_date": d1.isoformat(),
+        "days": days,
+        "rows": [labels[i] for i in order],
+        # matrix[행][일] = 해당 일자에 활성인 이슈 수 (일자 = from_date + 열 번호)
+        "matrix": matrix,
+        "row_peak": [max(row) if row else 0 for row in matrix],
+        "max": max((max(row) for row in matrix if row), default=0),
+        "issues": len(codes),
+        "engine": "numpy" if np is not None else "python",
+    }
@@ -0,0 +1,93 @@
+import logging
+import os
+
+# 프로덕션 서빙 엔트리포인트 (멀티 워커)
+# python -m app.serve
+# 모드에 해당하는 앱만 import (asgi 모드에서 Flask 앱을 올리지 않음)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", str(os.cpu_count() or 2)))
+WEB_THREADS = int(os.getenv("WEB_THREADS", "4"))
+# wsgi: Flask (app.web) / asgi: Quart (app.asgi, quart + httpx + uvicorn 또는 hypercorn 필요)
+WEB_MODE = os.getenv("WEB_MODE", "wsgi").lower()
+
+
+def _run_gunicorn(host: str, port: int) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    from app.web import app
+
+    class _App(BaseApplication):
+        def load_config(self) -> None:
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", WEB_WORKERS)
+            self.cfg.set("threads", WEB_THREADS)
+            self.cfg.set("loglevel", LOG_LEVEL.lower())
+
+        def load(self):
+            return app
+
+    _App().run()
+
+
+def _run_werkzeug(host: str, port: int) -> None:
+    from werkzeug.serving import run_simple
+
+    from app.web import app
+
+    # gunicorn이 없으면 werkzeug의 fork 기반 멀티 프로세스 서버 사용
+    run_simple(host, port, app, processes=WEB_WORKERS, threaded=False)
+
+
+def _run_asgi(host: str, port: int) -> None:
+    try:
+        import uvicorn
+    except ImportError:
+        uvicorn = None
+    if uvicorn is not None:
+        uvicorn.run(
+            "app.asgi:app",
+            host=host,
+            port=port,
+            workers=WEB_WORKERS,
+            log_level=LOG_LEVEL.lower(),
+        )
+        return
+
+    try:
+        from hypercorn.config import Config
+        from hypercorn.run import run
+    except ImportError:
+        raise SystemExit("WEB_MODE=asgi requires uvicorn or hypercorn")
+    config = Config()
+    config.application_path = "app.asgi:app"
+    config.bind = [f"{host}:{port}"]
+    config.workers = WEB_WORKERS
+    config.loglevel = LOG_LEVEL.lower()
+    run(config)
+
+
+def main() -> None:
+    port = int(os.getenv("PORT", "5001"))
+    host = os.getenv("HOST", "0.0.0.0")
+    logging.basicConfig(level=getattr(logging, LOG_LEVEL, logging.INFO))
+    logging.getLogger(__name__).info(
+        "Starting server at http://%s:%s mode=%s workers=%s (LOG_LEVEL=%s)",
+        host,
+        port,
+        WEB_MODE,
+        WEB_WORKERS,
+        LOG_LEVEL,
+    )
+    if WEB_MODE == "asgi":
+        _run_asgi(host, port)
+        return
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        _run_werkzeug(host, port)
+    else:
+        _run_gunicorn(host, port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services import metrics
+
+# 요청이 기다리지 않아도 끝까지 진행되는 백그라운드 빌드 (프로세스 내 single-flight)
+#
+# - 같은 키의 빌드가 진행 중이면 새로 시작하지 않고 그 작업을 공유
+# - build(progress)는 받은 데이터를 progress 리스트에 쌓음
+#   -> 기다리다 시간이 다 된 요청은 지금까지 받은 만큼으로 부분 응답을 만들 수 있음
+# - 요청 스레드는 done.wait(timeout)으로 예산만큼만 기다림
+# - 빌드 스레드는 자기 요청 단위 통계(metrics.stage / inc)를 따로 모으고,
+#   제때 끝나면 기다린 요청에 합침 -> 요청 로그 / 느린 요청 분석에 빌드 단계가 보임
+#   (끝나지 않았으면 기다린 시간만 build_wait 단계로 남김. 요청이 끝난 뒤 그 통계를 건드리지 않음)
+
+logger = logging.getLogger(__name__)
+
+
+class Refresh:
+    __slots__ = ("key", "progress", "done", "result", "error", "started_at", "stats")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.progress: List[Any] = []
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.started_at = time.time()
+        self.stats: Optional[Dict[str, Any]] = None
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        t0 = time.perf_counter()
+        finished = self.done.wait(timeout)
+        if finished:
+            metrics.merge_request_stats(self.stats)
+        else:
+            waited = (time.perf_counter() - t0) * 1000.0
+            metrics.merge_request_stats(
+                {"stages": {"build_wait": waited}, "counters": {}}
+            )
+        return finished
+
+
+_lock = threading.Lock()
+_running: Dict[str, Refresh] = {}
+
+
+def _run(job: Refresh, build: Callable[[List[Any]], Any]) -> None:
+    t0 = time.perf_counter()
+    token = metrics.begin_request()
+    try:
+        job.result = build(job.progress)
+        metrics.inc("background_refresh_total", status="ok")
+    except Exception as e:
+        job.error = e
+        metrics.inc("background_refresh_total", status="error")
+        logger.warning("background refresh failed (%s): %s", job.key, e)
+    finally:
+        job.stats = metrics.end_request(token)
+        with _lock:
+            _running.pop(job.key, None)
+        job.done.set()
+        metrics.observe("background_refresh_duration_seconds", time.perf_counter() - t0)
+
+
+def start(key: str, build: Callable[[List[Any]], Any]) -> Refresh:
+    with _lock:
+        job = _running.get(key)
+        if job is not None:
+            metrics.inc("background_refresh_total", status="joined")
+            return job
+        job = _running[key] = Refresh(key)
+    threading.Thread(
+        target=_run, args=(job, build), name=f"refresh-{key}", daemon=True
+    ).start()
+    return job
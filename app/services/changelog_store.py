@@ -0,0 +1,363 @@
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services import jira_client, metrics
+from app.services.file_utils import init_db_once
+from app.services.refresh_lease import LeaseTable, run_in_background
+
+# 이슈 상태 전환 이력(changelog)을 overlays.db에 보관 (상태별 체류 기간 막대용)
+#
+# - 프로젝트별 워터마크 = 지금까지 받은 이슈 updated의 최댓값.
+#   다음 동기화는 "updated >= 워터마크"인 이슈만 expand=changelog로 다시 조회한다
+# - 페이지는 startAt 오프셋 대신 "updated >= 마지막으로 본 값" 키셋으로 넘김
+#   (동기화 중에 수정된 이슈가 목록 끝으로 옮겨가면서 뒤 이슈가 앞 페이지로 당겨져 빠지지 않도록)
+# - 전환은 (issue_key, history_id)로 upsert -> 겹치는 구간을 다시 받아도 중복되지 않음
+# - reference_store처럼 오래되면 lease를 잡은 워커 하나가 백그라운드에서 동기화
+#
+#   python -m app.services.changelog_store SR AB [--full]   # 즉시 동기화 (cron 용)
+
+CHANGELOG_DB_PATH = os.getenv("CHANGELOG_DB_PATH", "overlays.db")
+CHANGELOG_SYNC_INTERVAL = int(os.getenv("CHANGELOG_SYNC_INTERVAL", "300"))
+CHANGELOG_SYNC_LEASE = int(os.getenv("CHANGELOG_SYNC_LEASE", "900"))
+# JQL의 updated 비교는 분 단위 -> 워터마크보다 조금 앞에서부터 다시 조회
+CHANGELOG_OVERLAP_MINUTES = int(os.getenv("CHANGELOG_OVERLAP_MINUTES", "2"))
+# 한 번에 조회하는 이슈 수. 페이지마다 커밋하고 워터마크를 올림 (중간에 실패해도 진행분 유지)
+CHANGELOG_PAGE_SIZE = int(os.getenv("CHANGELOG_PAGE_SIZE", "100"))
+
+CHANGELOG_FIELDS: List[str] = ["project", "status", "created", "updated"]
+
+logger = logging.getLogger(__name__)
+
+IssueRow = Tuple[str, str, Optional[str], Optional[str], Optional[str], float]
+TransitionRow = Tuple[str, str, str, float, Optional[str], Optional[str]]
+
+
+def _count_query(_sql: str) -> None:
+    metrics.inc("sqlite_queries_total", db="changelog")
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    # 저장된 updated_ts / changed_ts와 같은 기준 (status_segments도 이 함수로 계산)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def _jql_time(watermark: str) -> str:
+    # JIRA는 API 사용자의 시간대로 시각을 돌려주고 JQL도 같은 시간대로 해석하므로
+    # 받은 값의 현지 시각을 그대로 사용
+    wall = datetime.fromisoformat(watermark).replace(tzinfo=None)
+    return (wall - timedelta(minutes=CHANGELOG_OVERLAP_MINUTES)).strftime(
+        "%Y-%m-%d %H:%M"
+    )
+
+
+class ChangelogStore:
+    def __init__(self, db_path: str = CHANGELOG_DB_PATH) -> None:
+        self.db_path = db_path
+        self.leases = LeaseTable(
+            self._conn, "changelog_meta", "project_key", "synced_at"
+        )
+        self._init_db()
+
+    def _conn(self):
+        con = sqlite3.connect(self.db_path, timeout=10)
+        con.set_trace_callback(_count_query)
+        return con
+
+    def _init_db(self) -> None:
+        init_db_once("changelog", self.db_path, self._create_schema)
+
+    def _create_schema(self) -> None:
+        with self._conn() as con:
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS changelog_issues (
+                    issue_key TEXT PRIMARY KEY,
+                    project_key TEXT NOT NULL,
+                    created TEXT,
+                    status TEXT,
+                    updated TEXT,
+                    updated_ts REAL NOT NULL DEFAULT 0
+                );
+                """
+            )
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS status_transitions (
+                    issue_key TEXT NOT NULL,
+                    history_id TEXT NOT NULL,
+                    changed_at TEXT NOT NULL,
+                    changed_ts REAL NOT NULL,
+                    from_status TEXT,
+                    to_status TEXT,
+                    PRIMARY KEY (issue_key, history_id)
+                );
+                """
+            )
+            con.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_status_transitions_issue
+                ON status_transitions(issue_key, changed_ts);
+                """
+            )
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS changelog_meta (
+                    project_key TEXT PRIMARY KEY,
+                    watermark TEXT,
+                    watermark_ts REAL NOT NULL DEFAULT 0,
+                    synced_at REAL NOT NULL DEFAULT 0
+                );
+                """
+            )
+            self.leases.init_columns(con)
+
+    # --- 조회 ---------------------------------------------------------
+
+    def watermark(self, project_key: str) -> Optional[str]:
+        with self._conn() as con:
+            row = con.execute(
+                "SELECT watermark FROM changelog_meta WHERE project_key=?",
+                (project_key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def history(self, issue_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        # {issue_key: {"created", "status", "transitions": [(changed_at, ts, from, to)]}}
+        keys = json.dumps(list(issue_keys))
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._conn() as con:
+            for key, created, status in con.execute(
+                """
+                SELECT issue_key, created, status FROM changelog_issues
+                WHERE issue_key IN (SELECT value FROM json_each(?))
+                """,
+                (keys,),
+            ):
+                out[key] = {"created": created, "status": status, "transitions": []}
+            for key, changed_at, ts, from_status, to_status in con.execute(
+                """
+                SELECT issue_key, changed_at, changed_ts, from_status, to_status
+                FROM status_transitions
+                WHERE issue_key IN (SELECT value FROM json_each(?))
+                ORDER BY issue_key, changed_ts, history_id
+                """,
+                (keys,),
+            ):
+                if key in out:
+                    out[key]["transitions"].append(
+                        (changed_at, ts, from_status, to_status)
+                    )
+        return out
+
+    # --- 갱신 ---------------------------------------------------------
+
+    def ingest(
+        self,
+        project_key: str,
+        batch: List[Tuple[IssueRow, List[TransitionRow]]],
+    ) -> int:
+        # 이슈 / 전환 upsert와 워터마크 전진을 한 트랜잭션으로
+        if not batch:
+            return 0
+        issue_rows = [issue for issue, _ in batch]
+        transition_rows = [t for _, transitions in batch for t in transitions]
+        newest = max(issue_rows, key=lambda r: r[5])
+        with self._conn() as con:
+            con.executemany(
+                """
+                INSERT INTO changelog_issues
+                    (issue_key, project_key, created, status, updated, updated_ts)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(issue_key) DO UPDATE SET
+                    project_key=excluded.project_key,
+                    created=excluded.created,
+                    status=excluded.status,
+                    updated=excluded.updated,
+                    updated_ts=excluded.updated_ts
+                """,
+                issue_rows,
+            )
+            con.executemany(
+                """
+                INSERT OR REPLACE INTO status_transitions
+                    (issue_key, history_id, changed_at, changed_ts, from_status, to_status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                transition_rows,
+            )
+            con.execute(
+                "INSERT OR IGNORE INTO changelog_meta (project_key) VALUES (?)",
+                (project_key,),
+            )
+            con.execute(
+                """
+                UPDATE changelog_meta SET watermark=?, watermark_ts=?
+                WHERE project_key=? AND watermark_ts<?
+                """,
+                (newest[4], newest[5], project_key, newest[5]),
+            )
+        return len(transition_rows)
+
+
+def _status_transitions(issue: Dict[str, Any]) -> List[TransitionRow]:
+    key = issue.get("key", "")
+    changelog = issue.get("changelog") or {}
+    histories = changelog.get("histories") or []
+    if int(changelog.get("total") or 0) > len(histories):
+        # 검색 응답에는 최근 이력 일부만 실림 -> 이 이슈만 전체 이력을 따로 조회
+        histories = list(jira_client.iter_issue_changelog(key))
+    rows: List[TransitionRow] = []
+    for h in histories:
+        ts = parse_timestamp(h.get("created"))
+        if ts is None:
+            continue
+        for item in h.get("items") or []:
+            if item.get("fieldId", item.get("field")) != "status":
+                continue
+            rows.append(
+                (
+                    key,
+                    str(h.get("id")),
+                    h["created"],
+                    ts,
+                    item.get("fromString"),
+                    item.get("toString"),
+                )
+            )
+    return rows
+
+
+def _issue_rows(
+    project_key: str, issue: Dict[str, Any]
+) -> Tuple[IssueRow, List[TransitionRow]]:
+    f = issue.get("fields") or {}
+    updated = f.get("updated")
+    return (
+        issue.get("key", ""),
+        (f.get("project") or {}).get("key", project_key),
+        f.get("created"),
+        (f.get("status") or {}).get("name"),
+        updated,
+        parse_timestamp(updated) or 0.0,
+    ), _status_transitions(issue)
+
+
+def _issue_updated(issue: Dict[str, Any]) -> Optional[str]:
+    return (issue.get("fields") or {}).get("updated")
+
+
+def sync_project(
+    project_key: str,
+    store: Optional[ChangelogStore] = None,
+    *,
+    full: bool = False,
+    page_size: int = CHANGELOG_PAGE_SIZE,
+) -> int:
+    # 워터마크 이후에 바뀐 이슈만 changelog와 함께 조회 -> 반영한 이슈 수
+    store = store or ChangelogStore()
+    lower = None if full else store.watermark(project_key)
+    # 이번 동기화에서 반영한 이슈별 updated -> 겹치는 구간을 다시 받아도 한 번만 반영
+    seen: Dict[str, Optional[str]] = {}
+    start_at = 0
+    count = 0
+    while True:
+        jql = f'project = "{project_key}"'
+        if lower:
+            jql += f' AND updated >= "{_jql_time(lower)}"'
+        jql += " ORDER BY updated ASC, key ASC"
+        page = list(
+            jira_client.iter_search_issues(
+                jql,
+                fields=CHANGELOG_FIELDS,
+                expand=["changelog"],
+                start_at=start_at,
+                max_results=page_size,
+                page_size=page_size,
+            )
+        )
+        batch: List[Tuple[IssueRow, List[TransitionRow]]] = []
+        newest = lower
+        for issue in page:
+            updated = _issue_updated(issue)
+            if (parse_timestamp(updated) or 0) > (parse_timestamp(newest) or 0):
+                newest = updated
+            key = issue.get("key", "")
+            if key in seen and seen[key] == updated:
+                continue
+            seen[key] = updated
+            batch.append(_issue_rows(project_key, issue))
+        store.ingest(project_key, batch)
+        count += len(batch)
+        if len(page) < page_size:
+            break
+        if newest != lower:
+            # 본 범위 끝에서 다시 첫 페이지부터
+            lower, start_at = newest, 0
+        else:
+            # 한 페이지가 모두 겹침 구간 안(같은 분에 수정된 이슈가 페이지보다 많음)
+            # -> 이 구간 안에서만 오프셋으로 넘김
+            start_at += len(page)
+    store.leases.mark_done(project_key)
+    return count
+
+
+def _run_sync(store: ChangelogStore, project_key: str, full: bool = False) -> int:
+    t0 = time.perf_counter()
+    try:
+        count = sync_project(project_key, store, full=full)
+        metrics.inc("changelog_sync_total", status="ok")
+        metrics.inc("changelog_issues_synced_total", count)
+        return count
+    except Exception as e:
+        # 실패하면 lease를 풀고 backoff 동안 재시도하지 않음 (반영된 이력은 계속 사용)
+        store.leases.mark_failed(project_key)
+        metrics.inc("changelog_sync_total", status="error")
+        logger.warning("changelog sync failed (%s): %s", project_key, e)
+        raise
+    finally:
+        metrics.observe("changelog_sync_duration_seconds", time.perf_counter() - t0)
+
+
+def sync_in_background(
+    project_key: str, store: Optional[ChangelogStore] = None, force: bool = False
+) -> bool:
+    store = store or ChangelogStore()
+    return run_in_background(
+        store.leases,
+        project_key,
+        lambda: _run_sync(store, project_key),
+        ttl=CHANGELOG_SYNC_INTERVAL,
+        lease=CHANGELOG_SYNC_LEASE,
+        thread_name=f"changelog-sync-{project_key}",
+        force=force,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    full = "--full" in argv
+    project_keys = [a for a in argv if not a.startswith("--")]
+    if not project_keys:
+        print("usage: python -m app.services.changelog_store PROJECT [...] [--full]")
+        return 2
+    store = ChangelogStore()
+    for key in project_keys:
+        count = _run_sync(store, key, full=full)
+        print(f"{key}: issues={count} watermark={store.watermark(key)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,73 @@
 import json
-from typing import Any
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, IO, Iterator, Optional, Set, Tuple
+
+# 스키마 생성 / 마이그레이션을 끝낸 (저장소 이름, DB 파일 경로, inode)
+# 저장소 객체는 요청마다 만들어지므로 프로세스당 파일별로 한 번만 실행
+_init_lock = threading.Lock()
+_initialized: Set[Tuple[str, str, int]] = set()
+
+
+@contextmanager
+def atomic_open(
+    filename: str, mode: str = "w", encoding: str = "utf-8"
+) -> Iterator[IO]:
+    # 같은 디렉터리의 고유 임시 파일에 쓴 뒤 rename -> 동시 export에도 안전
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(
+        prefix=f".{os.path.basename(filename)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        if "b" in mode:
+            f = os.fdopen(fd, mode, buffering=1 << 20)
+        else:
+            f = os.fdopen(fd, mode, buffering=1 << 20, encoding=encoding)
+        with f:
+            yield f
+        # mkstemp는 0600으로 만들기 때문에 기존 파일 권한(없으면 0644)을 유지
+        try:
+            os.chmod(tmp, os.stat(filename).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _db_identity(name: str, db_path: str) -> Optional[Tuple[str, str, int]]:
+    # 파일이 지워지고 다시 만들어지면 inode가 바뀌므로 다시 초기화됨
+    try:
+        return name, os.path.realpath(db_path), os.stat(db_path).st_ino
+    except OSError:
+        return None
+
+
+def init_db_once(name: str, db_path: str, create: Callable[[], None]) -> None:
+    # 같은 DB 파일을 여러 저장소가 함께 쓰므로 저장소 이름별로 따로 기록
+    if _db_identity(name, db_path) in _initialized:
+        return
+    with _init_lock:
+        if _db_identity(name, db_path) in _initialized:
+            return
+        create()
+        identity = _db_identity(name, db_path)
+        if identity is not None:
+            _initialized.add(identity)
 
 
 def save_json_to_file(data: Any, filename: str) -> bool:
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with atomic_open(filename) as f:
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+            for chunk in encoder.iterencode(data):
+                f.write(chunk)
         return True
     except Exception as e:
         print(f"JSON 파일 저장 실패: {e}")
@@ -0,0 +1,85 @@
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.services import jira_client, metrics
+
+try:
+    import httpx
+except ImportError:  # ASGI 모드(app.asgi)에서만 필요
+    httpx = None
+
+# ASGI 모드용 비동기 JIRA 클라이언트
+# 요청을 기다리는 동안 워커 스레드를 점유하지 않도록 httpx.AsyncClient 하나를 프로세스에서 공유
+# (연결 풀 상한 = 동시에 JIRA로 나가는 요청 수)
+
+JIRA_ASYNC_TIMEOUT = float(os.getenv("JIRA_ASYNC_TIMEOUT", "30"))
+JIRA_ASYNC_MAX_CONNECTIONS = int(os.getenv("JIRA_ASYNC_MAX_CONNECTIONS", "32"))
+
+_client: Optional["httpx.AsyncClient"] = None
+
+
+def get_client() -> "httpx.AsyncClient":
+    global _client
+    if httpx is None:
+        raise RuntimeError("httpx is required for the async JIRA client")
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=jira_client._auth_header(),
+            timeout=JIRA_ASYNC_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=JIRA_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=JIRA_ASYNC_MAX_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _observe(r: "httpx.Response", op: str) -> "httpx.Response":
+    metrics.inc("jira_requests_total", op=op, status=r.status_code)
+    metrics.inc("jira_response_bytes_total", len(r.content), op=op)
+    return r
+
+
+async def iter_search_issues(
+    jql: str,
+    fields: Optional[List[str]] = None,
+    *,
+    start_at: int = 0,
+    max_results: Optional[int] = None,
+    page_size: int = jira_client.SEARCH_PAGE_SIZE,
+) -> AsyncIterator[Dict[str, Any]]:
+    # jira_client.iter_search_issues와 같은 페이지 규칙 (페이지 단위로 디코딩)
+    url = f"{jira_client.JIRA_BASE}/rest/api/3/search"
+    client = get_client()
+    fetched = 0
+    while max_results is None or fetched < max_results:
+        want = (
+            page_size if max_results is None else min(page_size, max_results - fetched)
+        )
+        payload: Dict[str, Any] = {
+            "jql": jql,
+            "startAt": start_at + fetched,
+            "maxResults": want,
+        }
+        if fields:
+            payload["fields"] = fields
+        r = _observe(await client.post(url, json=payload), "search")
+        r.raise_for_status()
+        data = r.json()
+        issues = data.get("issues") or []
+        for issue in issues:
+            yield issue
+        fetched += len(issues)
+        page_limit = min(want, int(data.get("maxResults") or want))
+        total = data.get("total")
+        if not issues or len(issues) < page_limit:
+            break
+        if total is not None and start_at + fetched >= int(total):
+            break
@@ -0,0 +1,314 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.services import jira_client, metrics
+from app.services.multipart import MultipartFileBody
+
+# 여러 이슈에 대한 생성/코멘트/전환/첨부를 제한된 동시성으로 실행
+# 모든 함수는 입력 순서대로 항목별 결과를 돌려주며, 일부 실패가 전체를 중단시키지 않는다
+#
+#   {"index": 0, "key": "SR-1", "ok": True, "status": 201, "result": {...}, "error": None}
+
+BULK_WORKERS = int(os.getenv("JIRA_BULK_WORKERS", "8"))
+BULK_MAX_RETRIES = int(os.getenv("JIRA_BULK_MAX_RETRIES", "3"))
+BULK_TIMEOUT = float(os.getenv("JIRA_BULK_TIMEOUT", "30"))
+# POST /rest/api/3/issue/bulk 한 번에 보낼 수 있는 최대 이슈 수
+BULK_CREATE_CHUNK = 50
+
+UploadProgress = Callable[[int, str, str, int, int], None]
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    # 워커 스레드들이 keep-alive 연결을 공유하도록 풀 크기를 동시성에 맞춤
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=max(BULK_WORKERS, 10)
+            )
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+
+def _retry_after(r: requests.Response, attempt: int) -> float:
+    try:
+        return min(float(r.headers.get("Retry-After", "")), 30.0)
+    except ValueError:
+        return min(0.5 * (2**attempt), 10.0)
+
+
+# _request가 Retry-After를 따라 재시도하는 상태 코드 (호출 쪽에서 다시 재시도하지 않음)
+_RETRY_STATUSES = (429, 503)
+
+
+def _request(method: str, url: str, op: str, **kwargs: Any) -> requests.Response:
+    # 429/503은 Retry-After 만큼 기다렸다가 재시도
+    for attempt in range(BULK_MAX_RETRIES + 1):
+        body = kwargs.get("data")
+        if hasattr(body, "seek"):
+            # 스트리밍 본문은 재시도 전에 처음으로 되감기
+            body.seek(0)
+        r = jira_client._observe(
+            get_session().request(method, url, timeout=BULK_TIMEOUT, **kwargs), op
+        )
+        if r.status_code not in _RETRY_STATUSES or attempt == BULK_MAX_RETRIES:
+            return r
+        time.sleep(_retry_after(r, attempt))
+    return r
+
+
+def _error_text(r: requests.Response) -> str:
+    try:
+        body = r.json()
+    except ValueError:
+        return f"HTTP {r.status_code}: {r.text[:200]}"
+    if isinstance(body, dict):
+        messages = list(body.get("errorMessages") or [])
+        messages += [f"{k}: {v}" for k, v in (body.get("errors") or {}).items()]
+        if messages:
+            return f"HTTP {r.status_code}: " + "; ".join(messages)
+    return f"HTTP {r.status_code}"
+
+
+def _item(
+    index: int,
+    key: Optional[str],
+    *,
+    ok: bool,
+    status: Optional[int] = None,
+    result: Any = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "key": key,
+        "ok": ok,
+        "status": status,
+        "result": result,
+        "error": error,
+    }
+
+
+def _run_each(
+    items: Sequence[Tuple[str, Any]],
+    fn: Callable[[str, Any], requests.Response],
+    workers: int,
+) -> List[Dict[str, Any]]:
+    def _one(index: int, key: str, arg: Any) -> Dict[str, Any]:
+        try:
+            r = fn(key, arg)
+        except Exception as e:
+            return _item(index, key, ok=False, error=f"{type(e).__name__}: {e}")
+        if r.status_code >= 400:
+            return _item(
+                index, key, ok=False, status=r.status_code, error=_error_text(r)
+            )
+        try:
+            result = r.json() if r.content else None
+        except ValueError:
+            result = None
+        return _item(index, key, ok=True, status=r.status_code, result=result)
+
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as pool:
+        futures = [pool.submit(_one, i, key, arg) for i, (key, arg) in enumerate(items)]
+        return [f.result() for f in futures]
+
+
+def bulk_create_issues(
+    issues: Iterable[Dict[str, Any]],
+    *,
+    chunk_size: int = BULK_CREATE_CHUNK,
+    workers: int = BULK_WORKERS,
+) -> List[Dict[str, Any]]:
+    # issues: create_issue 인자 dict ({"project_key", "summary", "description_text", ...})
+    #         또는 이미 만들어진 {"fields": {...}}
+    specs = list(issues)
+    updates: List[Dict[str, Any]] = [
+        (
+            {"fields": spec["fields"]}
+            if "fields" in spec
+            else {"fields": jira_client.issue_fields(**spec)}
+        )
+        for spec in specs
+    ]
+    url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/bulk"
+    headers = {**jira_client._auth_header(), "Content-Type": "application/json"}
+    chunk_size = max(1, min(chunk_size, BULK_CREATE_CHUNK))
+    chunks = [
+        (start, updates[start : start + chunk_size])
+        for start in range(0, len(updates), chunk_size)
+    ]
+
+    def _create_chunk(start: int, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        try:
+            r = _request(
+                "POST",
+                url,
+                "bulk_create",
+                headers=headers,
+                json={"issueUpdates": chunk},
+            )
+        except Exception as e:
+            err = f"{type(e).__name__}: {e}"
+            return [
+                _item(start + i, None, ok=False, error=err) for i in range(len(chunk))
+            ]
+        try:
+            body = r.json()
+        except ValueError:
+            body = {}
+        # 일괄 응답은 errors가 리스트, 요청 자체가 거부되면 일반 오류 형식(dict)
+        if not isinstance(body, dict) or (
+            r.status_code >= 400 and not isinstance(body.get("errors"), list)
+        ):
+            err = _error_text(r)
+            return [
+                _item(start + i, None, ok=False, status=r.status_code, error=err)
+                for i in range(len(chunk))
+            ]
+        # errors[].failedElementNumber는 청크 내 위치, 성공 이슈는 남은 위치에 순서대로 대응
+        failed: Dict[int, str] = {}
+        for e in body.get("errors") or []:
+            n = e.get("failedElementNumber")
+            if n is None:
+                continue
+            detail = e.get("elementErrors") or {}
+            messages = list(detail.get("errorMessages") or [])
+            messages += [f"{k}: {v}" for k, v in (detail.get("errors") or {}).items()]
+            failed[int(n)] = "; ".join(messages) or f"HTTP {e.get('status')}"
+        created = iter(body.get("issues") or [])
+        out: List[Dict[str, Any]] = []
+        for i in range(len(chunk)):
+            if i in failed:
+                out.append(
+                    _item(
+                        start + i, None, ok=False, status=r.status_code, error=failed[i]
+                    )
+                )
+                continue
+            issue = next(created, None)
+            if issue is None:
+                out.append(
+                    _item(
+                        start + i,
+                        None,
+                        ok=False,
+                        status=r.status_code,
+                        error="missing from bulk response",
+                    )
+                )
+            else:
+                out.append(
+                    _item(
+                        start + i,
+                        issue.get("key"),
+                        ok=True,
+                        status=r.status_code,
+                        result=issue,
+                    )
+                )
+        return out
+
+    if not chunks:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+        futures = [pool.submit(_create_chunk, start, chunk) for start, chunk in chunks]
+        return [item for f in futures for item in f.result()]
+
+
+def bulk_add_comments(
+    comments: Iterable[Tuple[str, str]], *, workers: int = BULK_WORKERS
+) -> List[Dict[str, Any]]:
+    # comments: (issue_key, body)
+    headers = {**jira_client._auth_header(), "Content-Type": "application/json"}
+
+    def _comment(issue_key: str, body: str) -> requests.Response:
+        url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/{issue_key}/comment"
+        return _request(
+            "POST", url, "add_comment", headers=headers, json={"body": body}
+        )
+
+    return _run_each(list(comments), _comment, workers)
+
+
+def bulk_transition(
+    transitions: Iterable[Tuple[str, str]], *, workers: int = BULK_WORKERS
+) -> List[Dict[str, Any]]:
+    # transitions: (issue_key, transition_id)
+    headers = {**jira_client._auth_header(), "Content-Type": "application/json"}
+
+    def _transition(issue_key: str, transition_id: str) -> requests.Response:
+        url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/{issue_key}/transitions"
+        return _request(
+            "POST",
+            url,
+            "do_transition",
+            headers=headers,
+            json={"transition": {"id": transition_id}},
+        )
+
+    return _run_each(list(transitions), _transition, workers)
+
+
+def bulk_upload_attachments(
+    attachments: Iterable[Tuple[str, str]],
+    *,
+    workers: int = BULK_WORKERS,
+    retries: int = BULK_MAX_RETRIES,
+    on_progress: Optional[UploadProgress] = None,
+) -> List[Dict[str, Any]]:
+    # attachments: (issue_key, filepath) - 여러 이슈/파일 조합 가능
+    # 파일마다 multipart 본문을 스트리밍으로 보내고, 연결 오류 / 5xx면 그 파일만 처음부터 재시도
+    # (429/503은 _request가 이미 재시도했으므로 여기서는 그대로 결과로 돌려줌)
+    # on_progress(index, issue_key, filepath, sent_bytes, total_bytes)
+    headers = {**jira_client._auth_header(), "X-Atlassian-Token": "no-check"}
+
+    def _upload(issue_key: str, arg: Tuple[int, str]) -> requests.Response:
+        index, filepath = arg
+        url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/{issue_key}/attachments"
+
+        def _progress(sent: int, total: int) -> None:
+            on_progress(index, issue_key, filepath, sent, total)
+
+        with MultipartFileBody(
+            filepath, on_progress=_progress if on_progress is not None else None
+        ) as body:
+            upload_headers = {**headers, "Content-Type": body.content_type}
+            for attempt in range(retries + 1):
+                try:
+                    r = _request(
+                        "POST",
+                        url,
+                        "upload_attachment",
+                        headers=upload_headers,
+                        data=body,
+                    )
+                    if (
+                        r.status_code < 500
+                        or r.status_code in _RETRY_STATUSES
+                        or attempt == retries
+                    ):
+                        return r
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == retries:
+                        raise
+                metrics.inc("attachment_upload_retries_total")
+                time.sleep(min(0.5 * (2**attempt), 10.0))
+        return r
+
+    items = [(key, (i, path)) for i, (key, path) in enumerate(attachments)]
+    return _run_each(items, _upload, workers)
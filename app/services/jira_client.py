@@ -2,12 +2,24 @@ import base64
 import os
 import json
 import requests
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.services import metrics
+from app.services.json_stream import iter_json_array
+from app.services.multipart import MultipartFileBody
 
 JIRA_BASE = os.getenv("JIRA_BASE", "https://mirrorroidkorea.atlassian.net/")
 JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 
+# 스트리밍 검색: 페이지 크기(JIRA Cloud 상한 100)와 응답 청크 크기
+SEARCH_PAGE_SIZE = int(os.getenv("JIRA_SEARCH_PAGE_SIZE", "100"))
+SEARCH_CHUNK_SIZE = int(os.getenv("JIRA_SEARCH_CHUNK_SIZE", "65536"))
+# 사용자 검색 페이지 크기 (API 상한 1000)
+USER_PAGE_SIZE = int(os.getenv("JIRA_USER_PAGE_SIZE", "1000"))
+# 검색 요청 타임아웃(초). 없으면 JIRA가 응답하지 않을 때 호출 스레드가 무기한 묶임
+SEARCH_TIMEOUT = float(os.getenv("JIRA_SEARCH_TIMEOUT", "60"))
+
 
 def _auth_header(
     email: Optional[str] = JIRA_EMAIL, api_token: Optional[str] = JIRA_API_TOKEN
@@ -20,7 +32,13 @@ def _auth_header(
     return {"Authorization": f"Basic {token}", "Accept": "application/json"}
 
 
-def create_issue(
+def _observe(r: requests.Response, op: str) -> requests.Response:
+    metrics.inc("jira_requests_total", op=op, status=r.status_code)
+    metrics.inc("jira_response_bytes_total", len(r.content), op=op)
+    return r
+
+
+def issue_fields(
     project_key: str,
     summary: str,
     description_text: str,
@@ -28,8 +46,7 @@ def create_issue(
     assignee_account_id: Optional[str] = None,
     labels: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
-    url = f"{JIRA_BASE}/rest/api/3/issue"
-    headers = {**_auth_header(), "Content-Type": "application/json"}
+    # create_issue / 일괄 생성(jira_bulk)에서 같이 쓰는 fields 페이로드
     description = {
         "type": "doc",
         "version": 1,
@@ -40,19 +57,40 @@ def create_issue(
             }
         ],
     }
-    payload: Dict[str, Any] = {
-        "fields": {
-            "project": {"key": project_key},
-            "summary": summary,
-            "issuetype": {"name": issuetype},
-            "description": description,
-        }
+    fields: Dict[str, Any] = {
+        "project": {"key": project_key},
+        "summary": summary,
+        "issuetype": {"name": issuetype},
+        "description": description,
     }
     if assignee_account_id:
-        payload["fields"]["assignee"] = {"id": assignee_account_id}
+        fields["assignee"] = {"id": assignee_account_id}
     if labels:
-        payload["fields"]["labels"] = labels
-    r = requests.post(url, headers=headers, json=payload)
+        fields["labels"] = labels
+    return fields
+
+
+def create_issue(
+    project_key: str,
+    summary: str,
+    description_text: str,
+    issuetype: str = "Bug",
+    assignee_account_id: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    url = f"{JIRA_BASE}/rest/api/3/issue"
+    headers = {**_auth_header(), "Content-Type": "application/json"}
+    payload: Dict[str, Any] = {
+        "fields": issue_fields(
+            project_key,
+            summary,
+            description_text,
+            issuetype=issuetype,
+            assignee_account_id=assignee_account_id,
+            labels=labels,
+        )
+    }
+    r = _observe(requests.post(url, headers=headers, json=payload), "create_issue")
     r.raise_for_status()
     return r.json()
 
@@ -72,22 +110,106 @@ def search_issues(
     }
     if fields:
         payload["fields"] = fields
-    r = requests.post(url, headers=headers, json=payload)
+    r = _observe(
+        requests.post(url, headers=headers, json=payload, timeout=SEARCH_TIMEOUT),
+        "search",
+    )
     r.raise_for_status()
     return r.json()
 
 
+def _iter_body(r: requests.Response, op: str) -> Iterator[bytes]:
+    # 스트리밍 응답은 r.content를 만들지 않으므로 받은 청크 크기로 바이트 수를 집계
+    for chunk in r.iter_content(chunk_size=SEARCH_CHUNK_SIZE):
+        metrics.inc("jira_response_bytes_total", len(chunk), op=op)
+        yield chunk
+
+
+def iter_search_issues(
+    jql: str,
+    fields: Optional[List[str]] = None,
+    *,
+    start_at: int = 0,
+    max_results: Optional[int] = None,
+    page_size: int = SEARCH_PAGE_SIZE,
+    expand: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    # 페이지를 차례로 요청하고 각 응답의 issues 배열을 이슈 단위로 디코딩
+    # -> 메모리에는 한 번에 이슈 하나(+ 청크 하나)만 올라감
+    url = f"{JIRA_BASE}/rest/api/3/search"
+    headers = {**_auth_header(), "Content-Type": "application/json"}
+    fetched = 0
+    while max_results is None or fetched < max_results:
+        want = (
+            page_size if max_results is None else min(page_size, max_results - fetched)
+        )
+        payload: Dict[str, Any] = {
+            "jql": jql,
+            "startAt": start_at + fetched,
+            "maxResults": want,
+        }
+        if fields:
+            payload["fields"] = fields
+        if expand:
+            payload["expand"] = expand
+        meta: Dict[str, Any] = {}
+        with requests.post(
+            url, headers=headers, json=payload, stream=True, timeout=SEARCH_TIMEOUT
+        ) as r:
+            metrics.inc("jira_requests_total", op="search", status=r.status_code)
+            r.raise_for_status()
+            count = 0
+            for issue in iter_json_array(_iter_body(r, "search"), "issues", meta):
+                count += 1
+                yield issue
+        fetched += count
+        # 서버가 maxResults를 더 작게 잘라 줄 수 있으므로 실제 페이지 크기로 판단
+        page_limit = min(want, int(meta.get("maxResults") or want))
+        total = meta.get("total")
+        if count == 0 or count < page_limit:
+            break
+        if total is not None and start_at + fetched >= int(total):
+            break
+
+
+def iter_issue_changelog(
+    issue_key: str, *, start_at: int = 0, page_size: int = SEARCH_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    # 검색의 expand=changelog는 이슈당 최근 이력 일부만 주므로 나머지는 이 API로 페이지 조회
+    url = f"{JIRA_BASE}/rest/api/3/issue/{issue_key}/changelog"
+    headers = _auth_header()
+    while True:
+        r = _observe(
+            requests.get(
+                url,
+                headers=headers,
+                params={"startAt": start_at, "maxResults": page_size},
+                timeout=SEARCH_TIMEOUT,
+            ),
+            "get_changelog",
+        )
+        r.raise_for_status()
+        page = r.json()
+        values = page.get("values") or []
+        yield from values
+        start_at += len(values)
+        if not values or page.get("isLast", True):
+            break
+
+
 def add_comment(issue_key: str, body: str) -> Dict[str, Any]:
     url = f"{JIRA_BASE}/rest/api/3/issue/{issue_key}/comment"
     headers = {**_auth_header(), "Content-Type": "application/json"}
-    r = requests.post(url, headers=headers, json={"body": body})
+    r = _observe(
+        requests.post(url, headers=headers, json={"body": body}), "add_comment"
+    )
     r.raise_for_status()
     return r.json()
 
 
 def get_transitions(issue_key: str) -> List[Dict[str, Any]]:
     url = f"{JIRA_BASE}/rest/api/3/issue/{issue_key}/transitions"
-    r = requests.get(url, headers=_auth_header())
+    r = _observe(requests.get(url, headers=_auth_header()), "get_transitions")
     r.raise_for_status()
     return r.json()["transitions"]
 
@@ -95,51 +217,73 @@ def get_transitions(issue_key: str) -> List[Dict[str, Any]]:
 def do_transition(issue_key: str, transition_id: str) -> bool:
     url = f"{JIRA_BASE}/rest/api/3/issue/{issue_key}/transitions"
     headers = {**_auth_header(), "Content-Type": "application/json"}
-    r = requests.post(url, headers=headers, json={"transition": {"id": transition_id}})
+    r = _observe(
+        requests.post(url, headers=headers, json={"transition": {"id": transition_id}}),
+        "do_transition",
+    )
     r.raise_for_status()
     return r.status_code == 204
 
 
-def upload_attachment(issue_key: str, filepath: str) -> Dict[str, Any]:
+def upload_attachment(
+    issue_key: str,
+    filepath: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    # multipart 본문을 스트리밍으로 전송 (파일 전체를 메모리에 올리지 않음)
     url = f"{JIRA_BASE}/rest/api/3/issue/{issue_key}/attachments"
-    headers = {**_auth_header(), "X-Atlassian-Token": "no-check"}
-    with open(filepath, "rb") as f:
-        files = {"file": (os.path.basename(filepath), f)}
-        r = requests.post(url, headers=headers, files=files)
+    with MultipartFileBody(filepath, on_progress=on_progress) as body:
+        headers = {
+            **_auth_header(),
+            "X-Atlassian-Token": "no-check",
+            "Content-Type": body.content_type,
+        }
+        r = _observe(
+            requests.post(url, headers=headers, data=body), "upload_attachment"
+        )
     r.raise_for_status()
     return r.json()
 
 
 def get_projects() -> List[Dict[str, Any]]:
     url = f"{JIRA_BASE}/rest/api/3/project"
-    r = requests.get(url, headers=_auth_header())
+    r = _observe(requests.get(url, headers=_auth_header()), "get_projects")
     r.raise_for_status()
     return r.json()
 
 
+def _iter_user_pages(
+    url: str, params: Dict[str, Any], op: str, page_size: int = USER_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    # 사용자 검색 API는 배열만 돌려주므로 빈 페이지가 나올 때까지 startAt을 넘김
+    # (권한 필터링 때문에 끝이 아니어도 maxResults보다 짧은 페이지가 올 수 있음)
+    headers = _auth_header()
+    start_at = 0
+    while True:
+        page_params = {**params, "startAt": start_at, "maxResults": page_size}
+        r = _observe(requests.get(url, headers=headers, params=page_params), op)
+        r.raise_for_status()
+        page = r.json()
+        if not page:
+            break
+        yield from page
+        # 걸러진 사용자도 startAt 위치를 차지하므로 요청한 페이지 크기만큼 넘김
+        start_at += page_size
+
+
 def get_users() -> List[Dict[str, Any]]:
     url = f"{JIRA_BASE}/rest/api/3/users/search"
-    headers = _auth_header()
-    params = {"maxResults": 1000}
-    r = requests.get(url, headers=headers, params=params)
-    r.raise_for_status()
-    users = r.json()
     return [
         {"accountId": u.get("accountId"), "displayName": u.get("displayName")}
-        for u in users
+        for u in _iter_user_pages(url, {}, "get_users")
         if u.get("accountType") == "atlassian"
     ]
 
 
 def get_project_members(project_key: str) -> List[Dict[str, Any]]:
     url = f"{JIRA_BASE}/rest/api/3/user/assignable/search"
-    headers = _auth_header()
-    params = {"project": project_key, "maxResults": 1000}
-    r = requests.get(url, headers=headers, params=params)
-    r.raise_for_status()
-    members = r.json()
     return [
         {"accountId": m.get("accountId"), "displayName": m.get("displayName")}
-        for m in members
+        for m in _iter_user_pages(url, {"project": project_key}, "get_project_members")
         if m.get("accountType") == "atlassian"
     ]
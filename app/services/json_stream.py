@@ -0,0 +1,118 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# 응답 전체를 r.json()으로 올리지 않고 최상위 객체의 배열 하나를 원소 단위로 디코딩
+#
+#   meta = {}
+#   for issue in iter_json_array(r.iter_content(65536), "issues", meta):
+#       ...
+#   meta -> {"startAt": 0, "maxResults": 100, "total": 1234}  (배열 외 최상위 값)
+
+_WS = " \t\n\r"
+_COMPACT_AT = 1 << 16
+
+
+class _Buffer:
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        # 다음 청크를 붙임. 소비한 앞부분은 버려서 버퍼가 원소 하나 크기로 유지되게 함
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            text = self._decoder.decode(chunk)
+            if not text:
+                continue
+            if self.pos >= _COMPACT_AT or self.pos == len(self.text):
+                self.text = self.text[self.pos :]
+                self.pos = 0
+            self.text += text
+            return True
+        self.eof = True
+        tail = self._decoder.decode(b"", final=True)
+        if tail:
+            self.text += tail
+            return True
+        return False
+
+    def peek(self) -> str:
+        # 공백을 건너뛰고 다음 문자 반환 (끝이면 "")
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WS:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(
+                f"JSON stream: expected {ch!r} but got {got or 'EOF'!r} at {self.pos}"
+            )
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        # 값 하나를 디코딩. 청크 경계에서 잘렸으면 더 읽고 다시 시도
+        self.peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # 숫자/리터럴은 버퍼 끝에서 잘려도 성공하므로 끝에 닿았으면 한 번 더 읽음
+            if end == len(self.text) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: str, meta: Optional[Dict[str, Any]] = None
+) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buf = _Buffer(chunks)
+    buf.expect("{")
+    first = True
+    while True:
+        ch = buf.peek()
+        if ch == "}":
+            buf.pos += 1
+            return
+        if not first:
+            buf.expect(",")
+        first = False
+        name = buf.value(decoder)
+        buf.expect(":")
+        if name != key:
+            value = buf.value(decoder)
+            if meta is not None:
+                meta[name] = value
+            continue
+        buf.expect("[")
+        if buf.peek() == "]":
+            buf.pos += 1
+            continue
+        while True:
+            yield buf.value(decoder)
+            ch = buf.peek()
+            buf.pos += 1
+            if ch == "]":
+                break
+            if ch != ",":
+                raise ValueError(
+                    f"JSON stream: expected ',' or ']' but got {ch or 'EOF'!r}"
+                )
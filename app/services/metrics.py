@@ -0,0 +1,197 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 프로세스 단위 메트릭 레지스트리 (Prometheus text format으로 노출)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_HELP: Dict[str, str] = {
+    "http_request_duration_seconds": "HTTP request duration",
+    "timeline_stage_duration_seconds": "Duration of timeline pipeline stages",
+    "jira_requests_total": "JIRA REST calls",
+    "jira_response_bytes_total": "Bytes received from JIRA",
+    "sqlite_queries_total": "SQLite statements executed",
+    "overlay_key_lookup_total": "Overlay key-set lookups by strategy (in_list / json_each)",
+    "cache_hits_total": "Shared cache hits",
+    "cache_misses_total": "Shared cache misses",
+    "cache_purged_total": "Expired shared cache entries deleted",
+    "reference_refresh_total": "Reference data refreshes from JIRA",
+    "reference_refresh_duration_seconds": "Reference data refresh duration",
+    "transition_resolver_live_total": "Live get_transitions lookups by the resolver",
+    "transition_resolver_stale_total": "Cached transition ids rejected by JIRA",
+    "attachment_upload_retries_total": "Attachment uploads retried after a failure",
+    "changelog_sync_total": "Changelog syncs from JIRA by status",
+    "changelog_sync_duration_seconds": "Changelog sync duration",
+    "changelog_issues_synced_total": "Issues ingested by changelog syncs",
+    "dependency_graph_builds_total": "Dependency graph topological orders by result (hit / patched / rebuilt)",
+    "background_refresh_total": "Background view refreshes by status (ok / error / joined)",
+    "background_refresh_duration_seconds": "Background view refresh duration",
+    "timeline_budget_exceeded_total": "Timeline responses served past the latency budget (stale / partial / unavailable)",
+}
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+_counters: Dict[str, Dict[_LabelKey, float]] = {}
+_histograms: Dict[str, Dict[_LabelKey, List[float]]] = {}
+
+# 요청 단위 통계 (stage별 ms, 카운터)
+_request_stats: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar("request_stats", default=None)
+)
+
+
+def _label_key(labels: Dict[str, Any]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels: Any) -> None:
+    key = _label_key(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + value
+    stats = _request_stats.get()
+    if stats is not None:
+        counters = stats["counters"]
+        counters[name] = counters.get(name, 0) + value
+
+
+def observe(
+    name: str, value: float, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels: Any
+) -> None:
+    key = _label_key(labels)
+    idx = bisect.bisect_left(buckets, value)
+    with _lock:
+        series = _histograms.setdefault(name, {})
+        # [bucket_0, ..., bucket_n-1, +Inf, sum]
+        h = series.get(key)
+        if h is None:
+            h = [0.0] * (len(buckets) + 2)
+            series[key] = h
+        h[idx] += 1
+        h[-1] += value
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        observe("timeline_stage_duration_seconds", dt, stage=name)
+        stats = _request_stats.get()
+        if stats is not None:
+            stages = stats["stages"]
+            stages[name] = stages.get(name, 0.0) + dt * 1000.0
+
+
+def begin_request() -> contextvars.Token:
+    return _request_stats.set({"stages": {}, "counters": {}})
+
+
+def end_request(token: Optional[contextvars.Token] = None) -> Dict[str, Any]:
+    stats = _request_stats.get() or {"stages": {}, "counters": {}}
+    if token is not None:
+        _request_stats.reset(token)
+    else:
+        _request_stats.set(None)
+    return stats
+
+
+def merge_request_stats(stats: Optional[Dict[str, Any]]) -> None:
+    # 다른 스레드에서 끝난 작업의 요청 단위 통계를 현재 요청에 더함 (전역 메트릭은 이미 기록됨)
+    current = _request_stats.get()
+    if current is None or not stats:
+        return
+    for part in ("stages", "counters"):
+        into = current[part]
+        for k, v in stats[part].items():
+            into[k] = into.get(k, 0) + v
+
+
+def current_request_stats() -> Optional[Dict[str, Any]]:
+    return _request_stats.get()
+
+
+def format_request_stats(stats: Dict[str, Any]) -> str:
+    parts: List[str] = []
+    stages = stats.get("stages") or {}
+    if stages:
+        parts.append("stages=" + ",".join(f"{k}:{v:.1f}ms" for k, v in stages.items()))
+    for k, v in (stats.get("counters") or {}).items():
+        short = k[: -len("_total")] if k.endswith("_total") else k
+        parts.append(f"{short}={int(v)}")
+    return " ".join(parts)
+
+
+def _fmt_labels(key: _LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _fmt_value(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(v)
+
+
+def render_prometheus(buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> str:
+    lines: List[str] = []
+    with _lock:
+        counters = {n: dict(s) for n, s in _counters.items()}
+        histograms = {
+            n: {k: list(h) for k, h in s.items()} for n, s in _histograms.items()
+        }
+
+    for name in sorted(counters):
+        lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+        lines.append(f"# TYPE {name} counter")
+        for key, v in sorted(counters[name].items()):
+            lines.append(f"{name}{_fmt_labels(key)} {_fmt_value(v)}")
+
+    for name in sorted(histograms):
+        lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, h in sorted(histograms[name].items()):
+            cumulative = 0.0
+            for le, n in zip(buckets, h):
+                cumulative += n
+                lines.append(
+                    f"{name}_bucket{_fmt_labels(key, ('le', repr(le)))} {_fmt_value(cumulative)}"
+                )
+            cumulative += h[len(buckets)]
+            lines.append(
+                f"{name}_bucket{_fmt_labels(key, ('le', '+Inf'))} {_fmt_value(cumulative)}"
+            )
+            lines.append(f"{name}_sum{_fmt_labels(key)} {h[-1]!r}")
+            lines.append(f"{name}_count{_fmt_labels(key)} {_fmt_value(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
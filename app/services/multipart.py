@@ -0,0 +1,114 @@
+import mimetypes
+import os
+import uuid
+from typing import IO, Callable, Iterator, Optional
+
+# 파일 하나짜리 multipart/form-data 본문을 스트리밍으로 생성
+# requests에 data=로 넘기면 __len__으로 Content-Length를 잡고 read()로 조금씩 읽어 보낸다
+# -> 파일 크기와 무관하게 메모리는 청크 하나
+#
+#   with MultipartFileBody(path) as body:
+#       requests.post(url, data=body, headers={"Content-Type": body.content_type})
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", "%0D%0A")
+
+
+class MultipartFileBody:
+    def __init__(
+        self,
+        path: str,
+        *,
+        field: str = "file",
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        self.path = path
+        self.boundary = uuid.uuid4().hex
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        filename = filename or os.path.basename(path)
+        ctype = (
+            content_type
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream"
+        )
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field)}"; '
+            f'filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {ctype}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self.file_size = os.path.getsize(path)
+        self.total = len(self._head) + self.file_size + len(self._tail)
+        self._f: Optional[IO[bytes]] = None
+        self._pos = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __enter__(self) -> "MultipartFileBody":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        # 재시도 시 처음부터 다시 보낼 수 있도록 되감기만 지원
+        if offset != 0 or whence != 0:
+            raise OSError("MultipartFileBody can only be rewound to 0")
+        self._pos = 0
+        if self._f is not None:
+            self._f.seek(0)
+        return 0
+
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.total - self._pos
+        out = bytearray()
+        head_len = len(self._head)
+        body_end = head_len + self.file_size
+        while len(out) < size and self._pos < self.total:
+            want = size - len(out)
+            if self._pos < head_len:
+                part = self._head[self._pos : self._pos + want]
+            elif self._pos < body_end:
+                if self._f is None:
+                    self._f = open(self.path, "rb")
+                    self._f.seek(self._pos - head_len)
+                part = self._f.read(min(want, body_end - self._pos))
+                if not part:
+                    raise OSError(f"{self.path} shrank while uploading")
+            else:
+                start = self._pos - body_end
+                part = self._tail[start : start + want]
+            out += part
+            self._pos += len(part)
+        if self.on_progress is not None and out:
+            self.on_progress(self._pos, self.total)
+        return bytes(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -1,7 +1,52 @@
 import json
+import os
 import sqlite3
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.services import metrics
+from app.services.file_utils import init_db_once
+
+
+# 이 개수를 넘는 키 목록은 IN (?, ?, ...) 대신 JSON 배열 하나를 json_each로 펼쳐 조회
+# (호스트 파라미터 한도 32766 회피, 문장 준비 비용이 키 수에 비례하지 않음)
+OVERLAY_IN_LIST_MAX = int(os.getenv("OVERLAY_IN_LIST_MAX", "200"))
+
+
+def _count_query(_sql: str) -> None:
+    metrics.inc("sqlite_queries_total", db="overlays")
+
+
+# hidden 값을 Python 진리값(ov.get("hidden"))과 같게 0/1로 정규화
+# 잘못된 JSON이 한 행이라도 있으면 json_extract가 쿼리 전체를 실패시키므로 json_valid로 감쌈
+# (키가 없으면 NULL -> 개인 오버레이가 팀 값을 덮어쓰는지 구분, "true" 같은 문자열도 숨김)
+_HIDDEN_EXPR = (
+    "CASE WHEN json_valid(payload) THEN "
+    "CASE json_type(payload, '$.hidden') "
+    "WHEN 'true' THEN 1 "
+    "WHEN 'false' THEN 0 "
+    "WHEN 'null' THEN 0 "
+    "WHEN 'integer' THEN json_extract(payload, '$.hidden')<>0 "
+    "WHEN 'real' THEN json_extract(payload, '$.hidden')<>0 "
+    "WHEN 'text' THEN json_extract(payload, '$.hidden')<>'' "
+    "WHEN 'array' THEN json_array_length(payload, '$.hidden')>0 "
+    "WHEN 'object' THEN json_extract(payload, '$.hidden')<>'{}' "
+    "END END"
+)
+
+# payload에서 자주 조회하는 필드를 가상 생성 컬럼으로 노출 (인덱스로 SQLite 안에서 필터링)
+# ALTER TABLE ADD COLUMN은 VIRTUAL만 허용되므로 기존 DB와 새 DB 모두 VIRTUAL
+_GENERATED_COLUMNS = [
+    ("hidden", "INTEGER", _HIDDEN_EXPR),
+]
+
+# 이전 버전이 만들었지만 어떤 조회도 쓰지 않는 생성 컬럼 -> 기존 DB에서 제거
+_DROPPED_COLUMNS = ("start_date", "due_date", "color")
+
+# (scope, owner, ...) 조회용 커버링 인덱스 - payload를 읽지 않고 인덱스만으로 응답
+_GENERATED_INDEXES = [
+    ("idx_overlays_hidden", "overlays(scope, owner, hidden, project_key, issue_key)"),
+]
 
 
 class OverlayStore:
@@ -10,9 +55,14 @@ class OverlayStore:
         self._init_db()
 
     def _conn(self):
-        return sqlite3.connect(self.db_path)
+        con = sqlite3.connect(self.db_path)
+        con.set_trace_callback(_count_query)
+        return con
 
     def _init_db(self) -> None:
+        init_db_once("overlays", self.db_path, self._create_schema)
+
+    def _create_schema(self) -> None:
         with self._conn() as con:
             con.execute("PRAGMA journal_mode=WAL;")
             con.execute(
@@ -36,6 +86,70 @@ class OverlayStore:
             con.execute(
                 "CREATE INDEX IF NOT EXISTS idx_overlays_project ON overlays(project_key);"
             )
+            self._migrate_generated_columns(con)
+            # 오버레이 변경 세대 번호 (워커 간 캐시 무효화용)
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS overlay_meta (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                """
+            )
+            con.execute(
+                "INSERT OR IGNORE INTO overlay_meta (name, value) VALUES ('generation', 0);"
+            )
+
+    @staticmethod
+    def _migrate_generated_columns(con) -> None:
+        # table_xinfo는 생성 컬럼(hidden 컬럼)까지 보여줌
+        existing = {row[1] for row in con.execute("PRAGMA table_xinfo(overlays)")}
+        # ALTER로 추가한 컬럼 정의는 sqlite_master의 CREATE 문에 그대로 남음
+        # -> 식이 바뀐 컬럼(이전 hidden)은 지우고 다시 추가
+        (table_sql,) = con.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='overlays'"
+        ).fetchone()
+        stale = [n for n in _DROPPED_COLUMNS if n in existing]
+        for name, col_type, expr in _GENERATED_COLUMNS:
+            if name in existing and f"AS ({expr})" not in table_sql:
+                stale.append(name)
+        if stale:
+            # 인덱스에 걸린 컬럼은 DROP COLUMN이 안 되므로 인덱스부터 지움 (아래에서 다시 만듦)
+            for index_name, _ in _GENERATED_INDEXES:
+                con.execute(f"DROP INDEX IF EXISTS {index_name}")
+            for name in stale:
+                try:
+                    con.execute(f"ALTER TABLE overlays DROP COLUMN {name}")
+                except sqlite3.OperationalError as e:
+                    # 다른 프로세스가 먼저 지운 경우
+                    if "no such column" not in str(e):
+                        raise
+                existing.discard(name)
+        for name, col_type, expr in _GENERATED_COLUMNS:
+            if name in existing:
+                continue
+            try:
+                con.execute(
+                    f"ALTER TABLE overlays ADD COLUMN {name} {col_type} "
+                    f"GENERATED ALWAYS AS ({expr}) VIRTUAL"
+                )
+            except sqlite3.OperationalError as e:
+                # 다른 프로세스가 먼저 추가한 경우
+                if "duplicate column" not in str(e):
+                    raise
+        for index_name, target in _GENERATED_INDEXES:
+            con.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}")
+
+    @staticmethod
+    def _bump_generation(con) -> None:
+        con.execute("UPDATE overlay_meta SET value = value + 1 WHERE name='generation'")
+
+    def generation(self) -> int:
+        with self._conn() as con:
+            row = con.execute(
+                "SELECT value FROM overlay_meta WHERE name='generation'"
+            ).fetchone()
+        return int(row[0]) if row else 0
 
     @staticmethod
     def _now_iso() -> str:
@@ -71,6 +185,7 @@ class OverlayStore:
                 """,
                 (scope, owner_norm, project_key, issue_key, payload_str, now, now),
             )
+            self._bump_generation(con)
 
     def delete_overlay(
         self, *, issue_key: str, scope: str = "team", owner: Optional[str] = None
@@ -81,35 +196,71 @@ class OverlayStore:
                 "DELETE FROM overlays WHERE scope=? AND owner=? AND issue_key=?",
                 (scope, owner_norm, issue_key),
             )
+            self._bump_generation(con)
 
-    def _fetch_overlays(
+    def _where(
         self,
         *,
         scope: str,
         owner: Optional[str] = None,
         issue_keys: Optional[List[str]] = None,
         project_keys: Optional[List[str]] = None,
-    ) -> Dict[str, Dict[str, Any]]:
+        hidden: Optional[bool] = None,
+    ) -> Tuple[str, List[Any]]:
         owner_norm = self._normalize_owner(scope, owner)
         clauses: List[str] = ["scope=?", "owner=?"]
         params: List[Any] = [scope, owner_norm]
         if issue_keys:
-            placeholders = ",".join(["?"] * len(issue_keys))
-            clauses.append(f"issue_key IN ({placeholders})")
-            params.extend(issue_keys)
+            if len(issue_keys) > OVERLAY_IN_LIST_MAX:
+                metrics.inc("overlay_key_lookup_total", strategy="json_each")
+                clauses.append("issue_key IN (SELECT value FROM json_each(?))")
+                params.append(json.dumps(issue_keys, ensure_ascii=False))
+            else:
+                metrics.inc("overlay_key_lookup_total", strategy="in_list")
+                placeholders = ",".join(["?"] * len(issue_keys))
+                clauses.append(f"issue_key IN ({placeholders})")
+                params.extend(issue_keys)
         if project_keys:
             placeholders = ",".join(["?"] * len(project_keys))
             clauses.append(f"project_key IN ({placeholders})")
             params.extend(project_keys)
-        where = " AND ".join(clauses)
+        if hidden is not None:
+            clauses.append("hidden=?" if hidden else "COALESCE(hidden, 0)=0")
+            if hidden:
+                params.append(1)
+        return " AND ".join(clauses), params
+
+    def _fetch_overlays(
+        self,
+        *,
+        con: Optional[sqlite3.Connection] = None,
+        scope: str,
+        owner: Optional[str] = None,
+        issue_keys: Optional[List[str]] = None,
+        project_keys: Optional[List[str]] = None,
+        hidden: Optional[bool] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        where, params = self._where(
+            scope=scope,
+            owner=owner,
+            issue_keys=issue_keys,
+            project_keys=project_keys,
+            hidden=hidden,
+        )
         sql = f"SELECT issue_key, payload FROM overlays WHERE {where}"
+        if con is None:
+            with self._conn() as con:
+                return self._decode_rows(con.execute(sql, params))
+        return self._decode_rows(con.execute(sql, params))
+
+    @staticmethod
+    def _decode_rows(rows) -> Dict[str, Dict[str, Any]]:
         out: Dict[str, Dict[str, Any]] = {}
-        with self._conn() as con:
-            for issue_key, payload_str in con.execute(sql, params):
-                try:
-                    out[issue_key] = json.loads(payload_str)
-                except Exception:
-                    out[issue_key] = {}
+        for issue_key, payload_str in rows:
+            try:
+                out[issue_key] = json.loads(payload_str)
+            except Exception:
+                out[issue_key] = {}
         return out
 
     def get_overlays_merged(
@@ -119,19 +270,62 @@ class OverlayStore:
         project_keys: Optional[List[str]] = None,
         user_owner: Optional[str] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        team = self._fetch_overlays(
-            scope="team", owner=None, issue_keys=issue_keys, project_keys=project_keys
+        # 팀/개인 조회를 한 연결에서 (연결 생성 비용을 한 번만)
+        with self._conn() as con:
+            team = self._fetch_overlays(
+                con=con,
+                scope="team",
+                owner=None,
+                issue_keys=issue_keys,
+                project_keys=project_keys,
+            )
+            user = self._fetch_overlays(
+                con=con,
+                scope="user",
+                owner=user_owner,
+                issue_keys=issue_keys,
+                project_keys=project_keys,
+            )
+        merged = dict(team)
+        for k, v in user.items():
+            merged[k] = {**merged.get(k, {}), **v}
+        return merged
+
+    def hidden_issue_keys(
+        self,
+        *,
+        issue_keys: Optional[List[str]] = None,
+        project_keys: Optional[List[str]] = None,
+        user_owner: Optional[str] = None,
+    ) -> Set[str]:
+        # get_overlays_merged 기준으로 hidden인 이슈 키 (개인 값이 팀 값을 덮어씀)
+        # payload를 디코딩하지 않고 idx_overlays_hidden만 읽음
+        team_where, team_params = self._where(
+            scope="team", issue_keys=issue_keys, project_keys=project_keys, hidden=True
         )
-        user = self._fetch_overlays(
+        user_where, user_params = self._where(
             scope="user",
             owner=user_owner,
             issue_keys=issue_keys,
             project_keys=project_keys,
         )
-        merged = dict(team)
-        for k, v in user.items():
-            merged[k] = {**merged.get(k, {}), **v}
-        return merged
+        with self._conn() as con:
+            keys = {
+                k
+                for (k,) in con.execute(
+                    f"SELECT issue_key FROM overlays WHERE {team_where}", team_params
+                )
+            }
+            for k, hidden in con.execute(
+                f"SELECT issue_key, hidden FROM overlays "
+                f"WHERE {user_where} AND hidden IS NOT NULL",
+                user_params,
+            ):
+                if hidden:
+                    keys.add(k)
+                else:
+                    keys.discard(k)
+        return keys
 
     def export_to_file(self, filepath: str) -> int:
         rows: List[Dict[str, Any]] = []
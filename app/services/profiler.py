@@ -0,0 +1,109 @@
+import cProfile
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# 느린 요청 프로파일링 (opt-in)
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "0") == "1"
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "20"))
+# 0이면 임계값 기반 캡처 비활성화 (디버그 플래그로 요청한 경우만 캡처)
+PROFILE_THRESHOLD_MS = float(os.getenv("PROFILE_THRESHOLD_MS", "2000"))
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+\.prof$")
+
+# cProfile은 동시에 하나만 활성화 (나머지 요청은 프로파일 없이 진행)
+_active = threading.Lock()
+
+
+class ProfileRing:
+    def __init__(
+        self, directory: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES
+    ) -> None:
+        self.directory = directory
+        self.max_files = max_files
+
+    def save(self, prof: cProfile.Profile, *, label: str, duration_ms: float) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        ts = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        uniq = uuid.uuid4().hex[:6]
+        name = f"{ts}_{os.getpid()}_{uniq}_{label}_{int(duration_ms)}ms.prof"
+        path = os.path.join(self.directory, name)
+        tmp = path + ".tmp"
+        prof.dump_stats(tmp)
+        os.replace(tmp, path)
+        self._prune()
+        return name
+
+    def _prune(self) -> None:
+        entries = self.list()
+        for entry in entries[self.max_files :]:
+            try:
+                os.remove(os.path.join(self.directory, entry["name"]))
+            except OSError:
+                pass
+
+    def list(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.directory):
+            return []
+        out: List[Dict[str, Any]] = []
+        for name in os.listdir(self.directory):
+            if not _NAME_RE.match(name):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            out.append({"name": name, "size": st.st_size, "mtime": st.st_mtime})
+        # 최신순
+        out.sort(key=lambda e: e["mtime"], reverse=True)
+        return out
+
+    def path_for(self, name: str) -> Optional[str]:
+        if not _NAME_RE.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+class ProfileResult:
+    def __init__(self) -> None:
+        self.saved_name: Optional[str] = None
+        self.duration_ms: float = 0.0
+        # 이 요청에서 cProfile이 켜져 있는지 (요청 스레드만 측정됨)
+        self.active = False
+
+
+@contextmanager
+def maybe_profile(
+    label: str,
+    *,
+    forced: bool = False,
+    threshold_ms: float = PROFILE_THRESHOLD_MS,
+    ring: Optional[ProfileRing] = None,
+) -> Iterator[ProfileResult]:
+    result = ProfileResult()
+    wanted = PROFILE_ENABLED and (forced or threshold_ms > 0)
+    if not wanted or not _active.acquire(blocking=False):
+        yield result
+        return
+    prof = cProfile.Profile()
+    t0 = time.perf_counter()
+    try:
+        prof.enable()
+        result.active = True
+        try:
+            yield result
+        finally:
+            prof.disable()
+            result.duration_ms = (time.perf_counter() - t0) * 1000.0
+        if forced or result.duration_ms >= threshold_ms:
+            result.saved_name = (ring or ProfileRing()).save(
+                prof, label=label, duration_ms=result.duration_ms
+            )
+    finally:
+        _active.release()
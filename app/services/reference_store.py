@@ -0,0 +1,293 @@
+import logging
+import os
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from app.services import jira_client, metrics
+from app.services.file_utils import init_db_once
+from app.services.refresh_lease import LeaseTable, run_in_background
+
+# 프로젝트 / 사용자 / 프로젝트 멤버 같은 참조 데이터를 overlays.db에 보관하고
+# 오래되면 백그라운드에서 JIRA로부터 갱신
+#
+#   python -m app.services.reference_store [SR AB]   # 즉시 갱신 (cron 용, JIRA_* 환경변수 필요)
+
+REFERENCE_DB_PATH = os.getenv("REFERENCE_DB_PATH", "overlays.db")
+REFERENCE_TTL_SECONDS = int(os.getenv("REFERENCE_TTL_SECONDS", "3600"))
+# 한 워커가 갱신 중일 때 다른 워커가 중복 호출하지 않도록 잡는 lease
+REFERENCE_REFRESH_LEASE = int(os.getenv("REFERENCE_REFRESH_LEASE", "300"))
+
+# 참조 데이터가 아직 채워지지 않았을 때 쓰는 샘플 프로젝트 데이터
+SAMPLE_PROJECTS: List[Dict[str, Any]] = [
+    {
+        "key": "SR",
+        "name": "Sample Project",
+        "projectTypeKey": "software",
+        "simplified": False,
+    },
+    {
+        "key": "AB",
+        "name": "Another Project",
+        "projectTypeKey": "software",
+        "simplified": False,
+    },
+    {
+        "key": "TEST",
+        "name": "Test Project",
+        "projectTypeKey": "software",
+        "simplified": False,
+    },
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _count_query(_sql: str) -> None:
+    metrics.inc("sqlite_queries_total", db="reference")
+
+
+class ReferenceStore:
+    def __init__(self, db_path: str = REFERENCE_DB_PATH) -> None:
+        self.db_path = db_path
+        self.leases = LeaseTable(self._conn, "ref_meta", "name", "refreshed_at")
+        self._init_db()
+
+    def _conn(self):
+        con = sqlite3.connect(self.db_path, timeout=10)
+        con.set_trace_callback(_count_query)
+        return con
+
+    def _init_db(self) -> None:
+        init_db_once("reference", self.db_path, self._create_schema)
+
+    def _create_schema(self) -> None:
+        with self._conn() as con:
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ref_projects (
+                    key TEXT PRIMARY KEY,
+                    id TEXT,
+                    name TEXT NOT NULL,
+                    project_type_key TEXT,
+                    simplified INTEGER NOT NULL DEFAULT 0
+                );
+                """
+            )
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ref_users (
+                    account_id TEXT PRIMARY KEY,
+                    display_name TEXT
+                );
+                """
+            )
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ref_project_members (
+                    project_key TEXT NOT NULL,
+                    account_id TEXT NOT NULL,
+                    display_name TEXT,
+                    PRIMARY KEY (project_key, account_id)
+                );
+                """
+            )
+            # name: 'projects' | 'users' | 'members:<project_key>'
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ref_meta (
+                    name TEXT PRIMARY KEY,
+                    refreshed_at REAL NOT NULL DEFAULT 0
+                );
+                """
+            )
+            self.leases.init_columns(con)
+
+    # --- 조회 ---------------------------------------------------------
+
+    def projects(self) -> List[Dict[str, Any]]:
+        with self._conn() as con:
+            rows = con.execute(
+                "SELECT key, id, name, project_type_key, simplified FROM ref_projects ORDER BY key"
+            ).fetchall()
+        return [
+            {
+                "key": key,
+                "id": pid,
+                "name": name,
+                "projectTypeKey": ptype,
+                "simplified": bool(simplified),
+            }
+            for key, pid, name, ptype, simplified in rows
+        ]
+
+    def users(self) -> List[Dict[str, Any]]:
+        with self._conn() as con:
+            rows = con.execute(
+                "SELECT account_id, display_name FROM ref_users ORDER BY display_name"
+            ).fetchall()
+        return [{"accountId": a, "displayName": d} for a, d in rows]
+
+    def project_members(self, project_key: str) -> List[Dict[str, Any]]:
+        with self._conn() as con:
+            rows = con.execute(
+                """
+                SELECT account_id, display_name FROM ref_project_members
+                WHERE project_key=? ORDER BY display_name
+                """,
+                (project_key,),
+            ).fetchall()
+        return [{"accountId": a, "displayName": d} for a, d in rows]
+
+    # --- 갱신 ---------------------------------------------------------
+
+    def replace_projects(self, projects: List[Dict[str, Any]]) -> None:
+        rows = [
+            (
+                p.get("key"),
+                p.get("id"),
+                p.get("name") or p.get("key"),
+                p.get("projectTypeKey"),
+                1 if p.get("simplified") else 0,
+            )
+            for p in projects
+            if p.get("key")
+        ]
+        with self._conn() as con:
+            con.execute("DELETE FROM ref_projects")
+            con.executemany(
+                """
+                INSERT INTO ref_projects (key, id, name, project_type_key, simplified)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self.leases.mark_done("projects", con)
+
+    def replace_users(self, users: List[Dict[str, Any]]) -> None:
+        rows = [
+            (u["accountId"], u.get("displayName")) for u in users if u.get("accountId")
+        ]
+        with self._conn() as con:
+            con.execute("DELETE FROM ref_users")
+            con.executemany(
+                "INSERT OR REPLACE INTO ref_users (account_id, display_name) VALUES (?, ?)",
+                rows,
+            )
+            self.leases.mark_done("users", con)
+
+    def replace_project_members(
+        self, project_key: str, members: List[Dict[str, Any]]
+    ) -> None:
+        rows = [
+            (project_key, m["accountId"], m.get("displayName"))
+            for m in members
+            if m.get("accountId")
+        ]
+        with self._conn() as con:
+            con.execute(
+                "DELETE FROM ref_project_members WHERE project_key=?", (project_key,)
+            )
+            con.executemany(
+                """
+                INSERT OR REPLACE INTO ref_project_members (project_key, account_id, display_name)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+            self.leases.mark_done(f"members:{project_key}", con)
+
+
+def _run_refresh(store: ReferenceStore, name: str) -> None:
+    kind = name.split(":", 1)[0]
+    t0 = time.perf_counter()
+    try:
+        if name == "projects":
+            store.replace_projects(jira_client.get_projects())
+        elif name == "users":
+            store.replace_users(jira_client.get_users())
+        elif kind == "members":
+            project_key = name.split(":", 1)[1]
+            store.replace_project_members(
+                project_key, jira_client.get_project_members(project_key)
+            )
+        else:
+            raise ValueError(f"unknown reference data: {name}")
+        metrics.inc("reference_refresh_total", kind=kind, status="ok")
+    except Exception as e:
+        # 실패하면 lease를 풀고 backoff 동안 재시도하지 않음 (기존 데이터를 계속 사용)
+        store.leases.mark_failed(name)
+        metrics.inc("reference_refresh_total", kind=kind, status="error")
+        logger.warning("reference refresh failed (%s): %s", name, e)
+        raise
+    finally:
+        metrics.observe(
+            "reference_refresh_duration_seconds", time.perf_counter() - t0, kind=kind
+        )
+
+
+def refresh(name: str, store: Optional[ReferenceStore] = None) -> None:
+    # 동기 갱신 (CLI / 테스트 용). lease와 무관하게 즉시 호출
+    _run_refresh(store or ReferenceStore(), name)
+
+
+def refresh_in_background(
+    name: str, store: Optional[ReferenceStore] = None, force: bool = False
+) -> bool:
+    store = store or ReferenceStore()
+    return run_in_background(
+        store.leases,
+        name,
+        lambda: _run_refresh(store, name),
+        ttl=REFERENCE_TTL_SECONDS,
+        lease=REFERENCE_REFRESH_LEASE,
+        thread_name=f"ref-refresh-{name}",
+        force=force,
+    )
+
+
+def get_cached_projects(
+    store: Optional[ReferenceStore] = None,
+) -> List[Dict[str, Any]]:
+    store = store or ReferenceStore()
+    refresh_in_background("projects", store)
+    return store.projects()
+
+
+def get_cached_users(store: Optional[ReferenceStore] = None) -> List[Dict[str, Any]]:
+    store = store or ReferenceStore()
+    refresh_in_background("users", store)
+    return store.users()
+
+
+def get_cached_project_members(
+    project_key: str, store: Optional[ReferenceStore] = None
+) -> Optional[List[Dict[str, Any]]]:
+    # 프로젝트 목록에 없는 키 -> None (JIRA 호출 / ref_meta 행 생성 없음)
+    store = store or ReferenceStore()
+    known = get_cached_projects(store) or SAMPLE_PROJECTS
+    if project_key not in {p["key"] for p in known}:
+        return None
+    refresh_in_background(f"members:{project_key}", store)
+    return store.project_members(project_key)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    store = ReferenceStore()
+    refresh("projects", store)
+    refresh("users", store)
+    project_keys = argv or [p["key"] for p in store.projects()]
+    for key in project_keys:
+        refresh(f"members:{key}", store)
+    print(
+        f"projects={len(store.projects())} users={len(store.users())} "
+        f"member_lists={len(project_keys)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
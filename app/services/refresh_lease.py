@@ -0,0 +1,153 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+# SQLite 메타 테이블 한 행을 갱신 lease로 사용 (reference_store / changelog_store 공용)
+#
+# - claim: 조건부 UPDATE 한 번 -> 여러 워커 중 하나만 JIRA를 호출
+# - 성공하면 완료 시각을 기록하고 lease / 실패 횟수를 초기화
+# - 실패하면 lease를 풀고 지수 backoff 동안 다시 시도하지 않음
+#   (JIRA 장애 중에 요청마다 새 갱신 스레드가 뜨지 않도록)
+
+REFRESH_BACKOFF_BASE = int(os.getenv("REFRESH_BACKOFF_BASE", "30"))
+REFRESH_BACKOFF_MAX = int(os.getenv("REFRESH_BACKOFF_MAX", "1800"))
+
+
+def backoff_seconds(failures: int) -> float:
+    return min(REFRESH_BACKOFF_BASE * 2 ** max(failures - 1, 0), REFRESH_BACKOFF_MAX)
+
+
+class LeaseTable:
+    # table의 key_column 행마다 done_column(마지막 완료 시각), lease_until, failures, retry_at
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        table: str,
+        key_column: str,
+        done_column: str,
+    ) -> None:
+        self._connect = connect
+        self.table = table
+        self.key_column = key_column
+        self.done_column = done_column
+
+    def init_columns(self, con: sqlite3.Connection) -> None:
+        # CREATE TABLE 뒤에 호출 -> 이전 버전 테이블에는 없는 컬럼만 추가
+        have = {row[1] for row in con.execute(f"PRAGMA table_info({self.table})")}
+        for column, decl in (
+            ("lease_until", "REAL NOT NULL DEFAULT 0"),
+            ("failures", "INTEGER NOT NULL DEFAULT 0"),
+            ("retry_at", "REAL NOT NULL DEFAULT 0"),
+        ):
+            if column not in have:
+                con.execute(f"ALTER TABLE {self.table} ADD COLUMN {column} {decl}")
+
+    def done_at(self, key: str) -> Optional[float]:
+        with self._connect() as con:
+            row = con.execute(
+                f"SELECT {self.done_column} FROM {self.table} WHERE {self.key_column}=?",
+                (key,),
+            ).fetchone()
+        return float(row[0]) if row and row[0] else None
+
+    def is_due(self, key: str, ttl: int) -> bool:
+        # 오래됐고 실패 backoff 중이 아닐 때만 갱신
+        with self._connect() as con:
+            row = con.execute(
+                f"""
+                SELECT {self.done_column}, retry_at FROM {self.table}
+                WHERE {self.key_column}=?
+                """,
+                (key,),
+            ).fetchone()
+        now = time.time()
+        if row is None:
+            return True
+        done, retry_at = row
+        if now < (retry_at or 0):
+            return False
+        return not done or now - done >= ttl
+
+    def claim(self, key: str, lease: int) -> bool:
+        now = time.time()
+        with self._connect() as con:
+            con.execute(
+                f"INSERT OR IGNORE INTO {self.table} ({self.key_column}) VALUES (?)",
+                (key,),
+            )
+            cur = con.execute(
+                f"""
+                UPDATE {self.table} SET lease_until=?
+                WHERE {self.key_column}=? AND lease_until<?
+                """,
+                (now + lease, key, now),
+            )
+            return cur.rowcount == 1
+
+    def mark_done(self, key: str, con: Optional[sqlite3.Connection] = None) -> None:
+        # con을 넘기면 데이터 반영과 같은 트랜잭션에서 기록
+        if con is None:
+            with self._connect() as own:
+                self.mark_done(key, own)
+            return
+        con.execute(
+            f"""
+            INSERT INTO {self.table} ({self.key_column}, {self.done_column})
+            VALUES (?, ?)
+            ON CONFLICT({self.key_column}) DO UPDATE SET
+                {self.done_column}=excluded.{self.done_column},
+                lease_until=0, failures=0, retry_at=0
+            """,
+            (key, time.time()),
+        )
+
+    def mark_failed(self, key: str) -> float:
+        # lease를 풀고 다음 시도 시각을 미룸 -> backoff(초)
+        with self._connect() as con:
+            con.execute(
+                f"INSERT OR IGNORE INTO {self.table} ({self.key_column}) VALUES (?)",
+                (key,),
+            )
+            (failures,) = con.execute(
+                f"SELECT failures FROM {self.table} WHERE {self.key_column}=?", (key,)
+            ).fetchone()
+            delay = backoff_seconds(failures + 1)
+            con.execute(
+                f"""
+                UPDATE {self.table}
+                SET lease_until=0, failures=failures+1, retry_at=?
+                WHERE {self.key_column}=?
+                """,
+                (time.time() + delay, key),
+            )
+        return delay
+
+
+def run_in_background(
+    leases: LeaseTable,
+    key: str,
+    run: Callable[[], object],
+    *,
+    ttl: int,
+    lease: int,
+    thread_name: str,
+    force: bool = False,
+) -> bool:
+    # 오래된 경우에만 lease를 잡고 데몬 스레드에서 실행. 요청 스레드는 기다리지 않음
+    # run은 성공하면 mark_done, 실패하면 mark_failed를 호출하고 예외를 다시 던짐
+    if not force and not leases.is_due(key, ttl):
+        return False
+    if not leases.claim(key, lease):
+        return False
+
+    def _target() -> None:
+        try:
+            run()
+        except Exception:
+            pass
+
+    threading.Thread(target=_target, name=thread_name, daemon=True).start()
+    return True
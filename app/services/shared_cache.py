@@ -0,0 +1,126 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Optional
+
+from app.services import metrics
+
+# 워커 프로세스 간에 공유되는 캐시 (SQLite 파일 기반)
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "cache.db")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+# set() 중 이 간격(초)마다 만료 항목을 지움 (0이면 끄기)
+# view 키에 오버레이 세대가 들어가므로 지우지 않으면 이전 세대 항목이 계속 쌓임
+CACHE_PURGE_INTERVAL = int(os.getenv("CACHE_PURGE_INTERVAL", "300"))
+
+
+def _count_query(_sql: str) -> None:
+    metrics.inc("sqlite_queries_total", db="cache")
+
+
+class SharedCache:
+    def __init__(self, db_path: str = CACHE_DB_PATH) -> None:
+        self.db_path = db_path
+        # 프로세스(인스턴스)마다 따로 간격을 셈 -> 여러 워커가 번갈아 지워도 DELETE는 인덱스 범위만
+        self._next_purge = time.time() + CACHE_PURGE_INTERVAL
+        self._init_db()
+
+    def _conn(self):
+        con = sqlite3.connect(self.db_path, timeout=10)
+        con.set_trace_callback(_count_query)
+        con.execute("PRAGMA synchronous=NORMAL;")
+        return con
+
+    def _init_db(self) -> None:
+        with self._conn() as con:
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                """
+            )
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at);"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._conn() as con:
+            row = con.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key=?", (key,)
+            ).fetchone()
+        namespace = key.split(":", 1)[0]
+        if not row or row[1] < time.time():
+            metrics.inc("cache_misses_total", namespace=namespace)
+            return None
+        try:
+            value = json.loads(row[0])
+        except Exception:
+            metrics.inc("cache_misses_total", namespace=namespace)
+            return None
+        metrics.inc("cache_hits_total", namespace=namespace)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        now = time.time()
+        expires_at = now + (CACHE_TTL_SECONDS if ttl is None else ttl)
+        value_str = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._conn() as con:
+            con.execute(
+                """
+                INSERT INTO cache_entries (key, value, expires_at, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value=excluded.value,
+                    expires_at=excluded.expires_at,
+                    created_at=excluded.created_at
+                """,
+                (key, value_str, expires_at, now),
+            )
+        if CACHE_PURGE_INTERVAL > 0 and now >= self._next_purge:
+            self._next_purge = now + CACHE_PURGE_INTERVAL
+            self.purge_expired()
+
+    def get_or_set(
+        self, key: str, factory: Callable[[], Any], ttl: Optional[int] = None
+    ) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def exists(self, key: str) -> bool:
+        # 값을 읽지 않고 만료 여부만 확인 (큰 값 재기록 방지용)
+        with self._conn() as con:
+            row = con.execute(
+                "SELECT 1 FROM cache_entries WHERE key=? AND expires_at>=?",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def delete(self, key: str) -> None:
+        with self._conn() as con:
+            con.execute("DELETE FROM cache_entries WHERE key=?", (key,))
+
+    def purge_expired(self) -> int:
+        with self._conn() as con:
+            cur = con.execute(
+                "DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),)
+            )
+        metrics.inc("cache_purged_total", cur.rowcount)
+        return cur.rowcount
+
+
+_default_cache: Optional[SharedCache] = None
+
+
+def get_shared_cache() -> SharedCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SharedCache()
+    return _default_cache
@@ -0,0 +1,175 @@
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+from app.controllers.issue_record import IssueRecord
+from app.services import jira_bulk, jira_client, metrics
+from app.services.shared_cache import SharedCache, get_shared_cache
+
+# 워크플로 전환 목록은 (프로젝트, 이슈 타입, 현재 상태)가 같으면 거의 동일하므로
+# 이슈마다 get_transitions를 부르지 않고 이 조합 단위로 캐시해 이름으로 ID를 찾는다.
+# 캐시된 ID가 거부되면(400) 해당 조합을 무효화하고 실시간 조회 후 한 번 재시도.
+
+TRANSITION_CACHE_TTL = int(os.getenv("TRANSITION_CACHE_TTL", "3600"))
+
+IssueRef = Union[IssueRecord, Dict[str, Any], str]
+
+
+def _context(issue: IssueRef) -> Tuple[str, Optional[Tuple[str, str, str]]]:
+    # (issue_key, (project_key, issue_type, status)) - 상태를 모르면 캐시 키 없음
+    if isinstance(issue, str):
+        return issue, None
+    if isinstance(issue, IssueRecord):
+        key, project_key = issue.key, issue.project_key
+        issue_type, status = issue.issue_type, issue.status
+    else:
+        key = issue.get("key", "")
+        project_key = issue.get("project_key") or key.split("-", 1)[0]
+        issue_type, status = issue.get("issue_type"), issue.get("status")
+    if not (project_key and issue_type and status):
+        return key, None
+    return key, (project_key, issue_type, status)
+
+
+def _matches(transition: Dict[str, Any], name: str) -> bool:
+    # 전환 이름("Start Progress") 또는 도착 상태 이름("In Progress") 둘 다 허용
+    wanted = name.strip().casefold()
+    if str(transition.get("id")) == name:
+        return True
+    if (transition.get("name") or "").casefold() == wanted:
+        return True
+    return ((transition.get("to") or {}).get("name") or "").casefold() == wanted
+
+
+class TransitionResolver:
+    def __init__(
+        self,
+        cache: Optional[SharedCache] = None,
+        ttl: int = TRANSITION_CACHE_TTL,
+    ) -> None:
+        self.cache = cache or get_shared_cache()
+        self.ttl = ttl
+        # 조합(캐시 키)별 잠금 -> 같은 조합만 한 번 조회하고 다른 조합은 동시에 조회
+        # 잠금 수는 (프로젝트, 이슈 타입, 상태) 조합 수로 제한됨
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def _key(ctx: Tuple[str, str, str]) -> str:
+        return "transitions:" + ":".join(ctx)
+
+    def _live(
+        self, issue_key: str, ctx: Optional[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        metrics.inc("transition_resolver_live_total")
+        # 일괄 전환 워커와 같은 풀링 세션 (연결 재사용, 429/503 재시도)
+        url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/{issue_key}/transitions"
+        r = jira_bulk._request(
+            "GET", url, "get_transitions", headers=jira_client._auth_header()
+        )
+        r.raise_for_status()
+        transitions = [
+            {
+                "id": str(t.get("id")),
+                "name": t.get("name"),
+                "to": {"name": (t.get("to") or {}).get("name")},
+            }
+            for t in r.json()["transitions"]
+        ]
+        if ctx is not None:
+            self.cache.set(self._key(ctx), transitions, ttl=self.ttl)
+        return transitions
+
+    def transitions_for(self, issue: IssueRef) -> List[Dict[str, Any]]:
+        issue_key, ctx = _context(issue)
+        if ctx is None:
+            return self._live(issue_key, ctx)
+        key = self._key(ctx)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        # 일괄 전환 시작 시 워커들이 같은 조합을 동시에 조회하지 않도록
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            return self._live(issue_key, ctx)
+
+    def invalidate(self, issue: IssueRef) -> None:
+        _issue_key, ctx = _context(issue)
+        if ctx is not None:
+            self.cache.delete(self._key(ctx))
+
+    def resolve(self, issue: IssueRef, name: str, *, live: bool = False) -> str:
+        issue_key, ctx = _context(issue)
+        transitions = (
+            self._live(issue_key, ctx) if live else self.transitions_for(issue)
+        )
+        for t in transitions:
+            if _matches(t, name):
+                return t["id"]
+        if not live and ctx is not None:
+            # 캐시에 없는 이름 -> 워크플로가 바뀌었을 수 있으므로 실시간으로 한 번 더
+            return self.resolve(issue, name, live=True)
+        raise ValueError(f"{issue_key}: no transition named {name!r}")
+
+    def _send(self, issue_key: str, transition_id: str) -> requests.Response:
+        url = f"{jira_client.JIRA_BASE}/rest/api/3/issue/{issue_key}/transitions"
+        headers = {**jira_client._auth_header(), "Content-Type": "application/json"}
+        return jira_bulk._request(
+            "POST",
+            url,
+            "do_transition",
+            headers=headers,
+            json={"transition": {"id": transition_id}},
+        )
+
+    def apply(self, issue: IssueRef, name: str) -> requests.Response:
+        issue_key, ctx = _context(issue)
+        transition_id = self.resolve(issue, name)
+        r = self._send(issue_key, transition_id)
+        if r.status_code == 400 and ctx is not None:
+            # 캐시된 ID가 이 이슈에서 유효하지 않음 -> 무효화 후 실시간 목록으로 재시도
+            metrics.inc("transition_resolver_stale_total")
+            self.invalidate(issue)
+            fresh_id = self.resolve(issue, name, live=True)
+            if fresh_id != transition_id:
+                r = self._send(issue_key, fresh_id)
+        return r
+
+    def transition(self, issue: IssueRef, name: str) -> bool:
+        r = self.apply(issue, name)
+        r.raise_for_status()
+        return r.status_code == 204
+
+
+_resolver: Optional[TransitionResolver] = None
+
+
+def get_transition_resolver() -> TransitionResolver:
+    global _resolver
+    if _resolver is None:
+        _resolver = TransitionResolver()
+    return _resolver
+
+
+def transition_by_name(issue: IssueRef, name: str) -> bool:
+    return get_transition_resolver().transition(issue, name)
+
+
+def bulk_transition_by_name(
+    items: Iterable[Tuple[IssueRef, str]],
+    *,
+    resolver: Optional[TransitionResolver] = None,
+    workers: int = jira_bulk.BULK_WORKERS,
+) -> List[Dict[str, Any]]:
+    # items: (IssueRecord | {"key", "project_key", "issue_type", "status"} | key, 전환 이름)
+    resolver = resolver or get_transition_resolver()
+    pairs = [(_context(issue)[0], (issue, name)) for issue, name in items]
+    return jira_bulk._run_each(
+        pairs, lambda _key, arg: resolver.apply(arg[0], arg[1]), workers
+    )
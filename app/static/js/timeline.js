@@ -80,8 +80,211 @@ function clearAllProjects() {
   updateProjectInput();
 }
 
+// 디버그 덤프는 ?debug=1 또는 localStorage.timelineDebug = "1" 일 때만
+// (DataSet.get()은 전체 데이터를 다시 만들기 때문에 기본으로는 호출하지 않음)
+const TIMELINE_DEBUG =
+  new URLSearchParams(window.location.search).has("debug") ||
+  (window.localStorage && localStorage.getItem("timelineDebug") === "1");
+
+function debugDump(label, producer) {
+  if (TIMELINE_DEBUG) console.log(label, producer());
+}
+
+// 한 프레임에서 DataSet 반영에 쓸 시간 (ms) - 넘으면 다음 프레임으로
+const FRAME_BUDGET_MS = 8;
+
+// 서버가 stale / partial view로 응답했을 때 다시 요청하기까지의 대기 (시도마다 늘림)
+const REVALIDATE_DELAY_MS = 5000;
+const REVALIDATE_MAX_ATTEMPTS = 3;
+
+// 데이터 준비 워커 (timeline.js와 같은 디렉터리)
+const WORKER_URL = new URL(
+  "timeline.worker.js",
+  document.currentScript.src
+).toString();
+
+let dataWorker = null; // null: 아직 생성 전, false: 사용 불가 (메인 스레드로 처리)
+let loadSeq = 0;
+let activeLoad = null;
+
+// 현재 화면의 타임라인 (델타를 제자리에서 적용하기 위해 보관)
+let currentTimeline = null;
+
+// 워커 메시지를 프레임 단위로 나눠 반영하는 작업 큐
+let frameTasks = [];
+let frameScheduled = false;
+
+function getDataWorker() {
+  if (dataWorker === null) {
+    try {
+      dataWorker = new Worker(WORKER_URL);
+      dataWorker.onmessage = (e) => handleDataMessage(e.data);
+      dataWorker.onerror = (e) => {
+        // 워커 스크립트를 불러오지 못한 경우 등 -> 메인 스레드로 다시 시도
+        console.warn("데이터 워커 오류, 메인 스레드에서 처리합니다:", e.message);
+        e.preventDefault();
+        dataWorker.terminate();
+        dataWorker = false;
+        if (activeLoad && !activeLoad.painted) {
+          startLoad(activeLoad.url, activeLoad.key, activeLoad.options);
+        }
+      };
+    } catch (error) {
+      console.warn("Web Worker를 사용할 수 없습니다:", error);
+      dataWorker = false;
+    }
+  }
+  return dataWorker || null;
+}
+
+// url: 절대 URL 문자열, key: view 캐시 키 (null이면 캐시 사용 안 함)
+// options: {fresh, revalidate, attempt, errorLabel, onSuccess}
+function startLoad(url, key, options = {}) {
+  const id = ++loadSeq;
+  // 재검증은 이미 그려진 화면 위에서 진행 -> 실패해도 화면을 오류 메시지로 덮지 않음
+  activeLoad = { id, url, key, options, painted: !!options.revalidate };
+  frameTasks = [];
+
+  const worker = getDataWorker();
+  if (worker) {
+    worker.postMessage({
+      op: "load",
+      id,
+      url,
+      key,
+      fresh: !!options.fresh,
+      revalidate: !!options.revalidate,
+    });
+    return;
+  }
+  loadView(url, key, (msg) => handleDataMessage({ ...msg, id }), {
+    fresh: !!options.fresh,
+    revalidate: !!options.revalidate,
+  }).catch((error) =>
+    handleDataMessage({ id, type: "error", message: error.message })
+  );
+}
+
+function handleDataMessage(msg) {
+  const load = activeLoad;
+  // 이전 요청의 늦은 응답은 버림
+  if (!load || msg.id !== load.id) return;
+
+  switch (msg.type) {
+    case "view":
+      frameTasks = [];
+      beginTimeline(msg, load);
+      break;
+    case "items":
+      queueFrameTask(() => addTimelineItems(msg.items));
+      break;
+    case "done":
+      queueFrameTask(() => finishTimeline(msg, load));
+      if (msg.source === "network") {
+        queueFrameTask(() => noteFreshness(msg, load));
+      }
+      break;
+    case "delta":
+      queueFrameTask(() => applyTimelineDelta(msg, load));
+      queueFrameTask(() => noteFreshness(msg, load));
+      break;
+    case "error":
+      console.error(`${load.options.errorLabel} 중 오류 발생:`, msg.message);
+      // 캐시된 view를 이미 그렸으면 그대로 둠
+      if (!load.painted) {
+        showMessage(
+          "error-message",
+          `${load.options.errorLabel} 중 오류가 발생했습니다: ${msg.message}`
+        );
+      }
+      break;
+  }
+}
+
+function queueFrameTask(task) {
+  frameTasks.push(task);
+  if (frameScheduled) return;
+  frameScheduled = true;
+  requestAnimationFrame(runFrameTasks);
+}
+
+function runFrameTasks() {
+  frameScheduled = false;
+  const started = performance.now();
+  while (frameTasks.length) {
+    frameTasks.shift()();
+    if (performance.now() - started > FRAME_BUDGET_MS) break;
+  }
+  if (frameTasks.length) {
+    frameScheduled = true;
+    requestAnimationFrame(runFrameTasks);
+  }
+}
+
+// 지연 예산을 넘긴 응답(stale / partial)이면 안내를 띄우고 잠시 뒤 다시 요청
+function noteFreshness(msg, load) {
+  const info = msg.degraded;
+  if (!info) {
+    showFreshnessNotice(null);
+    return;
+  }
+  // 전체 view로 받은 부분 결과만 화면이 불완전함. 델타의 partial은 기존 화면을 그대로 둔 것
+  const incomplete = info.partial && msg.type === "done";
+  if (incomplete) {
+    showFreshnessNotice(
+      `일부 데이터(${info.fetched}건)만 표시 중입니다. 나머지를 불러오는 중...`
+    );
+  } else if (info.stale) {
+    const minutes = Math.round(info.age_seconds / 60);
+    const age = minutes >= 1 ? `${minutes}분` : `${info.age_seconds}초`;
+    showFreshnessNotice(
+      `${age} 전 데이터를 표시 중입니다. 최신 데이터를 불러오는 중...`
+    );
+  } else {
+    showFreshnessNotice(
+      "저장된 데이터를 표시 중입니다. 최신 데이터를 불러오는 중..."
+    );
+  }
+
+  const attempt = (load.options.attempt || 0) + 1;
+  if (attempt > REVALIDATE_MAX_ATTEMPTS) return;
+  setTimeout(() => {
+    // 그사이 다른 조회가 시작됐으면 취소
+    if (activeLoad !== load) return;
+    startLoad(load.url, load.key, {
+      ...load.options,
+      attempt,
+      // 불완전한 화면은 전체를 다시 받고, 그 외에는 since 델타로 제자리 갱신
+      fresh: incomplete,
+      revalidate: !incomplete && !!load.key,
+    });
+  }, REVALIDATE_DELAY_MS * attempt);
+}
+
+function showFreshnessNotice(text) {
+  let notice = document.getElementById("freshness-notice");
+  if (!text) {
+    if (notice) notice.remove();
+    return;
+  }
+  if (!notice) {
+    const container = document.getElementById("app");
+    if (!container) return;
+    notice = document.createElement("div");
+    notice.id = "freshness-notice";
+    notice.className = "freshness-notice";
+    container.before(notice);
+  }
+  notice.textContent = text;
+}
+
+function showMessage(className, text) {
+  const container = document.getElementById("app");
+  if (container) container.innerHTML = `<div class="${className}">${text}</div>`;
+}
+
 // 샘플 데이터 로드 함수
-async function loadSample() {
+function loadSample() {
   const container = document.getElementById("app");
   if (!container) {
     console.error("타임라인 컨테이너를 찾을 수 없습니다.");
@@ -92,83 +295,76 @@ async function loadSample() {
   container.innerHTML =
     '<div class="loading">샘플 데이터를 불러오는 중...</div>';
 
-  try {
-    const url = new URL("/api/sample", window.location.origin);
-    console.log("샘플 데이터 요청 URL:", url.toString());
-
-    const res = await fetch(url);
-    if (!res.ok) {
-      throw new Error(`HTTP error! status: ${res.status}`);
-    }
-    const data = await res.json();
-
-    console.log("샘플 데이터 응답:", data);
-
-    if (data.error) {
-      throw new Error(data.error);
-    }
-
-    renderTimeline(data);
-  } catch (error) {
-    console.error("샘플 데이터 로드 중 오류 발생:", error);
-    container.innerHTML = `<div class="error-message">샘플 데이터 로드 중 오류가 발생했습니다: ${error.message}</div>`;
-  }
+  const url = new URL("/api/sample", window.location.origin);
+  console.log("샘플 데이터 요청 URL:", url.toString());
+  startLoad(url.toString(), null, { errorLabel: "샘플 데이터 로드" });
 }
 
 // 타임라인 데이터 로드 함수
-async function load() {
+function load() {
   const container = document.getElementById("app");
   if (!container) {
     console.error("타임라인 컨테이너를 찾을 수 없습니다.");
     return;
   }
 
-  // 로딩 상태 표시
-  container.innerHTML = '<div class="loading">데이터를 불러오는 중...</div>';
-
   const projects = document.getElementById("projects").value.trim();
   const group_by = document.getElementById("group_by").value;
   const from_date = document.getElementById("from_date").value;
   const to_date = document.getElementById("to_date").value;
-
-  const url = new URL("/api/timeline", window.location.origin);
+  const barsSelect = document.getElementById("bars");
+  const bars = barsSelect ? barsSelect.value : "";
+  const collapseSelect = document.getElementById("collapse");
+  // 상태별 기간 막대는 요약 보기를 지원하지 않음
+  const collapse = collapseSelect && !bars ? collapseSelect.value : "";
+
+  const url = new URL(
+    bars === "status" ? "/api/timeline/status" : "/api/timeline",
+    window.location.origin
+  );
   if (projects) url.searchParams.set("projects", projects);
   url.searchParams.set("group_by", group_by);
   if (from_date) url.searchParams.set("from_date", from_date);
   if (to_date) url.searchParams.set("to_date", to_date);
+  if (collapse) url.searchParams.set("collapse", collapse);
+  // 브라우저 view 캐시 키는 엔드포인트별로 구분
+  const cacheKey =
+    bars === "status"
+      ? `status?${url.searchParams.toString()}`
+      : url.searchParams.toString();
+
+  // 로딩 상태 표시 (캐시된 view가 있으면 곧바로 덮어씀)
+  container.innerHTML = '<div class="loading">데이터를 불러오는 중...</div>';
+  showFreshnessNotice(null);
+
+  console.log("API 요청 URL:", url.toString());
+  startLoad(url.toString(), cacheKey, {
+    errorLabel: "데이터 로드",
+    onSuccess: () => {
+      // URL 업데이트
+      const newQs = new URLSearchParams();
+      if (projects) newQs.set("projects", projects);
+      newQs.set("group_by", group_by);
+      if (from_date) newQs.set("from_date", from_date);
+      if (to_date) newQs.set("to_date", to_date);
+      if (collapse) newQs.set("collapse", collapse);
+      if (bars) newQs.set("bars", bars);
+      history.replaceState(null, "", `/?${newQs.toString()}`);
+    },
+  });
+}
 
-  try {
-    console.log("API 요청 URL:", url.toString());
-    const res = await fetch(url);
-    if (!res.ok) {
-      throw new Error(`HTTP error! status: ${res.status}`);
-    }
-    const data = await res.json();
-
-    console.log("API 응답 데이터:", data);
-
-    if (data.error) {
-      throw new Error(data.error);
-    }
-
-    renderTimeline(data);
+// view 메타데이터(그룹, 전체 개수)를 받으면 빈 타임라인을 먼저 만들고
+// 아이템은 배치가 도착하는 대로 프레임마다 추가
+function beginTimeline(meta, load) {
+  console.log(
+    `타임라인 렌더링 시작 (${meta.source}): 아이템 ${meta.total}개, 그룹 ${meta.groups.length}개`
+  );
 
-    // URL 업데이트
-    const newQs = new URLSearchParams();
-    if (projects) newQs.set("projects", projects);
-    newQs.set("group_by", group_by);
-    if (from_date) newQs.set("from_date", from_date);
-    if (to_date) newQs.set("to_date", to_date);
-    history.replaceState(null, "", `/?${newQs.toString()}`);
-  } catch (error) {
-    console.error("데이터 로드 중 오류 발생:", error);
-    container.innerHTML = `<div class="error-message">데이터 로드 중 오류가 발생했습니다: ${error.message}</div>`;
+  if (currentTimeline && currentTimeline.timeline) {
+    currentTimeline.timeline.destroy();
   }
-}
-
-// 타임라인 렌더링 함수
-function renderTimeline(data) {
-  console.log("타임라인 렌더링 시작:", data);
+  currentTimeline = null;
 
   const container = document.getElementById("app");
   if (!container) {
@@ -177,17 +373,17 @@ function renderTimeline(data) {
   }
 
   container.innerHTML = "";
+  load.painted = true;
+  load.startedAt = performance.now();
 
-  if (!data.items || data.items.length === 0) {
+  if (meta.total === 0) {
     console.log("데이터가 없습니다.");
     container.innerHTML =
       '<div class="no-data">데이터가 없습니다. 프로젝트를 확인하거나 날짜 범위를 조정해보세요.</div>';
+    currentTimeline = { key: load.key, timeline: null };
     return;
   }
 
-  console.log("아이템 개수:", data.items.length);
-  console.log("그룹 개수:", data.groups ? data.groups.length : 0);
-
   // vis 라이브러리 확인
   if (typeof vis === "undefined") {
     console.error("vis 라이브러리가 로드되지 않았습니다.");
@@ -200,25 +396,128 @@ function renderTimeline(data) {
     console.error(
       "vis.Timeline이 정의되지 않았습니다. HTML 테이블로 대체합니다."
     );
-    renderSimpleTimeline(data, container);
+    // 배치를 모았다가 done에서 한 번에 그림
+    currentTimeline = {
+      key: load.key,
+      timeline: null,
+      simple: { groups: meta.groups, items: [] },
+    };
     return;
   }
 
-  const items = new vis.DataSet(
-    (data.items || []).map((it) => ({
-      id: it.id,
-      group: it.group,
-      content: it.content,
-      title: it.title || it.content, // 툴팁으로 전체 제목 표시
-      start: it.start ? new Date(it.start) : null,
-      end: it.end ? new Date(it.end + "T23:59:59") : null,
-      style: it.color
-        ? `background-color:${it.color};border-color:${it.color};color:#111;font-weight:500;`
-        : "font-weight:500;",
-    }))
+  const items = new vis.DataSet();
+  const groups = new vis.DataSet(meta.groups);
+  const timeline = createTimeline(container, items, groups);
+  currentTimeline = { key: load.key, url: load.url, timeline, items, groups };
+
+  // 접힌 그룹 라벨이나 요약 막대를 누르면 그 그룹만 펼침
+  timeline.on("click", (props) => {
+    if (props.what === "group-label" && props.group) {
+      expandGroup(props.group);
+    } else if (props.item && String(props.item).startsWith("rollup:")) {
+      expandGroup(String(props.item).slice("rollup:".length));
+    }
+  });
+}
+
+// 접힌 그룹의 자식 그룹(요약 포함)과 직속 아이템만 받아 제자리에 추가
+async function expandGroup(groupId) {
+  const current = currentTimeline;
+  if (!current || !current.groups) return;
+  const group = current.groups.get(groupId);
+  if (!group || !group.collapsed) return;
+
+  const url = new URL(
+    `/api/timeline/groups/${encodeURIComponent(groupId)}`,
+    window.location.origin
   );
+  new URL(current.url).searchParams.forEach((value, name) => {
+    if (name !== "since" && name !== "collapse") url.searchParams.set(name, value);
+  });
 
-  const groups = new vis.DataSet(data.groups || []);
+  try {
+    const res = await fetch(url);
+    if (!res.ok) {
+      throw new Error(`HTTP error! status: ${res.status}`);
+    }
+    const data = await res.json();
+    if (data.error) {
+      throw new Error(data.error);
+    }
+    // 그 사이 다른 조회로 바뀌었으면 버림
+    if (currentTimeline !== current) return;
+    current.items.remove(`rollup:${groupId}`);
+    current.groups.update([data.group, ...data.groups].map(toVisGroup));
+    current.items.update(data.items.map(toVisItem));
+  } catch (error) {
+    console.error("그룹 펼치기 중 오류 발생:", error);
+  }
+}
+
+function addTimelineItems(batch) {
+  if (!currentTimeline) return;
+  if (currentTimeline.simple) {
+    currentTimeline.simple.items.push(...batch);
+  } else if (currentTimeline.items) {
+    currentTimeline.items.add(batch);
+  }
+}
+
+function finishTimeline(msg, load) {
+  if (currentTimeline && currentTimeline.simple) {
+    renderSimpleTimeline(
+      currentTimeline.simple,
+      document.getElementById("app")
+    );
+  }
+  console.log(
+    `타임라인 생성 완료 (${msg.source}, ${Math.round(
+      performance.now() - (load.startedAt || performance.now())
+    )}ms)`
+  );
+  if (currentTimeline && currentTimeline.items) {
+    debugDump("아이템 데이터:", () => currentTimeline.items.get());
+    debugDump("그룹 데이터:", () => currentTimeline.groups.get());
+  }
+  if (msg.source === "network" && load.options.onSuccess) {
+    load.options.onSuccess();
+  }
+}
+
+// 캐시로 그린 타임라인에 변경분만 반영 (Timeline 재생성 없음)
+function applyTimelineDelta(delta, load) {
+  console.log(
+    `델타 적용: changed=${delta.changed.length} removed=${delta.removed.length}`
+  );
+  const hasChanges =
+    delta.changed.length || delta.removed.length || delta.groups;
+  if (hasChanges) {
+    if (
+      !currentTimeline ||
+      currentTimeline.key !== load.key ||
+      !currentTimeline.items
+    ) {
+      // 제자리 갱신이 불가능 (빈 view / 테이블 대체) -> 전체 view를 다시 받음
+      startLoad(load.url, load.key, {
+        ...load.options,
+        fresh: true,
+        revalidate: false,
+      });
+      return;
+    }
+    const { items, groups } = currentTimeline;
+    if (delta.removed.length) items.remove(delta.removed);
+    if (delta.changed.length) items.update(delta.changed);
+    if (delta.groups) {
+      const keep = new Set(delta.groups.map((g) => g.id));
+      groups.remove(groups.getIds().filter((id) => !keep.has(id)));
+      groups.update(delta.groups);
+    }
+  }
+  if (load.options.onSuccess) load.options.onSuccess();
+}
+
+function createTimeline(container, items, groups) {
   const today = new Date();
   const startWindow = new Date(
     today.getFullYear(),
@@ -232,8 +531,6 @@ function renderTimeline(data) {
   );
 
   console.log("타임라인 생성 중...");
-  console.log("아이템 데이터:", items.get());
-  console.log("그룹 데이터:", groups.get());
 
   const timeline = new vis.Timeline(container, items, groups, {
     stack: false, // 아이템들이 겹치지 않도록 stack 비활성화
@@ -272,7 +569,7 @@ function renderTimeline(data) {
   });
 
   timeline.addCustomTime(new Date(), "now");
-  console.log("타임라인 생성 완료");
+  return timeline;
 }
 
 // 간단한 HTML 테이블 기반 타임라인 렌더링
@@ -330,7 +627,7 @@ function renderSimpleTimeline(data, container) {
         const endDate = item.end ? new Date(item.end) : null;
         const duration =
           startDate && endDate
-            ? Math.ceil((endDate - startDate) / (1000 * 60 * 60 * 24)) + 1
+            ? Math.floor((endDate - startDate) / (1000 * 60 * 60 * 24)) + 1
             : "N/A";
 
         html += `<tr style="border-bottom: 1px solid #f1f5f9; transition: all 0.2s ease; cursor: pointer;">`;
@@ -381,6 +678,14 @@ document.addEventListener("DOMContentLoaded", function () {
   if (toDateInput && qs.get("to_date")) {
     toDateInput.value = qs.get("to_date");
   }
+  const collapseSelect = document.getElementById("collapse");
+  if (collapseSelect && qs.get("collapse")) {
+    collapseSelect.value = qs.get("collapse");
+  }
+  const barsSelect = document.getElementById("bars");
+  if (barsSelect && qs.get("bars")) {
+    barsSelect.value = qs.get("bars");
+  }
 
   // Load 버튼 이벤트 리스너 등록
   const loadButton = document.getElementById("load");
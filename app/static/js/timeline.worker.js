@@ -0,0 +1,15 @@
+// 타임라인 데이터 준비 워커
+// 메인 스레드: {op: "load", id, url, key, fresh, revalidate}
+// 워커: timeline_data.js의 메시지에 요청 id를 붙여 그대로 postMessage
+importScripts("timeline_data.js");
+
+self.onmessage = (e) => {
+  const { op, id, url, key, fresh, revalidate } = e.data || {};
+  if (op !== "load") return;
+  loadView(url, key, (msg) => self.postMessage({ ...msg, id }), {
+    fresh,
+    revalidate,
+  }).catch((error) =>
+    self.postMessage({ id, type: "error", message: error.message })
+  );
+};
@@ -0,0 +1,234 @@
+// 타임라인 데이터 준비 (DOM 없음)
+// timeline.worker.js에서 importScripts로 불러 워커 안에서 실행하고,
+// 워커를 쓸 수 없는 환경에서는 페이지에서 직접 불러 메인 스레드에서 실행한다.
+//
+// fetch -> JSON 파싱 -> vis 아이템 매핑/스타일 계산 -> ITEM_BATCH_SIZE 단위로 emit
+//   {type: "view", source: "cache" | "network", version, groups, total}
+//   {type: "items", source, items: [...]}     // view 다음에 total개가 나눠서 도착
+//   {type: "done", source}
+//   {type: "delta", version, changed: [...], removed: [...], groups}
+
+const ITEM_BATCH_SIZE = 1000;
+
+// ---- 브라우저 view 캐시 (IndexedDB) ----
+// 마지막으로 받은 view를 조회 조건별로 저장해 두었다가 즉시 그리고,
+// 서버에는 since=<version>으로 변경분만 요청한다.
+const VIEW_DB_NAME = "jira-timeline";
+const VIEW_STORE = "views";
+const VIEW_CACHE_LIMIT = 20;
+
+let viewDbPromise = null;
+
+function viewDb() {
+  if (!viewDbPromise) {
+    viewDbPromise = new Promise((resolve) => {
+      if (!self.indexedDB) {
+        resolve(null);
+        return;
+      }
+      const req = self.indexedDB.open(VIEW_DB_NAME, 1);
+      req.onupgradeneeded = () => {
+        const store = req.result.createObjectStore(VIEW_STORE, {
+          keyPath: "key",
+        });
+        store.createIndex("savedAt", "savedAt");
+      };
+      req.onsuccess = () => resolve(req.result);
+      // 사생활 보호 모드 등으로 열 수 없으면 캐시 없이 동작
+      req.onerror = () => resolve(null);
+    });
+  }
+  return viewDbPromise;
+}
+
+async function getCachedView(key) {
+  const db = await viewDb();
+  if (!db) return null;
+  return new Promise((resolve) => {
+    const req = db
+      .transaction(VIEW_STORE, "readonly")
+      .objectStore(VIEW_STORE)
+      .get(key);
+    req.onsuccess = () => resolve(req.result || null);
+    req.onerror = () => resolve(null);
+  });
+}
+
+async function putCachedView(key, view) {
+  const db = await viewDb();
+  if (!db) return;
+  const store = db.transaction(VIEW_STORE, "readwrite").objectStore(VIEW_STORE);
+  store.put({
+    key,
+    version: view.version,
+    groups: view.groups || [],
+    items: view.items || [],
+    savedAt: Date.now(),
+  });
+  // 오래된 조회 조건부터 정리
+  const countReq = store.count();
+  countReq.onsuccess = () => {
+    let extra = countReq.result - VIEW_CACHE_LIMIT;
+    if (extra <= 0) return;
+    store.index("savedAt").openCursor().onsuccess = (e) => {
+      const cursor = e.target.result;
+      if (!cursor || extra <= 0) return;
+      cursor.delete();
+      extra -= 1;
+      cursor.continue();
+    };
+  };
+}
+
+// 캐시된 view에 서버 델타(changed / removed / groups)를 병합
+function applyDelta(view, delta) {
+  const removed = new Set(delta.removed || []);
+  const changed = new Map((delta.changed || []).map((it) => [it.id, it]));
+  const items = [];
+  (view.items || []).forEach((it) => {
+    if (removed.has(it.id)) return;
+    if (changed.has(it.id)) {
+      items.push(changed.get(it.id));
+      changed.delete(it.id);
+    } else {
+      items.push(it);
+    }
+  });
+  changed.forEach((it) => items.push(it));
+  return {
+    version: delta.version,
+    groups: delta.groups || view.groups || [],
+    items,
+  };
+}
+
+// 선후행 링크가 있는 아이템의 툴팁 (여유 / 지연)
+function dependencyTitle(it) {
+  if (!("slack" in it)) return "";
+  if (it.slack === null) return " (순환 선후행 링크)";
+  const parts = [`여유 ${it.slack}일`];
+  if (it.delay > 0) parts.push(`선행 작업으로 ${it.delay}일 지연`);
+  return ` (${parts.join(" · ")})`;
+}
+
+// API 아이템 -> vis 아이템 (Date는 structured clone으로 그대로 전달됨)
+function toVisItem(it) {
+  let className;
+  if (it.rollup) {
+    // 요약 막대 (접힌 그룹)
+    className = "rollup-bar";
+  } else if (it.critical) {
+    className = "critical-path";
+  }
+  return {
+    id: it.id,
+    group: it.group,
+    content: it.content,
+    // 툴팁으로 전체 제목 표시
+    title: (it.title || it.content) + dependencyTitle(it),
+    start: it.start ? new Date(it.start) : null,
+    end: it.end ? new Date(it.end + "T23:59:59") : null,
+    style: it.color
+      ? `background-color:${it.color};border-color:${it.color};color:#111;font-weight:500;`
+      : "font-weight:500;",
+    className,
+  };
+}
+
+// API 그룹 -> vis 그룹 (collapse 요청 시 접힌 그룹에 표시와 요약 툴팁)
+function toVisGroup(g) {
+  if (!g.rollup) return g;
+  const label = g.collapsed ? `▸ ${g.content}` : g.content;
+  const types = Object.entries(g.rollup.by_type)
+    .map(([k, v]) => `${k} ${v}`)
+    .join(" · ");
+  return {
+    ...g,
+    content: label,
+    title: `${g.title} (${g.rollup.count}건: ${types})`,
+  };
+}
+
+// 서버가 지연 예산을 넘겨 대신 돌려준 응답 표시 (없으면 null)
+// {stale, age_seconds, refresh_error} 또는 {partial, fetched}
+function degradedInfo(data) {
+  if (data.partial) return { partial: true, fetched: data.fetched || 0 };
+  if (data.stale) {
+    return {
+      stale: true,
+      age_seconds: data.age_seconds || 0,
+      refresh_error: data.refresh_error || null,
+    };
+  }
+  return null;
+}
+
+function emitView(view, source, emit) {
+  const raw = view.items || [];
+  emit({
+    type: "view",
+    source,
+    version: view.version,
+    groups: (view.groups || []).map(toVisGroup),
+    total: raw.length,
+  });
+  for (let i = 0; i < raw.length; i += ITEM_BATCH_SIZE) {
+    emit({
+      type: "items",
+      source,
+      items: raw.slice(i, i + ITEM_BATCH_SIZE).map(toVisItem),
+    });
+  }
+  emit({
+    type: "done",
+    source,
+    degraded: source === "network" ? degradedInfo(view) : null,
+  });
+}
+
+// url: 절대 URL, key: 캐시 키 (null이면 캐시 사용 안 함)
+// fresh: 캐시를 그리지 않고 전체 view를 다시 받음
+// revalidate: 캐시된 view는 이미 그려져 있으므로 다시 그리지 않고 since 요청만
+async function loadView(
+  url,
+  key,
+  emit,
+  { fresh = false, revalidate = false } = {}
+) {
+  const cached = key && !fresh ? await getCachedView(key) : null;
+  const target = new URL(url);
+  if (cached) {
+    if (!revalidate) emitView(cached, "cache", emit);
+    target.searchParams.set("since", cached.version);
+  }
+
+  const res = await fetch(target);
+  if (!res.ok) {
+    throw new Error(`HTTP error! status: ${res.status}`);
+  }
+  const data = await res.json();
+  if (data.error) {
+    throw new Error(data.error);
+  }
+
+  if (data.delta && cached) {
+    const changed = data.changed || [];
+    const removed = data.removed || [];
+    emit({
+      type: "delta",
+      version: data.version,
+      changed: changed.map(toVisItem),
+      removed,
+      groups: data.groups ? data.groups.map(toVisGroup) : null,
+      degraded: degradedInfo(data),
+    });
+    if (changed.length || removed.length || data.groups) {
+      putCachedView(key, applyDelta(cached, data));
+    }
+    return;
+  }
+
+  emitView(data, "network", emit);
+  // 부분 view는 브라우저 캐시에 남기지 않음
+  if (key && !data.partial) putCachedView(key, data);
+}
@@ -0,0 +1,232 @@
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.controllers.issue_record import IssueRecord
+from app.controllers.timeline_controller import (
+    apply_overlays,
+    build_timeline_view,
+    fetch_timeline_records,
+)
+from app.views.exporters import write_timeline_html, write_timeline_json
+
+# 프로젝트 / 팀(user_owner) / 기간별 타임라인 일괄 export
+#
+#   python -m app.views.batch_export --projects SR,AB --owners ,alice \
+#       --windows 2024-01-01:2024-03-31,2024-04-01:2024-06-30 --formats json,html
+
+Window = Tuple[Optional[str], Optional[str]]
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _safe(s: str) -> str:
+    return _UNSAFE_RE.sub("_", s).strip("_") or "_"
+
+
+def parse_windows(spec: Optional[str]) -> List[Window]:
+    if not spec:
+        return [(None, None)]
+    windows: List[Window] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition(":")
+        windows.append((start or None, end or None))
+    return windows or [(None, None)]
+
+
+def output_path(
+    outdir: str,
+    project_key: str,
+    user_owner: Optional[str],
+    window: Window,
+    fmt: str,
+) -> str:
+    name = _safe(project_key)
+    if user_owner:
+        name += f"__{_safe(user_owner)}"
+    if window != (None, None):
+        name += f"__{window[0] or 'start'}_{window[1] or 'end'}"
+    return os.path.join(outdir, f"{name}.{fmt}")
+
+
+def fetch_project(project_key: str, max_results: int = 1000) -> Dict[str, Any]:
+    # 프로젝트당 한 번만 JIRA 조회 (모든 owner/기간/포맷 변형이 공유)
+    t0 = time.perf_counter()
+    records = fetch_timeline_records(
+        f"project in ({project_key})", max_results=max_results
+    )
+    return {
+        "project": project_key,
+        "records": records,
+        "fetch_ms": (time.perf_counter() - t0) * 1000.0,
+    }
+
+
+def run_variant(
+    project_key: str,
+    records: List[IssueRecord],
+    user_owner: Optional[str],
+    windows: List[Window],
+    formats: List[str],
+    outdir: str,
+    group_by: str = "project",
+) -> List[Dict[str, Any]]:
+    # (프로젝트, owner) 단위로 view를 한 번 만들고 기간/포맷별 파일을 기록
+    t0 = time.perf_counter()
+    view = build_timeline_view(
+        apply_overlays({"issues": records}, user_owner=user_owner, drop_hidden=True),
+        group_by=group_by,
+    )
+    build_ms = (time.perf_counter() - t0) * 1000.0
+    writers = {"json": write_timeline_json, "html": write_timeline_html}
+    reports: List[Dict[str, Any]] = []
+    for window in windows:
+        for fmt in formats:
+            path = output_path(outdir, project_key, user_owner, window, fmt)
+            t1 = time.perf_counter()
+            report: Dict[str, Any] = {
+                "project": project_key,
+                "user_owner": user_owner,
+                "from_date": window[0],
+                "to_date": window[1],
+                "format": fmt,
+                "outfile": path,
+                "build_ms": round(build_ms, 2),
+            }
+            try:
+                report["items"] = writers[fmt](
+                    view, path, from_date=window[0], to_date=window[1]
+                )
+                report["ok"] = True
+            except Exception as e:
+                report["ok"] = False
+                report["error"] = str(e)
+            report["write_ms"] = round((time.perf_counter() - t1) * 1000.0, 2)
+            reports.append(report)
+    return reports
+
+
+def run_batch(
+    project_keys: List[str],
+    *,
+    owners: Optional[List[Optional[str]]] = None,
+    windows: Optional[List[Window]] = None,
+    formats: Optional[List[str]] = None,
+    outdir: str = "exports",
+    group_by: str = "project",
+    workers: int = 4,
+    use_processes: bool = False,
+) -> Dict[str, Any]:
+    owners = owners or [None]
+    windows = windows or [(None, None)]
+    formats = formats or ["json"]
+    os.makedirs(outdir, exist_ok=True)
+    t0 = time.perf_counter()
+
+    fetched: Dict[str, Dict[str, Any]] = {}
+    jobs: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=workers) as io_pool:
+        futures = {io_pool.submit(fetch_project, p): p for p in project_keys}
+        for fut in as_completed(futures):
+            p = futures[fut]
+            try:
+                fetched[p] = fut.result()
+            except Exception as e:
+                jobs.append({"project": p, "ok": False, "error": f"fetch: {e}"})
+
+    if use_processes:
+        # multiprocessing은 --processes일 때만 import
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool: Executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    with pool:
+        futures = {
+            pool.submit(
+                run_variant,
+                p,
+                fetched[p]["records"],
+                owner,
+                windows,
+                formats,
+                outdir,
+                group_by,
+            ): (p, owner)
+            for p in project_keys
+            if p in fetched
+            for owner in owners
+        }
+        for fut in as_completed(futures):
+            p, owner = futures[fut]
+            try:
+                for report in fut.result():
+                    report["fetch_ms"] = round(fetched[p]["fetch_ms"], 2)
+                    jobs.append(report)
+            except Exception as e:
+                jobs.append(
+                    {"project": p, "user_owner": owner, "ok": False, "error": str(e)}
+                )
+
+    jobs.sort(key=lambda j: (j.get("project") or "", j.get("outfile") or ""))
+    return {
+        "total_ms": round((time.perf_counter() - t0) * 1000.0, 2),
+        "jobs": jobs,
+        "ok": sum(1 for j in jobs if j.get("ok")),
+        "failed": sum(1 for j in jobs if not j.get("ok")),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch timeline export")
+    parser.add_argument(
+        "--projects", default=os.getenv("JIRA_PROJECTS", "SR"), help="SR,AB"
+    )
+    parser.add_argument(
+        "--owners",
+        default="",
+        help="user_owner 목록 (쉼표 구분, 빈 값 = 팀 오버레이만)",
+    )
+    parser.add_argument("--windows", default="", help="FROM:TO,FROM:TO")
+    parser.add_argument("--formats", default="json", help="json,html")
+    parser.add_argument("--outdir", default="exports")
+    parser.add_argument("--group-by", default=os.getenv("GROUP_BY", "project"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--processes", action="store_true", help="build in processes")
+    args = parser.parse_args(argv)
+
+    projects = [p.strip() for p in args.projects.split(",") if p.strip()]
+    owners: List[Optional[str]] = [o.strip() or None for o in args.owners.split(",")]
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = set(formats) - {"json", "html"}
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(sorted(unknown))}")
+
+    summary = run_batch(
+        projects,
+        owners=list(dict.fromkeys(owners)),
+        windows=parse_windows(args.windows),
+        formats=formats,
+        outdir=args.outdir,
+        group_by=args.group_by,
+        workers=args.workers,
+        use_processes=args.processes,
+    )
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0 if not summary["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,90 +1,26 @@
+import gzip
+import io
 import json
-from typing import Any, Dict, List, Optional
+import re
+from datetime import date
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set
 
 from app.controllers.timeline_controller import (
     build_timeline_view,
-    search_issues_with_overlays,
+    iter_items_by_date,
+    stream_timeline_records,
 )
-from app.services.file_utils import save_json_to_file
+from app.services.file_utils import atomic_open
+from app.views.vendor import load_vis_assets
 
-
-def export_timeline_json(
-    project_keys: List[str],
-    *,
-    outfile: str = "timeline.json",
-    user_owner: Optional[str] = None,
-    group_by: str = "project",
-    from_date: Optional[str] = None,
-    to_date: Optional[str] = None,
-) -> bool:
-    if not project_keys:
-        raise ValueError("project_keys required")
-    pj = ",".join(project_keys)
-    jql = f"project in ({pj})"
-    result = search_issues_with_overlays(jql, user_owner=user_owner, max_results=1000)
-    view = build_timeline_view(result, group_by=group_by)
-
-    # client-side filter by date range (overlap)
-    from app.controllers.timeline_controller import _parse_iso_date
-
-    fd = _parse_iso_date(from_date) if from_date else None
-    td = _parse_iso_date(to_date) if to_date else None
-    if fd or td:
-        filtered: List[Dict[str, Any]] = []
-        for it in view["items"]:
-            s = _parse_iso_date(it.get("start"))
-            e = _parse_iso_date(it.get("end")) or s
-            if not s and not e:
-                continue
-            ok = True
-            if fd and e and e.date() < fd.date():
-                ok = False
-            if td and s and s.date() > td.date():
-                ok = False
-            if ok:
-                filtered.append(it)
-        view["items"] = filtered
-
-    return save_json_to_file(view, outfile)
-
-
-def export_timeline_html(
-    project_keys: List[str],
-    *,
-    outfile: str = "timeline.html",
-    user_owner: Optional[str] = None,
-    group_by: str = "project",
-    from_date: Optional[str] = None,
-    to_date: Optional[str] = None,
-) -> bool:
-    ok = export_timeline_json(
-        project_keys,
-        outfile="timeline.json.tmp",
-        user_owner=user_owner,
-        group_by=group_by,
-        from_date=from_date,
-        to_date=to_date,
-    )
-    if not ok:
-        return False
-    with open("timeline.json.tmp", "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    for it in data.get("items", []):
-        color = it.get("color")
-        if color:
-            it["style"] = (
-                f"background-color: {color}; border-color: {color}; color: #111;"
-            )
-
-    html = """
+_HTML_TEMPLATE = """
 <!doctype html>
 <html lang=\"ko\">
 <head>
   <meta charset=\"utf-8\" />
   <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
   <title>Timeline</title>
-  <link rel=\"stylesheet\" href=\"https://unpkg.com/vis-timeline@latest/styles/vis-timeline-graph2d.min.css\" />
+  <link rel=\"stylesheet\" href=\"https://unpkg.com/vis-timeline@7.7.0/styles/vis-timeline-graph2d.min.css\" />
   <style>
     body { margin: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Noto Sans KR', 'Apple SD Gothic Neo', sans-serif; }
     #app { height: 100vh; }
@@ -99,8 +35,8 @@ def export_timeline_html(
     <span class=\"badge\">Local overlays applied (not written to JIRA)</span>
   </div>
   <div id=\"app\"></div>
-  <script src=\"https://unpkg.com/vis-data@latest/peer/umd/vis-data.min.js\"></script>
-  <script src=\"https://unpkg.com/vis-timeline@latest/peer/umd/vis-timeline-graph2d.min.js\"></script>
+  <script src=\"https://unpkg.com/vis-data@7.1.4/peer/umd/vis-data.min.js\"></script>
+  <script src=\"https://unpkg.com/vis-timeline@7.7.0/peer/umd/vis-timeline-graph2d.min.js\"></script>
   <script>
     const data = __DATA__;
     const container = document.getElementById('app');
@@ -137,13 +73,339 @@ def export_timeline_html(
 </body>
 </html>
 """
-    html = html.replace("__DATA__", json.dumps(data).replace("</", "<\\/"))
-    with open(outfile, "w", encoding="utf-8") as f:
-        f.write(html)
+_HTML_PREFIX, _HTML_SUFFIX = _HTML_TEMPLATE.split("__DATA__")
+
+# 오프라인용 단일 HTML (vis 번들 inline + compact 데이터 인코딩)
+# data = {v, groups: [[id, titleIdx, order]], items: [[id, groupIdx, content,
+#         start, end, colorIdx]], titles: [...], colors: [...],
+#         edges: [[fromItemIdx, toItemIdx, critical]], critical_path: {project: [itemIdx]}}
+# start/end는 1970-01-01 기준 일수(숫자) 또는 원래 문자열
+_STANDALONE_PREFIX = (
+    '<!doctype html><html lang="ko"><head><meta charset="utf-8">'
+    '<meta name="viewport" content="width=device-width,initial-scale=1">'
+    "<title>Timeline</title><style>__VIS_CSS__</style><style>"
+    "body{margin:0;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,"
+    "'Noto Sans KR','Apple SD Gothic Neo',sans-serif}#app{height:100vh}"
+    ".vis-item.vis-range{border-radius:6px}.header{padding:10px 12px;"
+    "border-bottom:1px solid #e5e7eb;display:flex;align-items:center;gap:12px}"
+    ".badge{font-size:12px;background:#eef2ff;color:#3730a3;padding:2px 8px;"
+    'border-radius:999px}</style></head><body><div class="header">'
+    '<strong>Read-only Timeline</strong><span class="badge">Local overlays '
+    'applied (not written to JIRA)</span></div><div id="app"></div>'
+    "<script>__VIS_JS__</script><script>const D="
+)
+_STANDALONE_SUFFIX = (
+    ";const T=D.titles,G=D.groups,"
+    "S=D.colors.map(c=>c?`background-color:${c};border-color:${c};color:#111;`:''),"
+    "ds=v=>typeof v==='number'?new Date(v*864e5).toISOString().slice(0,10):v;"
+    "const items=new vis.DataSet(D.items.map(a=>{const s=ds(a[3]),e=ds(a[4]);"
+    "return{id:a[0],group:G[a[1]]?G[a[1]][0]:null,content:a[2],"
+    "start:s?new Date(s):null,end:e?new Date(e+'T23:59:59'):null,style:S[a[5]]}}));"
+    "const groups=new vis.DataSet(G.map(g=>({id:g[0],content:T[g[1]],"
+    "title:T[g[1]],order:g[2]})));"
+    "const t=new Date(),d=864e5;"
+    "const tl=new vis.Timeline(document.getElementById('app'),items,groups,"
+    "{stack:true,orientation:'top',multiselect:false,showCurrentTime:true,"
+    "zoomKey:'ctrlKey',margin:{item:6,axis:12},"
+    "min:new Date(t.getFullYear(),t.getMonth(),t.getDate()-14),"
+    "max:new Date(t.getFullYear(),t.getMonth(),t.getDate()+45),"
+    "timeAxis:{scale:'day',step:1},zoomMin:d,zoomMax:d*365});"
+    "tl.addCustomTime(new Date(),'now');</script></body></html>"
+)
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_EPOCH = date(1970, 1, 1)
+
+
+def _search_view(
+    project_keys: List[str],
+    *,
+    user_owner: Optional[str] = None,
+    group_by: str = "project",
+) -> Dict[str, Any]:
+    if not project_keys:
+        raise ValueError("project_keys required")
+    pj = ",".join(project_keys)
+    jql = f"project in ({pj})"
+    result = stream_timeline_records(jql, user_owner=user_owner, max_results=1000)
+    return build_timeline_view(result, group_by=group_by)
+
+
+# 아이템 기준으로 거르는 키 -> 아이템을 다 쓴 뒤 기록
+_DEPENDENCY_KEYS = ("edges", "critical_path")
+
+
+def _dependencies(view: Dict[str, Any], ids: Set[str]) -> Dict[str, Any]:
+    # 선후행 edges / critical_path 중 기록한 아이템에 해당하는 것만
+    if "edges" not in view:
+        return {}
+    return {
+        "edges": [
+            e for e in view["edges"] if e.get("from") in ids and e.get("to") in ids
+        ],
+        "critical_path": {
+            pj: [k for k in path if k in ids]
+            for pj, path in (view.get("critical_path") or {}).items()
+        },
+    }
+
+
+def _write_view(
+    f: IO[str],
+    view: Dict[str, Any],
+    *,
+    encoder: json.JSONEncoder,
+    html_safe: bool = False,
+) -> int:
+    # 전체 JSON 문자열을 만들지 않고 키 / 아이템 단위로 청크 인코딩해서 바로 기록
+    # view["items"]는 이터레이터여도 됨. 나머지 키는 view 순서대로 그대로 기록
+    # encoder.indent가 있으면 json.dump(view, indent=...)와 같은 모양으로 들여씀
+    step = " " * encoder.indent if encoder.indent else ""
+
+    def _newline(level: int) -> str:
+        return "\n" + step * level
+
+    def _emit(obj: Any, level: int) -> None:
+        for chunk in encoder.iterencode(obj):
+            if step:
+                # JSON 문자열 안의 줄바꿈은 \n으로 이스케이프되므로 실제 줄바꿈은 들여쓰기뿐
+                chunk = chunk.replace("\n", _newline(level))
+            f.write(chunk.replace("</", "<\\/") if html_safe else chunk)
+
+    keys = [k for k in view if k not in _DEPENDENCY_KEYS]
+    ids: Set[str] = set()
+    count = 0
+    for n, key in enumerate(keys):
+        f.write("{" if n == 0 else ",")
+        f.write(_newline(1) if step else ("" if n == 0 else "\n"))
+        f.write(json.dumps(key, ensure_ascii=False) + ": ")
+        if key != "items":
+            _emit(view[key], 1)
+            continue
+        f.write("[")
+        for it in view["items"]:
+            if count:
+                f.write(",")
+            f.write(_newline(2) if step else "\n")
+            _emit(it, 2)
+            ids.add(it.get("id"))
+            count += 1
+        if count or not step:
+            f.write(_newline(1) if step else "\n")
+        f.write("]")
+        for dep_key, value in _dependencies(view, ids).items():
+            f.write("," + (_newline(1) if step else "\n"))
+            f.write(json.dumps(dep_key) + ": ")
+            _emit(value, 1)
+    f.write(_newline(0) + "}" if step and keys else "}")
+    return count
+
+
+def _with_style(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for it in items:
+        color = it.get("color")
+        if color:
+            # 같은 view를 여러 포맷으로 내보낼 수 있으므로 원본은 수정하지 않음
+            it = {
+                **it,
+                "style": f"background-color: {color}; border-color: {color}; color: #111;",
+            }
+        yield it
+
+
+def write_timeline_json(
+    view: Dict[str, Any],
+    outfile: str,
+    *,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> int:
+    # client-side filter by date range (overlap)
+    # save_json_to_file(view)와 같은 모양 (indent=2), 아이템은 스트리밍으로 기록
+    items = iter_items_by_date(view["items"], from_date, to_date)
+    with atomic_open(outfile) as f:
+        return _write_view(
+            f,
+            {**view, "items": items},
+            encoder=json.JSONEncoder(ensure_ascii=False, indent=2),
+        )
+
+
+def write_timeline_html(
+    view: Dict[str, Any],
+    outfile: str,
+    *,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> int:
+    items = _with_style(iter_items_by_date(view["items"], from_date, to_date))
+    with atomic_open(outfile) as f:
+        f.write(_HTML_PREFIX)
+        count = _write_view(
+            f,
+            {"groups": view["groups"], "items": items},
+            encoder=json.JSONEncoder(),
+            html_safe=True,
+        )
+        f.write(_HTML_SUFFIX)
+    return count
+
+
+def _compact_date(s: Optional[str]) -> Any:
+    if s and _DATE_RE.match(s):
+        try:
+            return (date.fromisoformat(s) - _EPOCH).days
+        except ValueError:
+            return s
+    return s
+
+
+def _write_compact_view(
+    f: IO[str],
+    groups: List[Dict[str, Any]],
+    items: Iterable[Dict[str, Any]],
+    view: Optional[Dict[str, Any]] = None,
+) -> int:
+    # 그룹 제목/색상은 lookup 테이블로 중복 제거, 아이템은 배열 한 줄로 인코딩
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    titles: Dict[str, int] = {}
+    colors: Dict[str, int] = {}
+    group_index: Dict[str, int] = {}
+    item_index: Dict[str, int] = {}
+
+    def _emit(obj: Any) -> None:
+        for chunk in encoder.iterencode(obj):
+            f.write(chunk.replace("</", "<\\/"))
+
+    f.write('{"v":1,"groups":')
+    compact_groups = []
+    for g in groups:
+        group_index[g["id"]] = len(compact_groups)
+        title = g.get("content") or g.get("title") or g["id"]
+        compact_groups.append(
+            [g["id"], titles.setdefault(title, len(titles)), g.get("order", 999)]
+        )
+    _emit(compact_groups)
+    f.write(',"items":[')
+    count = 0
+    for it in items:
+        if count:
+            f.write(",")
+        item_index[it.get("id")] = count
+        _emit(
+            [
+                it.get("id"),
+                group_index.get(it.get("group"), -1),
+                it.get("content") or "",
+                _compact_date(it.get("start")),
+                _compact_date(it.get("end")),
+                colors.setdefault(it.get("color") or "", len(colors)),
+            ]
+        )
+        count += 1
+    f.write('],"titles":')
+    _emit(list(titles))
+    f.write(',"colors":')
+    _emit(list(colors))
+    deps = _dependencies(view or {}, set(item_index))
+    if deps:
+        f.write(',"edges":')
+        _emit(
+            [
+                [item_index[e["from"]], item_index[e["to"]], 1 if e["critical"] else 0]
+                for e in deps["edges"]
+            ]
+        )
+        f.write(',"critical_path":')
+        _emit(
+            {
+                pj: [item_index[k] for k in path]
+                for pj, path in deps["critical_path"].items()
+            }
+        )
+    f.write("}")
+    return count
+
+
+def write_timeline_html_standalone(
+    view: Dict[str, Any],
+    outfile: str,
+    *,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    compress: bool = False,
+) -> int:
+    vis_js, vis_css = load_vis_assets()
+    items = iter_items_by_date(view["items"], from_date, to_date)
+    head, _, tail = _STANDALONE_PREFIX.partition("__VIS_JS__")
+    css_head, _, css_tail = head.partition("__VIS_CSS__")
+    with atomic_open(outfile, "wb") as raw:
+        if compress:
+            # mtime=0 -> 같은 입력이면 같은 .gz 바이트
+            gz = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=9, mtime=0)
+            f = io.TextIOWrapper(gz, encoding="utf-8")
+        else:
+            f = io.TextIOWrapper(raw, encoding="utf-8")
+        try:
+            for part in (css_head, vis_css, css_tail, vis_js, tail):
+                f.write(part)
+            count = _write_compact_view(f, view["groups"], items, view)
+            f.write(_STANDALONE_SUFFIX)
+            f.flush()
+        finally:
+            f.detach()
+            if compress:
+                gz.close()
+    return count
+
+
+def export_timeline_json(
+    project_keys: List[str],
+    *,
+    outfile: str = "timeline.json",
+    user_owner: Optional[str] = None,
+    group_by: str = "project",
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> bool:
+    view = _search_view(project_keys, user_owner=user_owner, group_by=group_by)
     try:
-        import os
+        write_timeline_json(view, outfile, from_date=from_date, to_date=to_date)
+        return True
+    except Exception as e:
+        print(f"JSON 파일 저장 실패: {e}")
+        return False
 
-        os.remove("timeline.json.tmp")
-    except Exception:
-        pass
-    return True
+
+def export_timeline_html(
+    project_keys: List[str],
+    *,
+    outfile: str = "timeline.html",
+    user_owner: Optional[str] = None,
+    group_by: str = "project",
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    standalone: bool = False,
+    compress: bool = False,
+) -> bool:
+    if standalone:
+        # 번들이 없으면 JIRA 조회 전에 실패 (VendorAssetsError에 다시 받는 방법이 담김)
+        load_vis_assets()
+    view = _search_view(project_keys, user_owner=user_owner, group_by=group_by)
+    try:
+        if standalone:
+            if compress and not outfile.endswith(".gz"):
+                outfile += ".gz"
+            write_timeline_html_standalone(
+                view,
+                outfile,
+                from_date=from_date,
+                to_date=to_date,
+                compress=compress,
+            )
+        else:
+            write_timeline_html(view, outfile, from_date=from_date, to_date=to_date)
+        return True
+    except Exception as e:
+        print(f"HTML 파일 저장 실패: {e}")
+        return False
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import sys
+import urllib.request
+from typing import Dict, List, Tuple
+
+from app.services.file_utils import atomic_open
+
+# 오프라인 HTML export에 inline으로 넣는 vis-timeline 번들 (버전 고정)
+#
+# 번들은 저장소에 넣지 않고 배포 시 `python -m app.views.vendor`로 내려받음
+# -> 받은 파일의 sha256을 manifest.json에 기록하고, 읽을 때 버전 / 해시를 확인
+#    (중간에 끊긴 다운로드나 다른 버전 파일로 깨진 HTML을 만들지 않도록)
+# `python -m app.views.vendor --verify`로 배포 전에 확인할 수 있음
+VIS_TIMELINE_VERSION = "7.7.0"
+VIS_VENDOR_DIR = os.getenv(
+    "VIS_VENDOR_DIR",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "static",
+        "vendor",
+        f"vis-timeline-{VIS_TIMELINE_VERSION}",
+    ),
+)
+
+# standalone 빌드는 vis-data/moment가 포함되어 있어 단독으로 동작
+VIS_ASSETS: Dict[str, str] = {
+    "vis-timeline-graph2d.min.js": "standalone/umd/vis-timeline-graph2d.min.js",
+    "vis-timeline-graph2d.min.css": "styles/vis-timeline-graph2d.min.css",
+}
+VIS_CDN_BASE = f"https://unpkg.com/vis-timeline@{VIS_TIMELINE_VERSION}/"
+_MANIFEST = "manifest.json"
+
+_cache: Dict[str, Tuple[str, str]] = {}
+
+
+class VendorAssetsError(RuntimeError):
+    # 번들이 없거나 manifest와 맞지 않음 -> 메시지에 다시 받는 방법을 담음
+    pass
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def verify_vis_assets(vendor_dir: str = VIS_VENDOR_DIR) -> List[str]:
+    # 문제 목록 (비어 있으면 정상)
+    manifest_path = os.path.join(vendor_dir, _MANIFEST)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return [f"{manifest_path} 없음"]
+    except ValueError as e:
+        return [f"{manifest_path} 읽기 실패: {e}"]
+    if manifest.get("version") != VIS_TIMELINE_VERSION:
+        return [
+            f"번들 버전 {manifest.get('version')} != 필요한 버전 {VIS_TIMELINE_VERSION}"
+        ]
+    problems: List[str] = []
+    hashes = manifest.get("files") or {}
+    for name in VIS_ASSETS:
+        path = os.path.join(vendor_dir, name)
+        if not os.path.isfile(path):
+            problems.append(f"{path} 없음")
+        elif hashes.get(name) != _sha256(path):
+            problems.append(f"{path} sha256이 manifest와 다름")
+    return problems
+
+
+def load_vis_assets(vendor_dir: str = VIS_VENDOR_DIR) -> Tuple[str, str]:
+    if vendor_dir in _cache:
+        return _cache[vendor_dir]
+    problems = verify_vis_assets(vendor_dir)
+    if problems:
+        raise VendorAssetsError(
+            f"vis-timeline {VIS_TIMELINE_VERSION} 번들을 쓸 수 없습니다 ({'; '.join(problems)}). "
+            f"`python -m app.views.vendor {vendor_dir}` 로 다시 내려받으세요."
+        )
+    with open(
+        os.path.join(vendor_dir, "vis-timeline-graph2d.min.js"), "r", encoding="utf-8"
+    ) as f:
+        js = f.read()
+    with open(
+        os.path.join(vendor_dir, "vis-timeline-graph2d.min.css"), "r", encoding="utf-8"
+    ) as f:
+        css = f.read()
+    # inline <script> 안에서 태그가 닫히지 않도록
+    js = js.replace("</script", "<\\/script")
+    _cache[vendor_dir] = (js, css)
+    return js, css
+
+
+def fetch_vis_assets(vendor_dir: str = VIS_VENDOR_DIR) -> None:
+    os.makedirs(vendor_dir, exist_ok=True)
+    hashes: Dict[str, str] = {}
+    for name, remote in VIS_ASSETS.items():
+        url = VIS_CDN_BASE + remote
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            data = resp.read()
+        if not data:
+            raise VendorAssetsError(f"{url} 응답이 비어 있습니다")
+        with atomic_open(os.path.join(vendor_dir, name), "wb") as f:
+            f.write(data)
+        hashes[name] = hashlib.sha256(data).hexdigest()
+        print(f"{url} -> {os.path.join(vendor_dir, name)} ({len(data)} bytes)")
+    # 모든 파일을 받은 뒤에만 manifest를 씀 -> 중간에 실패하면 검증이 계속 실패
+    with atomic_open(os.path.join(vendor_dir, _MANIFEST), "w") as f:
+        json.dump({"version": VIS_TIMELINE_VERSION, "files": hashes}, f, indent=2)
+    _cache.pop(vendor_dir, None)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    verify = "--verify" in args
+    args = [a for a in args if a != "--verify"]
+    target = args[0] if args else VIS_VENDOR_DIR
+    if verify:
+        issues = verify_vis_assets(target)
+        for issue in issues:
+            print(issue, file=sys.stderr)
+        sys.exit(1 if issues else 0)
+    fetch_vis_assets(target)
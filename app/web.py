@@ -1,8 +1,27 @@
-from flask import Flask, request, jsonify, Response, render_template
-from typing import Any, Dict, List, Optional
-from app.controllers.timeline_controller import (
-    search_issues_with_overlays,
-    build_timeline_view,
+from flask import Flask, request, jsonify, Response, render_template, send_file, abort
+from app.controllers.overlay_controller import (
+    delete_overlay,
+    get_overlay,
+    put_overlay,
+)
+from app.controllers.timeline_delta import item_hashes, make_timeline_response
+from app.controllers.timeline_rollup import collapse_view, expand_group
+from app.controllers.timeline_service import (
+    TIMELINE_RETRY_AFTER,
+    ViewUnavailable,
+    build_view,
+    collapse_level,
+    request_deadline,
+    shared_cache,
+    status_view,
+    workload_params,
+    workload_view,
+)
+from app.services import metrics, profiler
+from app.services.reference_store import (
+    SAMPLE_PROJECTS,
+    get_cached_project_members,
+    get_cached_projects,
 )
 
 # from app.services.jira_client import get_projects
@@ -48,6 +67,7 @@ _setup_logging()
 @app.before_request
 def _log_request_start() -> None:
     g._t0 = time.time()
+    g._metrics_token = metrics.begin_request()
     app.logger.info(
         "REQ %s %s args=%s ip=%s ua=%s",
         request.method,
@@ -64,8 +84,18 @@ def _log_request_end(response):
         dur_ms = (time.time() - getattr(g, "_t0", time.time())) * 1000.0
     except Exception:
         dur_ms = -1
+    stats = metrics.end_request(getattr(g, "_metrics_token", None))
+    if dur_ms >= 0:
+        rule = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe(
+            "http_request_duration_seconds",
+            dur_ms / 1000.0,
+            method=request.method,
+            path=rule,
+            status=response.status_code,
+        )
     app.logger.info(
-        "RES %s %s status=%s len=%s dur=%.1fms",
+        "RES %s %s status=%s len=%s dur=%.1fms %s",
         request.method,
         request.path,
         response.status_code,
@@ -75,6 +105,7 @@ def _log_request_end(response):
             else "-"
         ),
         dur_ms,
+        metrics.format_request_stats(stats),
     )
     return response
 
@@ -119,117 +150,185 @@ def _log_exception(e):
     )
 
 
-def _parse_iso_date(s: Optional[str]) -> Optional[datetime]:
-    if not s:
-        return None
-    try:
-        if "T" in s:
-            if s.endswith("Z"):
-                fmts = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ"]
-                for f in fmts:
-                    try:
-                        return datetime.strptime(s, f)
-                    except Exception:
-                        pass
-                return None
-            s2 = s
-            if "+" in s:
-                s2 = s.split("+")[0]
-            elif "-" in s[10:]:
-                s2 = s[:19]
-            fmts = ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f"]
-            for f in fmts:
-                try:
-                    return datetime.strptime(s2, f)
-                except Exception:
-                    pass
-            return None
-        else:
-            return datetime.strptime(s, "%Y-%m-%d")
-    except Exception:
-        return None
-
-
-def _build_view_for_request(args) -> Dict[str, Any]:
-    projects_param = args.get("projects") or args.get("project")
-    if projects_param:
-        project_keys = [p.strip() for p in projects_param.split(",") if p.strip()]
-    else:
-        import os
-
-        project_keys = [
-            p.strip() for p in os.getenv("JIRA_PROJECTS", "SR").split(",") if p.strip()
-        ]
-    if not project_keys:
-        return {"groups": [], "items": []}
-
-    group_by = args.get("group_by", "project")
-    user_owner = args.get("user_owner")
-    from_date = args.get("from_date")
-    to_date = args.get("to_date")
-
-    pj = ",".join(project_keys)
-    jql = f"project in ({pj})"
-    result = search_issues_with_overlays(jql, user_owner=user_owner, max_results=1000)
-    view = build_timeline_view(result, group_by=group_by)
-
-    fd = _parse_iso_date(from_date) if from_date else None
-    td = _parse_iso_date(to_date) if to_date else None
-    if fd or td:
-        filtered: List[Dict[str, Any]] = []
-        for it in view["items"]:
-            s = _parse_iso_date(it.get("start"))
-            e = _parse_iso_date(it.get("end")) or s
-            if not s and not e:
-                continue
-            ok = True
-            if fd and e and e.date() < fd.date():
-                ok = False
-            if td and s and s.date() > td.date():
-                ok = False
-            if ok:
-                filtered.append(it)
-        view["items"] = filtered
-
-    return view
+def _profile_requested() -> bool:
+    return (
+        request.headers.get("X-Debug-Profile") == "1"
+        or request.args.get("profile") == "1"
+    )
+
+
+def _unavailable(e: ViewUnavailable):
+    # JIRA 갱신이 실패했고 대신 보여 줄 view도 없음 -> 잠시 뒤 다시 시도하도록
+    resp = jsonify({"error": str(e), "retry_after": TIMELINE_RETRY_AFTER})
+    resp.status_code = 503
+    resp.headers["Retry-After"] = str(TIMELINE_RETRY_AFTER)
+    return resp
 
 
 @app.get("/api/timeline")
 def api_timeline():
     try:
-        view = _build_view_for_request(request.args)
-        return jsonify(view)
+        level = collapse_level(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        with profiler.maybe_profile("timeline", forced=_profile_requested()) as prof:
+            # cProfile은 요청 스레드만 측정 -> 프로파일 중에는 백그라운드로 넘기지 않고 직접 빌드
+            view = build_view(
+                request.args,
+                deadline=None if prof.active else request_deadline(g._t0),
+            )
+            hashes = view.pop("item_hashes", {})
+            if level is not None:
+                with metrics.stage("rollup"):
+                    view = collapse_view(view, level)
+            since = request.args.get("since")
+            with metrics.stage("delta"):
+                payload = make_timeline_response(
+                    view,
+                    hashes,
+                    since=since,
+                    store=shared_cache(),
+                )
+            with metrics.stage("serialize"):
+                resp = jsonify(payload)
+        if prof.saved_name:
+            resp.headers["X-Profile-Id"] = prof.saved_name
+        if not since:
+            # 전체 응답은 버전을 ETag로 -> If-None-Match가 같으면 304
+            resp.set_etag(payload["version"])
+            resp = resp.make_conditional(request)
+        return resp
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.get("/api/timeline/status")
+def api_timeline_status():
+    since = request.args.get("since")
+    try:
+        view = status_view(request.args, deadline=request_deadline(g._t0))
+        with metrics.stage("delta"):
+            payload = make_timeline_response(
+                view,
+                item_hashes(view["items"]),
+                since=since,
+                store=shared_cache(),
+            )
+        with metrics.stage("serialize"):
+            resp = jsonify(payload)
+        if not since:
+            resp.set_etag(payload["version"])
+            resp = resp.make_conditional(request)
+        return resp
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.get("/api/timeline/groups/<group_id>")
+def api_timeline_group(group_id: str):
+    # 접힌 그룹 펼치기: 자식 그룹(요약 포함) + 직속 아이템
+    try:
+        view = build_view(request.args, deadline=request_deadline(g._t0))
+        view.pop("item_hashes", None)
+        with metrics.stage("rollup"):
+            payload = expand_group(view, group_id)
+        if payload is None:
+            return jsonify({"error": f"unknown group: {group_id}"}), 404
+        return jsonify(payload)
+    except ViewUnavailable as e:
+        return _unavailable(e)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.get("/api/analytics/workload")
+def api_workload():
+    # 일자별 활성 이슈 수 히트맵: dimension = project | type | assignee | status
+    try:
+        params = workload_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        return jsonify(workload_view(params))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.get("/api/overlays/<issue_key>")
+def api_get_overlay(issue_key: str):
+    try:
+        return jsonify(get_overlay(issue_key, request.args))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@app.put("/api/overlays/<issue_key>")
+def api_put_overlay(issue_key: str):
+    try:
+        return jsonify(put_overlay(issue_key, request.get_json(silent=True) or {}))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@app.delete("/api/overlays/<issue_key>")
+def api_delete_overlay(issue_key: str):
+    try:
+        return jsonify(delete_overlay(issue_key, request.args))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@app.get("/api/profiles")
+def api_profiles():
+    if not profiler.PROFILE_ENABLED:
+        abort(404)
+    return jsonify({"profiles": profiler.ProfileRing().list()})
+
+
+@app.get("/api/profiles/<name>")
+def api_profile_download(name: str):
+    if not profiler.PROFILE_ENABLED:
+        abort(404)
+    path = profiler.ProfileRing().path_for(name)
+    if not path:
+        abort(404)
+    return send_file(
+        os.path.abspath(path),
+        mimetype="application/octet-stream",
+        as_attachment=True,
+        download_name=name,
+    )
+
+
 @app.get("/api/projects")
 def api_projects():
     try:
-        # 임시 샘플 프로젝트 데이터
-        sample_projects = [
-            {
-                "key": "SR",
-                "name": "Sample Project",
-                "projectTypeKey": "software",
-                "simplified": False,
-            },
-            {
-                "key": "AB",
-                "name": "Another Project",
-                "projectTypeKey": "software",
-                "simplified": False,
-            },
-            {
-                "key": "TEST",
-                "name": "Test Project",
-                "projectTypeKey": "software",
-                "simplified": False,
-            },
-        ]
-        return jsonify({"projects": sample_projects})
+        # 로컬 참조 데이터 캐시에서 응답 (오래되면 백그라운드 갱신), 비어 있으면 샘플
+        projects = get_cached_projects()
+        return jsonify({"projects": projects or SAMPLE_PROJECTS})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.get("/api/projects/<project_key>/members")
+def api_project_members(project_key: str):
+    try:
+        members = get_cached_project_members(project_key)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    if members is None:
+        return jsonify({"error": f"unknown project: {project_key}"}), 404
+    return jsonify({"members": members})
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
 
 
 @app.get("/")
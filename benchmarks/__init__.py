@@ -0,0 +1 @@
+# Benchmarks for the JIRA timeline pipeline
@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# CLI / 서버리스 콜드 스타트용 import 시간 측정. 매 측정마다 새 인터프리터를 띄운다
+#
+#   python -m benchmarks.bench_imports --repeat 7 --out bench_imports.json
+
+# (이름, 실행할 문장)
+TARGETS: List[Tuple[str, str]] = [
+    ("jira", "import jira"),
+    ("jira.create_issue", "import jira; jira.create_issue"),
+    ("jira.OverlayStore", "import jira; jira.OverlayStore"),
+    ("jira.export_timeline_html", "import jira; jira.export_timeline_html"),
+    ("app.services.jira_client", "import app.services.jira_client"),
+    ("app.views.batch_export", "import app.views.batch_export"),
+    ("app.web", "import app.web"),
+]
+
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+{stmt}
+dt = time.perf_counter() - t0
+print(dt * 1000.0)
+print(len(sys.modules))
+"""
+
+
+def _run(stmt: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _PROBE.format(stmt=stmt)]
+    return subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+
+def _top_modules(stderr: str, top: int) -> List[Dict[str, Any]]:
+    # -X importtime 출력: "import time: self [us] | cumulative | module"
+    rows: List[Dict[str, Any]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line[len("import time:") :].split("|", 2)
+            rows.append(
+                {
+                    "module": name.strip(),
+                    "self_ms": round(int(self_us) / 1000.0, 2),
+                    "cumulative_ms": round(int(cum_us) / 1000.0, 2),
+                }
+            )
+        except ValueError:
+            continue
+    rows.sort(key=lambda r: r["self_ms"], reverse=True)
+    return rows[:top]
+
+
+def run_target(name: str, stmt: str, repeat: int, top: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    modules = 0
+    try:
+        for _ in range(repeat):
+            out = _run(stmt).stdout.split()
+            samples.append(float(out[0]))
+            modules = int(out[1])
+        top_modules = _top_modules(_run(stmt, importtime=True).stderr, top)
+    except subprocess.CalledProcessError as e:
+        return {"name": name, "stmt": stmt, "error": (e.stderr or "").strip()[-500:]}
+    return {
+        "name": name,
+        "stmt": stmt,
+        "min_ms": round(min(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "modules": modules,
+        "repeat": repeat,
+        "top_self": top_modules,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time benchmarks")
+    parser.add_argument(
+        "--targets", default="", help="이름 목록 (쉼표 구분, 기본 전체)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="self time 상위 모듈 수")
+    parser.add_argument("--out", default="-", help="JSON output path ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    wanted = {t.strip() for t in args.targets.split(",") if t.strip()}
+    targets = [(n, s) for n, s in TARGETS if not wanted or n in wanted]
+    # 저장소 루트에서 import 되도록
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        results = []
+        for name, stmt in targets:
+            results.append(run_target(name, stmt, args.repeat, args.top))
+            print(f"done {name}", file=sys.stderr)
+    finally:
+        os.chdir(cwd)
+
+    report = {
+        "benchmark": "imports",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "targets": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(text)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services import overlay_store
+from benchmarks.synthetic import make_overlay_db, make_search_result
+
+# 오버레이 키 목록 조회 전략 비교 (IN (?, ...) vs json_each(?))
+#
+#   python -m benchmarks.bench_overlays --sizes 100,1000,10000,50000 --out bench_overlays.json
+#
+# in_list는 키 수가 SQLite 호스트 파라미터 한도(기본 32766)를 넘으면 실패 -> 결과에 error로 남김
+
+STRATEGIES: Dict[str, int] = {
+    # OVERLAY_IN_LIST_MAX 값으로 경로를 강제
+    "in_list": sys.maxsize,
+    "json_each": -1,
+}
+
+
+def _timeit(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}", "repeat": repeat}
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "repeat": repeat,
+        "rows": len(result),
+    }
+
+
+def run_case(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    result = make_search_result(size)
+    db_path = os.path.join(workdir, f"overlays_{size}.db")
+    # 키 대부분에 오버레이가 있는 최악의 경우
+    store = make_overlay_db(db_path, result, ratio=0.9)
+    keys = [i["key"] for i in result["issues"]]
+
+    timings: Dict[str, Any] = {}
+    default = overlay_store.OVERLAY_IN_LIST_MAX
+    try:
+        for name, limit in STRATEGIES.items():
+            overlay_store.OVERLAY_IN_LIST_MAX = limit
+            timings[name] = _timeit(
+                lambda: store.get_overlays_merged(
+                    issue_keys=keys, user_owner="bench-user"
+                ),
+                repeat,
+            )
+        overlay_store.OVERLAY_IN_LIST_MAX = default
+        timings["auto"] = _timeit(
+            lambda: store.get_overlays_merged(issue_keys=keys, user_owner="bench-user"),
+            repeat,
+        )
+    finally:
+        overlay_store.OVERLAY_IN_LIST_MAX = default
+    return {"keys": size, "timings": timings}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Overlay key-set lookup benchmarks")
+    parser.add_argument("--sizes", default="100,1000,10000,50000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", default="-", help="JSON output path ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    cases: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            cases.append(run_case(size, args.repeat, workdir))
+            print(f"done keys={size}", file=sys.stderr)
+
+    report = {
+        "benchmark": "overlays",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "in_list_max": overlay_store.OVERLAY_IN_LIST_MAX,
+        "cases": cases,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(text)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# 저장소 루트에서 실행 (benchmarks / app 패키지를 import하므로 루트가 sys.path에 있어야 함)
+#   cd <repo> && python -m benchmarks.bench_timeline --sizes 1000,10000 --out bench.json
+# 다른 위치에서 실행할 때는 PYTHONPATH=<repo>
+
+# web.py는 import 시점에 캐시 설정을 읽으므로 먼저 비활성화
+os.environ.setdefault("CACHE_ENABLED", "0")
+os.environ.setdefault("JIRA_EMAIL", "bench@example.com")
+os.environ.setdefault("JIRA_API_TOKEN", "bench")
+
+from app.controllers import timeline_controller  # noqa: E402
+from app.controllers.dependency_graph import annotate_dependencies  # noqa: E402
+from app.controllers.timeline_controller import (  # noqa: E402
+    _parse_iso_date,
+    build_timeline_view,
+    filter_items_by_date,
+    search_timeline_records,
+)
+from app.controllers.workload import compute_workload  # noqa: E402
+from benchmarks.synthetic import make_overlay_db, make_search_result  # noqa: E402
+
+
+def _timeit(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            # 크기 한계 등으로 실패한 경우도 결과에 남김
+            return {"error": f"{type(e).__name__}: {e}", "repeat": repeat}
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def _get_ok(client: Any, url: str) -> Any:
+    # 500도 빠르게 끝나므로 상태를 확인하지 않으면 실패가 좋은 숫자로 기록됨
+    resp = client.get(url)
+    if resp.status_code != 200:
+        raise RuntimeError(f"GET {url} -> HTTP {resp.status_code}")
+    return resp
+
+
+def _export_ok(export: Callable[[], bool]) -> None:
+    # export_* 는 실패해도 예외 대신 False를 돌려줌
+    if not export():
+        raise RuntimeError("export returned False")
+
+
+def _errors(cases: List[Dict[str, Any]]) -> List[str]:
+    return [
+        f"size={case['size']} mix={case['mix']} {name}: {timing['error']}"
+        for case in cases
+        for name, timing in case["timings"].items()
+        if "error" in timing
+    ]
+
+
+def _stub_jira(result: Dict[str, Any]) -> None:
+    def _search(jql, fields=None, start_at=0, max_results=50, **kwargs):
+        return result
+
+    def _iter_search(jql, fields=None, *, start_at=0, max_results=None, **kwargs):
+        issues = result["issues"][start_at:]
+        if max_results is not None:
+            issues = issues[:max_results]
+        return iter(issues)
+
+    timeline_controller.search_issues = _search
+    timeline_controller.iter_search_issues = _iter_search
+
+
+def run_case(size: int, mix: str, repeat: int, workdir: str) -> Dict[str, Any]:
+    from app.views.exporters import export_timeline_json
+    from app.web import app
+
+    result = make_search_result(size, mix=mix)
+    db_path = os.path.join(workdir, "overlays.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    store = make_overlay_db(db_path, result)
+    keys = [i["key"] for i in result["issues"]]
+    _stub_jira(result)
+
+    # 기본 max_results(50)로는 --sizes와 무관하게 50건만 측정됨 -> 전체 데이터셋을 조회
+    merged = search_timeline_records("bench", user_owner="bench-user", max_results=None)
+    view = build_timeline_view(merged)
+    created = [i["fields"]["created"] for i in result["issues"]]
+    outfile = os.path.join(workdir, "timeline.json")
+    client = app.test_client()
+
+    timings = {
+        "build_timeline_view": _timeit(lambda: build_timeline_view(merged), repeat),
+        "get_overlays_merged": _timeit(
+            lambda: store.get_overlays_merged(issue_keys=keys, user_owner="bench-user"),
+            repeat,
+        ),
+        "hidden_issue_keys": _timeit(
+            lambda: store.hidden_issue_keys(issue_keys=keys, user_owner="bench-user"),
+            repeat,
+        ),
+        "parse_iso_date": _timeit(
+            lambda: [_parse_iso_date(c) for c in created], repeat
+        ),
+        "date_filter": _timeit(
+            lambda: filter_items_by_date(view["items"], "2024-03-01", "2024-09-30"),
+            repeat,
+        ),
+        "dependencies": _timeit(
+            lambda: annotate_dependencies(merged["issues"], view["items"]), repeat
+        ),
+        "workload_assignee": _timeit(
+            lambda: compute_workload(
+                merged["issues"],
+                dimension="assignee",
+                from_date="2024-01-01",
+                to_date="2024-12-31",
+            ),
+            repeat,
+        ),
+        "export_timeline_json": _timeit(
+            lambda: _export_ok(
+                lambda: export_timeline_json(["SR", "AB", "CD"], outfile=outfile)
+            ),
+            repeat,
+        ),
+        "api_timeline": _timeit(
+            lambda: _get_ok(client, "/api/timeline?projects=SR,AB,CD"), repeat
+        ),
+    }
+    return {
+        "size": size,
+        "mix": mix,
+        "items": len(view["items"]),
+        "groups": len(view["groups"]),
+        "timings": timings,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Timeline pipeline benchmarks")
+    parser.add_argument("--sizes", default="1000,10000", help="e.g. 1000,10000,100000")
+    parser.add_argument("--mixes", default="mixed,epic_heavy,flat")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default="-", help="JSON output path ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    mixes = [m.strip() for m in args.mixes.split(",") if m.strip()]
+    cases: List[Dict[str, Any]] = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # OverlayStore()의 기본 경로(overlays.db)가 fixture를 가리키도록
+        os.chdir(workdir)
+        try:
+            from app.web import app
+
+            # 요청 로그가 결과 출력에 섞이지 않도록
+            app.logger.setLevel(logging.WARNING)
+            for size in sizes:
+                for mix in mixes:
+                    cases.append(run_case(size, mix, args.repeat, workdir))
+                    print(f"done size={size} mix={mix}", file=sys.stderr)
+        finally:
+            os.chdir(cwd)
+
+    report = {
+        "benchmark": "timeline",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": cases,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(text)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    # 결과는 남기되 하나라도 실패한 측정이 있으면 실행 실패
+    errors = _errors(cases)
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
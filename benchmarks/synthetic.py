@@ -0,0 +1,163 @@
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.services.overlay_store import OverlayStore
+
+# search_issues() 응답 형태의 합성 데이터 생성기
+
+ISSUE_TYPES_KR = ["스토리", "버그", "서버", "클라", "디자인", "기획", "QA"]
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+PRIORITIES = ["Highest", "High", "Medium", "Low"]
+COLORS = ["#ef4444", "#3b82f6", "#10b981", "#8b5cf6", "#f59e0b"]
+
+# 이슈 타입 구성 비율 프리셋
+MIXES: Dict[str, Dict[str, float]] = {
+    # 에픽 몇 개 + 대부분 에픽 하위 이슈
+    "epic_heavy": {"epic": 0.05, "task": 0.25, "in_epic": 0.9},
+    # 에픽 없이 타입 그룹 + 하위업무 위주
+    "flat": {"epic": 0.0, "task": 0.4, "in_epic": 0.0},
+    # 혼합
+    "mixed": {"epic": 0.02, "task": 0.3, "in_epic": 0.5},
+}
+
+
+def _iso(dt: datetime, rnd: random.Random) -> str:
+    # JIRA가 돌려주는 created 형식 (+0900, Z, 밀리초 유무 혼합)
+    r = rnd.random()
+    if r < 0.7:
+        return dt.strftime("%Y-%m-%dT%H:%M:%S.000+0900")
+    if r < 0.9:
+        return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_search_result(
+    n: int,
+    *,
+    projects: Optional[List[str]] = None,
+    mix: str = "mixed",
+    seed: int = 42,
+    link_ratio: float = 0.3,
+) -> Dict[str, Any]:
+    rnd = random.Random(seed)
+    # 링크는 별도 난수열로 -> 기존 필드 값은 시드별로 그대로 유지
+    link_rnd = random.Random(seed + 1)
+    projects = projects or ["SR", "AB", "CD"]
+    ratios = MIXES[mix]
+    base = datetime(2024, 1, 1, 9, 0, 0)
+
+    n_epics = int(n * ratios["epic"])
+    epics: Dict[str, List[Dict[str, str]]] = {p: [] for p in projects}
+    issues: List[Dict[str, Any]] = []
+    counters = {p: 0 for p in projects}
+
+    def _next_key(p: str) -> str:
+        counters[p] += 1
+        return f"{p}-{counters[p]}"
+
+    for i in range(n):
+        p = projects[i % len(projects)]
+        key = _next_key(p)
+        created = base + timedelta(
+            days=rnd.randint(0, 365), minutes=rnd.randint(0, 600)
+        )
+        fields: Dict[str, Any] = {
+            "project": {"key": p, "name": f"Project {p}"},
+            "summary": f"합성 이슈 {key}",
+            "created": _iso(created, rnd),
+            "updated": _iso(created + timedelta(days=rnd.randint(0, 30)), rnd),
+            "status": {"name": rnd.choice(STATUSES)},
+            "priority": {"name": rnd.choice(PRIORITIES)},
+            "assignee": {
+                "accountId": f"user-{rnd.randint(1, 40)}",
+                "displayName": f"사용자{rnd.randint(1, 40)}",
+            },
+        }
+        if rnd.random() < 0.6:
+            due = created + timedelta(days=rnd.randint(1, 60))
+            fields["duedate"] = due.date().isoformat()
+        if counters[p] > 1 and link_rnd.random() < link_ratio:
+            # 같은 프로젝트의 앞선 이슈에 막힘 (링크 그래프는 항상 DAG)
+            blocker = (
+                f"{p}-{link_rnd.randint(max(1, counters[p] - 50), counters[p] - 1)}"
+            )
+            fields["issuelinks"] = [
+                {
+                    "type": {
+                        "name": "Blocks",
+                        "inward": "is blocked by",
+                        "outward": "blocks",
+                    },
+                    "inwardIssue": {"key": blocker},
+                }
+            ]
+
+        if i < n_epics:
+            fields["issuetype"] = {"name": "에픽"}
+            epics[p].append({"key": key, "summary": fields["summary"]})
+        else:
+            if rnd.random() < ratios["task"]:
+                fields["issuetype"] = {"name": "하위업무"}
+            else:
+                fields["issuetype"] = {"name": rnd.choice(ISSUE_TYPES_KR)}
+            if epics[p] and rnd.random() < ratios["in_epic"]:
+                fields["customfield_10014"] = dict(rnd.choice(epics[p]))
+
+        issues.append(
+            {
+                "id": str(100000 + i),
+                "key": key,
+                "self": f"https://example.atlassian.net/rest/api/3/issue/{100000 + i}",
+                "fields": fields,
+            }
+        )
+
+    return {"startAt": 0, "maxResults": n, "total": n, "issues": issues}
+
+
+def make_overlay_db(
+    db_path: str,
+    search_result: Dict[str, Any],
+    *,
+    ratio: float = 0.2,
+    user_owner: Optional[str] = "bench-user",
+    seed: int = 7,
+) -> OverlayStore:
+    rnd = random.Random(seed)
+    store = OverlayStore(db_path)
+    rows = []
+    now = OverlayStore._now_iso()
+    for issue in search_result.get("issues", []):
+        if rnd.random() >= ratio:
+            continue
+        payload: Dict[str, Any] = {}
+        r = rnd.random()
+        if r < 0.5:
+            payload["startDate"] = (
+                f"2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}"
+            )
+        elif r < 0.8:
+            payload["color"] = rnd.choice(COLORS)
+        else:
+            payload["hidden"] = rnd.random() < 0.5
+        scope = "user" if user_owner and rnd.random() < 0.3 else "team"
+        owner = user_owner if scope == "user" else ""
+        project_key = issue["fields"]["project"]["key"]
+        rows.append((scope, owner, project_key, issue["key"], payload, now))
+
+    # upsert_overlay()를 행마다 호출하면 fixture 생성이 너무 느려서 일괄 삽입
+    with store._conn() as con:
+        con.executemany(
+            """
+            INSERT OR REPLACE INTO overlays
+                (scope, owner, project_key, issue_key, payload, updated_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (s, o, pk, k, json.dumps(p, ensure_ascii=False), t, t)
+                for s, o, pk, k, p, t in rows
+            ],
+        )
+    return store
@@ -2,57 +2,124 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import importlib
 import os
-from app.services.jira_client import (
-    create_issue,
-    search_issues,
-    add_comment,
-    get_transitions,
-    do_transition,
-    upload_attachment,
-    get_projects,
-    get_users,
-    get_project_members,
-)
-from app.services.overlay_store import (
-    OverlayStore,
-    set_overlay,
-    set_overlay_dates,
-    set_overlay_color,
-    set_overlay_hidden,
-)
-from app.controllers.timeline_controller import (
-    search_issues_with_overlays,
-    build_timeline_view,
-)
-from app.views.exporters import export_timeline_json, export_timeline_html
-
-__all__ = [
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# 공개 이름 -> 정의 모듈. 실제 import는 처음 접근할 때 일어난다
+# (create_issue만 쓰는 스크립트가 컨트롤러/exporter/SQLite까지 올리지 않도록)
+_LAZY: Dict[str, str] = {
     # services
-    "create_issue",
-    "search_issues",
-    "add_comment",
-    "get_transitions",
-    "do_transition",
-    "upload_attachment",
-    "get_projects",
-    "get_users",
-    "get_project_members",
+    "create_issue": "app.services.jira_client",
+    "search_issues": "app.services.jira_client",
+    "iter_search_issues": "app.services.jira_client",
+    "iter_issue_changelog": "app.services.jira_client",
+    "add_comment": "app.services.jira_client",
+    "get_transitions": "app.services.jira_client",
+    "do_transition": "app.services.jira_client",
+    "upload_attachment": "app.services.jira_client",
+    "get_projects": "app.services.jira_client",
+    "get_users": "app.services.jira_client",
+    "get_project_members": "app.services.jira_client",
+    # bulk
+    "bulk_create_issues": "app.services.jira_bulk",
+    "bulk_add_comments": "app.services.jira_bulk",
+    "bulk_transition": "app.services.jira_bulk",
+    "bulk_upload_attachments": "app.services.jira_bulk",
+    "TransitionResolver": "app.services.transition_resolver",
+    "transition_by_name": "app.services.transition_resolver",
+    "bulk_transition_by_name": "app.services.transition_resolver",
     # overlay
-    "OverlayStore",
-    "set_overlay",
-    "set_overlay_dates",
-    "set_overlay_color",
-    "set_overlay_hidden",
+    "OverlayStore": "app.services.overlay_store",
+    "set_overlay": "app.services.overlay_store",
+    "set_overlay_dates": "app.services.overlay_store",
+    "set_overlay_color": "app.services.overlay_store",
+    "set_overlay_hidden": "app.services.overlay_store",
+    # reference data
+    "ReferenceStore": "app.services.reference_store",
+    "get_cached_projects": "app.services.reference_store",
+    "get_cached_users": "app.services.reference_store",
+    "get_cached_project_members": "app.services.reference_store",
+    # changelog (상태 전환 이력)
+    "ChangelogStore": "app.services.changelog_store",
+    "sync_project": "app.services.changelog_store",
     # controller
-    "search_issues_with_overlays",
-    "build_timeline_view",
+    "search_issues_with_overlays": "app.controllers.timeline_controller",
+    "search_timeline_records": "app.controllers.timeline_controller",
+    "stream_timeline_records": "app.controllers.timeline_controller",
+    "build_timeline_view": "app.controllers.timeline_controller",
     # views
-    "export_timeline_json",
-    "export_timeline_html",
-]
+    "export_timeline_json": "app.views.exporters",
+    "export_timeline_html": "app.views.exporters",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from app.controllers.timeline_controller import (
+        build_timeline_view,
+        search_issues_with_overlays,
+        search_timeline_records,
+        stream_timeline_records,
+    )
+    from app.services.jira_bulk import (
+        bulk_add_comments,
+        bulk_create_issues,
+        bulk_transition,
+        bulk_upload_attachments,
+    )
+    from app.services.jira_client import (
+        add_comment,
+        create_issue,
+        do_transition,
+        get_project_members,
+        get_projects,
+        get_transitions,
+        get_users,
+        iter_issue_changelog,
+        iter_search_issues,
+        search_issues,
+        upload_attachment,
+    )
+    from app.services.changelog_store import ChangelogStore, sync_project
+    from app.services.overlay_store import (
+        OverlayStore,
+        set_overlay,
+        set_overlay_color,
+        set_overlay_dates,
+        set_overlay_hidden,
+    )
+    from app.services.reference_store import (
+        ReferenceStore,
+        get_cached_project_members,
+        get_cached_projects,
+        get_cached_users,
+    )
+    from app.services.transition_resolver import (
+        TransitionResolver,
+        bulk_transition_by_name,
+        transition_by_name,
+    )
+    from app.views.exporters import export_timeline_html, export_timeline_json
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # 다음 접근부터는 일반 전역 조회
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 if __name__ == "__main__" and os.getenv("RUN_TIMELINE_DEMO") == "1":
+    from app.views.exporters import export_timeline_html
+
     projects = os.getenv("JIRA_PROJECTS", "SR").split(",")
     ok = export_timeline_html(
         projects, outfile="timeline.html", group_by=os.getenv("GROUP_BY", "project")
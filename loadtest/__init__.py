@@ -0,0 +1 @@
+# Load-test tooling (fake JIRA server + load generator)
@@ -0,0 +1,306 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import make_search_result
+
+# 로컬 부하 테스트용 가짜 JIRA REST 서버
+#
+#   python -m loadtest.fake_jira --port 8089 --issues 5000 --latency-ms 300 --rate-429 0.02
+#   JIRA_BASE=http://127.0.0.1:8089 JIRA_EMAIL=x JIRA_API_TOKEN=y python -m app.serve
+
+_PROJECT_JQL_RE = re.compile(
+    r"project\s*(?:in\s*\(([^)]*)\)|=\s*\"?([A-Za-z0-9_]+)\"?)"
+)
+_TRANSITIONS_RE = re.compile(r"^/rest/api/3/issue/([^/]+)/transitions$")
+_COMMENT_RE = re.compile(r"^/rest/api/3/issue/([^/]+)/comment$")
+_ATTACHMENTS_RE = re.compile(r"^/rest/api/3/issue/([^/]+)/attachments$")
+
+TRANSITIONS = [
+    {"id": "11", "name": "To Do", "to": {"name": "To Do"}},
+    {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+    {"id": "31", "name": "Done", "to": {"name": "Done"}},
+]
+
+
+class FakeJiraConfig:
+    def __init__(
+        self,
+        *,
+        issues: int = 2000,
+        projects: Optional[List[str]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        max_page: int = 100,
+        rate_429: float = 0.0,
+        retry_after: int = 1,
+        users: int = 50,
+        seed: int = 42,
+    ) -> None:
+        self.projects = projects or ["SR", "AB", "CD"]
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.max_page = max_page
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.users = users
+        self.rnd = random.Random(seed)
+        self.lock = threading.Lock()
+        data = make_search_result(issues, projects=self.projects, seed=seed)
+        self.issues_by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for issue in data["issues"]:
+            pk = issue["fields"]["project"]["key"]
+            self.issues_by_project.setdefault(pk, []).append(issue)
+        self.stats = {"requests": 0, "throttled": 0}
+        self.created = 0
+
+    def random(self) -> float:
+        with self.lock:
+            return self.rnd.random()
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.stats[name] += 1
+
+
+def _projects_from_jql(jql: str, known: List[str]) -> List[str]:
+    m = _PROJECT_JQL_RE.search(jql or "")
+    if not m:
+        return list(known)
+    raw = m.group(1) if m.group(1) is not None else m.group(2)
+    return [p.strip().strip('"') for p in raw.split(",") if p.strip()]
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    config: FakeJiraConfig
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    # --- helpers -------------------------------------------------------
+    def _path_and_query(self) -> Tuple[str, Dict[str, str]]:
+        parsed = urlparse(self.path)
+        path = re.sub(r"/{2,}", "/", parsed.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        return path.rstrip("/") or "/", query
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode("utf-8"))
+        except Exception:
+            return {}
+
+    def _send(
+        self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        data = (
+            b""
+            if body is None
+            else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        )
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _simulate(self) -> bool:
+        cfg = self.config
+        cfg.count("requests")
+        delay = cfg.latency_ms
+        if cfg.jitter_ms:
+            delay += (cfg.random() * 2 - 1) * cfg.jitter_ms
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if cfg.rate_429 and cfg.random() < cfg.rate_429:
+            cfg.count("throttled")
+            self._send(
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                {"Retry-After": str(cfg.retry_after)},
+            )
+            return False
+        return True
+
+    # --- endpoints -----------------------------------------------------
+    def _search(self, params: Dict[str, Any]) -> None:
+        cfg = self.config
+        jql = params.get("jql", "")
+        start_at = int(params.get("startAt", 0) or 0)
+        max_results = min(int(params.get("maxResults", 50) or 50), cfg.max_page)
+        matched: List[Dict[str, Any]] = []
+        for pk in _projects_from_jql(jql, cfg.projects):
+            matched.extend(cfg.issues_by_project.get(pk, []))
+        page = matched[start_at : start_at + max_results]
+        self._send(
+            200,
+            {
+                "expand": "schema,names",
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(matched),
+                "issues": page,
+            },
+        )
+
+    def _users(self, query: Dict[str, str], project: Optional[str] = None) -> None:
+        cfg = self.config
+        start_at = int(query.get("startAt", 0) or 0)
+        max_results = min(int(query.get("maxResults", 50) or 50), 1000)
+        users = [
+            {
+                "accountId": f"user-{i}",
+                "displayName": f"사용자{i}",
+                "accountType": "atlassian",
+            }
+            for i in range(1, cfg.users + 1)
+        ]
+        if project:
+            users = users[: max(1, cfg.users // 2)]
+        self._send(200, users[start_at : start_at + max_results])
+
+    def _bulk_create(self, body: Dict[str, Any]) -> None:
+        # summary가 비어 있는 항목은 실패로 돌려주고 나머지는 생성
+        cfg = self.config
+        issues: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for n, update in enumerate(body.get("issueUpdates") or []):
+            fields = update.get("fields") or {}
+            if not fields.get("summary"):
+                errors.append(
+                    {
+                        "status": 400,
+                        "failedElementNumber": n,
+                        "elementErrors": {
+                            "errorMessages": [],
+                            "errors": {"summary": "You must specify a summary."},
+                        },
+                    }
+                )
+                continue
+            with cfg.lock:
+                cfg.created += 1
+                seq = cfg.created
+            pk = (fields.get("project") or {}).get("key", "NEW")
+            issues.append({"id": str(100000 + seq), "key": f"{pk}-N{seq}"})
+        self._send(
+            400 if errors and not issues else 201, {"issues": issues, "errors": errors}
+        )
+
+    def _attachments(self, issue_key: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 1 << 16))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+        self._send(200, [{"id": "1", "issueKey": issue_key, "size": length}])
+
+    def do_GET(self) -> None:  # noqa: N802
+        path, query = self._path_and_query()
+        if not self._simulate():
+            return
+        if path == "/rest/api/3/search":
+            self._search(query)
+        elif path == "/rest/api/3/project":
+            self._send(
+                200,
+                [
+                    {"key": p, "name": f"Project {p}", "projectTypeKey": "software"}
+                    for p in self.config.projects
+                ],
+            )
+        elif path == "/rest/api/3/user/assignable/search":
+            self._users(query, project=query.get("project"))
+        elif path == "/rest/api/3/users/search":
+            self._users(query)
+        elif _TRANSITIONS_RE.match(path):
+            self._send(200, {"transitions": TRANSITIONS})
+        else:
+            self._send(404, {"errorMessages": [f"Not found: {path}"]})
+
+    def do_POST(self) -> None:  # noqa: N802
+        path, _query = self._path_and_query()
+        m = _ATTACHMENTS_RE.match(path)
+        if m:
+            if self._simulate():
+                self._attachments(m.group(1))
+            else:
+                self.close_connection = True
+            return
+        body = self._read_json()
+        if not self._simulate():
+            return
+        if path == "/rest/api/3/search":
+            self._search(body)
+        elif path == "/rest/api/3/issue/bulk":
+            self._bulk_create(body)
+        elif _COMMENT_RE.match(path):
+            self._send(201, {"id": "10000", "body": body.get("body")})
+        elif _TRANSITIONS_RE.match(path):
+            tid = (body.get("transition") or {}).get("id")
+            if tid not in {t["id"] for t in TRANSITIONS}:
+                self._send(400, {"errorMessages": ["Transition id is not valid"]})
+            else:
+                self._send(204)
+        else:
+            self._send(404, {"errorMessages": [f"Not found: {path}"]})
+
+
+def make_server(host: str, port: int, config: FakeJiraConfig) -> ThreadingHTTPServer:
+    handler = type("BoundFakeJiraHandler", (FakeJiraHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fake JIRA REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--projects", default="SR,AB,CD")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--max-page", type=int, default=100, help="maxResults cap")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="0.0 ~ 1.0")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    config = FakeJiraConfig(
+        issues=args.issues,
+        projects=[p.strip() for p in args.projects.split(",") if p.strip()],
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_page=args.max_page,
+        rate_429=args.rate_429,
+        retry_after=args.retry_after,
+    )
+    server = make_server(args.host, args.port, config)
+    print(f"Fake JIRA listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
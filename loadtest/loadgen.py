@@ -0,0 +1,146 @@
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+# app/web.py 대상 open-loop 부하 생성기
+#
+#   python -m loadtest.loadgen --url "http://127.0.0.1:5001/api/timeline?projects=SR" \
+#       --rps 20 --duration 30 --out load.json
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+class LoadResult:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies_ms: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.dropped = 0
+
+    def record(self, latency_ms: float, status: str, ok: bool) -> None:
+        with self._lock:
+            self.latencies_ms.append(latency_ms)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            if not ok:
+                self.errors += 1
+
+    def summary(self, elapsed_s: float, target_rps: float) -> Dict[str, Any]:
+        lat = sorted(self.latencies_ms)
+        total = len(lat)
+
+        def _r(v: Optional[float]) -> Optional[float]:
+            return None if v is None else round(v, 2)
+
+        return {
+            "target_rps": target_rps,
+            "achieved_rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+            "requests": total,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "error_rate": round(self.errors / total, 4) if total else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_ms": {
+                "p50": _r(_percentile(lat, 50)),
+                "p95": _r(_percentile(lat, 95)),
+                "p99": _r(_percentile(lat, 99)),
+                "max": _r(lat[-1] if lat else None),
+                "mean": _r(sum(lat) / total if total else None),
+            },
+        }
+
+
+def _fire(url: str, timeout: float, result: LoadResult) -> None:
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+        result.record((time.perf_counter() - t0) * 1000.0, str(status), status < 400)
+    except urllib.error.HTTPError as e:
+        result.record((time.perf_counter() - t0) * 1000.0, str(e.code), False)
+    except Exception as e:
+        result.record((time.perf_counter() - t0) * 1000.0, type(e).__name__, False)
+
+
+def run_load(
+    urls: List[str],
+    *,
+    rps: float,
+    duration_s: float,
+    concurrency: int = 64,
+    timeout: float = 30.0,
+) -> Dict[str, Any]:
+    result = LoadResult()
+    interval = 1.0 / rps
+    inflight = threading.Semaphore(concurrency)
+
+    def _task(u: str) -> None:
+        try:
+            _fire(u, timeout, result)
+        finally:
+            inflight.release()
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        n = 0
+        while True:
+            # open-loop: 응답 지연과 무관하게 일정 간격으로 요청 발사
+            scheduled = t_start + n * interval
+            now = time.perf_counter()
+            if scheduled - t_start >= duration_s:
+                break
+            if scheduled > now:
+                time.sleep(scheduled - now)
+            if inflight.acquire(blocking=False):
+                pool.submit(_task, urls[n % len(urls)])
+            else:
+                # 동시성 한도 초과 -> 클라이언트 측에서 드롭 (서버 포화 신호)
+                result.dropped += 1
+            n += 1
+    elapsed = time.perf_counter() - t_start
+    return result.summary(elapsed, rps)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop HTTP load generator")
+    parser.add_argument("--url", action="append", required=True, help="repeatable")
+    parser.add_argument("--rps", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", default="-", help="JSON output path ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        args.url,
+        rps=args.rps,
+        duration_s=args.duration,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+    )
+    report["urls"] = args.url
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(text)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 0 if report["requests"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+# ASGI 서빙 모드(app.asgi) 스모크 테스트
+#
+#   python -m loadtest.smoke_asgi
+#
+# 가짜 JIRA 서버를 띄우고 Quart 테스트 클라이언트로 주요 엔드포인트를 호출한 뒤
+# /api/timeline 응답을 WSGI(app.web)와 비교한다. quart / httpx가 없으면 건너뜀 (종료 코드 0)
+
+PROJECT = "SR"
+WORKLOAD_QUERY = {
+    "projects": PROJECT,
+    "dimension": "status",
+    "from_date": "2020-01-01",
+    "to_date": "2029-12-31",
+}
+
+
+def _check(failures: List[str], ok: bool, label: str) -> None:
+    print(f"{'ok  ' if ok else 'FAIL'} {label}")
+    if not ok:
+        failures.append(label)
+
+
+async def _run_asgi(failures: List[str]) -> Dict[str, Any]:
+    from app.asgi import app
+
+    async with app.test_app() as test_app:
+        client = test_app.test_client()
+        query = {"projects": PROJECT}
+
+        r = await client.get("/api/timeline", query_string=query)
+        view = await r.get_json()
+        _check(failures, r.status_code == 200 and bool(view["items"]), "timeline")
+
+        r = await client.get(
+            "/api/timeline", query_string={**query, "since": view["version"]}
+        )
+        delta = await r.get_json()
+        _check(
+            failures,
+            r.status_code == 200 and delta["delta"] and not delta["changed"],
+            "timeline since (no changes)",
+        )
+
+        r = await client.get("/api/timeline", query_string={**query, "collapse": "9"})
+        _check(failures, r.status_code == 400, "timeline collapse out of range -> 400")
+
+        r = await client.get("/api/timeline/status", query_string=query)
+        _check(failures, r.status_code == 200, "timeline/status")
+
+        r = await client.get("/api/timeline/groups/__missing__", query_string=query)
+        _check(failures, r.status_code == 404, "timeline/groups unknown -> 404")
+
+        issue_key = view["items"][0]["id"]
+        r = await client.put(
+            f"/api/overlays/{issue_key}", json={"overlay": {"note": "smoke"}}
+        )
+        _check(failures, r.status_code == 200, "overlay put")
+        r = await client.get(f"/api/overlays/{issue_key}")
+        body = await r.get_json()
+        _check(
+            failures, (body.get("overlay") or {}).get("note") == "smoke", "overlay get"
+        )
+        r = await client.delete(f"/api/overlays/{issue_key}")
+        _check(failures, r.status_code == 200, "overlay delete")
+
+        r = await client.get("/api/projects")
+        _check(failures, r.status_code == 200, "projects")
+
+        r = await client.get("/api/analytics/workload", query_string=WORKLOAD_QUERY)
+        workload = await r.get_json()
+        _check(failures, r.status_code == 200 and workload["issues"] > 0, "workload")
+        r = await client.get(
+            "/api/analytics/workload", query_string={**query, "dimension": "x"}
+        )
+        _check(failures, r.status_code == 400, "workload bad dimension -> 400")
+
+        r = await client.get("/metrics")
+        text = (await r.get_data()).decode("utf-8")
+        _check(failures, "http_request_duration_seconds" in text, "metrics")
+        return {"view": view, "workload": workload}
+
+
+def _run_wsgi(failures: List[str]) -> Dict[str, Any]:
+    from app.web import app
+
+    client = app.test_client()
+    r = client.get("/api/analytics/workload", query_string=WORKLOAD_QUERY)
+    _check(failures, r.status_code == 200, "wsgi workload")
+    return {
+        "view": client.get(f"/api/timeline?projects={PROJECT}").get_json(),
+        "workload": r.get_json(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    try:
+        import httpx  # noqa: F401
+        import quart  # noqa: F401
+    except ImportError as e:
+        print(f"skipped: {e.name} is not installed")
+        return 0
+
+    from loadtest.fake_jira import FakeJiraConfig, make_server
+
+    server = make_server("127.0.0.1", 0, FakeJiraConfig(issues=300))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    # app 모듈은 import 시점에 환경변수를 읽으므로 먼저 설정
+    os.environ["JIRA_BASE"] = f"http://{host}:{port}"
+    os.environ.setdefault("JIRA_EMAIL", "smoke@example.com")
+    os.environ.setdefault("JIRA_API_TOKEN", "smoke")
+    # overlays.db / cache.db는 임시 디렉터리에
+    os.chdir(tempfile.mkdtemp(prefix="smoke_asgi_"))
+
+    failures: List[str] = []
+    try:
+        asgi = asyncio.run(_run_asgi(failures))
+        wsgi = _run_wsgi(failures)
+        _check(
+            failures,
+            {it["id"] for it in asgi["view"]["items"]}
+            == {it["id"] for it in wsgi["view"]["items"]},
+            "asgi / wsgi timeline items match",
+        )
+        _check(
+            failures,
+            asgi["workload"] == wsgi["workload"],
+            "asgi / wsgi workload match",
+        )
+    finally:
+        server.shutdown()
+    print("FAILED: " + ", ".join(failures) if failures else "all passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())